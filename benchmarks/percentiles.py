@@ -0,0 +1,12 @@
+"""Helpers shared by the benchmarks scripts."""
+import math
+
+
+def percentile(values, percent):
+    """Return the nearest-rank percentile of the specified values.
+
+    (``statistics.quantiles()`` is only available from Python 3.8)
+    """
+    ordered = sorted(values)
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
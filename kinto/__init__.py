@@ -31,6 +31,7 @@ DEFAULT_SETTINGS = {
         'kinto.authorization.AuthorizationPolicy'),
     'experimental_collection_schema_validation': False,
     'experimental_permissions_endpoint': False,
+    'deletion_batch_size': None,
     'http_api_version': HTTP_API_VERSION,
     'bucket_id_generator': 'kinto.views.NameGenerator',
     'collection_id_generator': 'kinto.views.NameGenerator',
@@ -5,6 +5,7 @@ import logging
 import logging.config
 
 from kinto.core import scripts
+from kinto import scripts as kinto_scripts
 from pyramid.scripts import pserve
 from pyramid.paster import bootstrap
 from kinto import __version__
@@ -23,7 +24,8 @@ def main(args=None):
 
     parser = argparse.ArgumentParser(description="Kinto Command-Line "
                                                  "Interface")
-    commands = ('init', 'start', 'migrate', 'delete-collection', 'version')
+    commands = ('init', 'start', 'migrate', 'delete-collection', 'reclaim-deleted',
+                'compact-tombstones', 'export', 'import', 'version')
     subparsers = parser.add_subparsers(title='subcommands',
                                        description='Main Kinto CLI commands',
                                        dest='subcommand',
@@ -75,6 +77,37 @@ def main(args=None):
             subparser.add_argument('--collection',
                                    help='The collection to remove.',
                                    required=True)
+        elif command in ('reclaim-deleted', 'compact-tombstones'):
+            subparser.add_argument('--batch-size',
+                                   type=int,
+                                   help='Maximum number of objects deleted '
+                                        'per transaction.',
+                                   dest='batch_size',
+                                   required=False,
+                                   default=None)
+        elif command == 'export':
+            subparser.add_argument('--output',
+                                   type=argparse.FileType('w'),
+                                   help='File to write the exported data to '
+                                        '(default: standard output).',
+                                   dest='output',
+                                   required=False,
+                                   default='-')
+        elif command == 'import':
+            subparser.add_argument('--input',
+                                   type=argparse.FileType('r'),
+                                   help='File to read the exported data from '
+                                        '(default: standard input).',
+                                   dest='input',
+                                   required=False,
+                                   default='-')
+            subparser.add_argument('--batch-size',
+                                   type=int,
+                                   help='Maximum number of rows imported '
+                                        'per transaction.',
+                                   dest='batch_size',
+                                   required=False,
+                                   default=None)
 
         elif command == 'start':
             subparser.add_argument('--reload',
@@ -143,6 +176,23 @@ def main(args=None):
                                          parsed_args['bucket'],
                                          parsed_args['collection'])
 
+    elif which_command == 'reclaim-deleted':
+        env = bootstrap(config_file)
+        return kinto_scripts.reclaim_deleted(env, parsed_args['batch_size'])
+
+    elif which_command == 'compact-tombstones':
+        env = bootstrap(config_file)
+        return kinto_scripts.compact_tombstones(env, parsed_args['batch_size'])
+
+    elif which_command == 'export':
+        env = bootstrap(config_file)
+        return scripts.export_data(env, parsed_args['output'])
+
+    elif which_command == 'import':
+        env = bootstrap(config_file)
+        return scripts.import_data(env, parsed_args['input'],
+                                   parsed_args['batch_size'])
+
     elif which_command == 'start':
         pserve_argv = ['pserve']
 
@@ -48,6 +48,7 @@ DEFAULT_SETTINGS = {
         'kinto.core.initialization.setup_storage',
         'kinto.core.initialization.setup_permission',
         'kinto.core.initialization.setup_cache',
+        'kinto.core.initialization.setup_backends_timings',
         'kinto.core.initialization.setup_requests_scheme',
         'kinto.core.initialization.setup_version_redirection',
         'kinto.core.initialization.setup_deprecation',
@@ -59,6 +60,8 @@ DEFAULT_SETTINGS = {
     ),
     'event_listeners': '',
     'heartbeat_timeout_seconds': 10,
+    'json_streaming_threshold': 1000,
+    'metrics_enabled': False,
     'newrelic_config': None,
     'newrelic_env': 'dev',
     'paginate_by': None,
@@ -67,6 +70,9 @@ DEFAULT_SETTINGS = {
     'permission_pool_size': 25,
     'profiler_dir': tempfile.gettempdir(),
     'profiler_enabled': False,
+    'profiler_sampling_interval_seconds': 0.005,
+    'profiler_sampling_rate': 0.01,
+    'profiler_secret': None,
     'project_docs': '',
     'project_name': '',
     'project_version': '',
@@ -78,6 +84,7 @@ DEFAULT_SETTINGS = {
     'storage_backend': '',
     'storage_url': '',
     'storage_max_fetch_size': 10000,
+    'storage_prepared_statements': False,
     'storage_pool_size': 25,
     'tm.annotate_user': False,  # Do annotate transactions with the user-id.
     'transaction_per_request': True,
@@ -118,6 +125,8 @@ def includeme(config):
 
     # Heartbeat registry.
     config.registry.heartbeats = {}
+    # Connection pools shown in the heartbeat, apart from health checks.
+    config.registry.heartbeat_pools = {}
 
     # Public settings registry.
     config.registry.public_settings = {'batch_max_requests', 'readonly'}
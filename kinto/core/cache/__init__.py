@@ -72,6 +72,36 @@ class CacheBase:
         """
         raise NotImplementedError
 
+    def get_many(self, keys):
+        """Obtain the values of the specified `keys`.
+
+        The default implementation fetches each key one by one. Backends
+        should override it in order to obtain every value at once.
+
+        :param list keys: list of keys
+        :returns: the stored values, in the same order as `keys`,
+            ``None`` for the missing ones.
+        :rtype: list
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items, ttl):
+        """Store several values at once.
+
+        :param dict items: mapping of keys to values to store
+        :param float ttl: expire after number of seconds
+        """
+        for key, value in items.items():
+            self.set(key, value, ttl)
+
+    def delete_many(self, keys):
+        """Delete the values of the specified `keys`.
+
+        :param list keys: list of keys
+        """
+        for key in keys:
+            self.delete(key)
+
 
 def heartbeat(backend):
     def ping(request):
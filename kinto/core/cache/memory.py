@@ -58,17 +58,20 @@ class Cache(CacheBase):
     def expire(self, key, ttl):
         self._ttl[self.prefix + key] = msec_time() + int(ttl * 1000.0)
 
+    def _set(self, key, value, ttl):
+        self.expire(key, ttl)
+        item_key = self.prefix + key
+        self._store[item_key] = value
+        self._created_at[item_key] = msec_time()
+        self._quota += size_of(item_key, value)
+
     @synchronized
     def set(self, key, value, ttl):
         if isinstance(value, bytes):
             raise TypeError("a string-like object is required, not 'bytes'")
         self._clean_expired()
         self._clean_oversized()
-        self.expire(key, ttl)
-        item_key = self.prefix + key
-        self._store[item_key] = value
-        self._created_at[item_key] = msec_time()
-        self._quota += size_of(item_key, value)
+        self._set(key, value, ttl)
 
     @synchronized
     def get(self, key):
@@ -83,6 +86,25 @@ class Cache(CacheBase):
         value = self._store.pop(key, None)
         self._quota -= size_of(key, value)
 
+    @synchronized
+    def get_many(self, keys):
+        self._clean_expired()
+        return [self._store.get(self.prefix + key) for key in keys]
+
+    @synchronized
+    def set_many(self, items, ttl):
+        if any(isinstance(value, bytes) for value in items.values()):
+            raise TypeError("a string-like object is required, not 'bytes'")
+        self._clean_expired()
+        self._clean_oversized()
+        for key, value in items.items():
+            self._set(key, value, ttl)
+
+    @synchronized
+    def delete_many(self, keys):
+        for key in keys:
+            self.delete(key)
+
 
 def load_from_config(config):
     settings = config.get_settings()
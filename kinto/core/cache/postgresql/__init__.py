@@ -154,6 +154,53 @@ class Cache(CacheBase):
         with self.client.connect() as conn:
             conn.execute(query, dict(key=self.prefix + key))
 
+    def get_many(self, keys):
+        if not keys:
+            return []
+
+        purge = "DELETE FROM cache WHERE ttl IS NOT NULL AND now() > ttl;"
+        query = "SELECT key, value FROM cache WHERE key IN :keys;"
+        prefixed = tuple(self.prefix + key for key in keys)
+        with self.client.connect() as conn:
+            conn.execute(purge)
+            result = conn.execute(query, dict(keys=prefixed))
+            rows = result.fetchall()
+
+        values = {row['key']: json.loads(row['value']) for row in rows}
+        return [values.get(key) for key in prefixed]
+
+    def set_many(self, items, ttl):
+        if not items:
+            return
+
+        placeholders = dict(ttl=ttl)
+        values = []
+        for i, (key, value) in enumerate(items.items()):
+            if isinstance(value, bytes):
+                raise TypeError("a string-like object is required, not 'bytes'")
+            placeholders['key_{}'.format(i)] = self.prefix + key
+            placeholders['value_{}'.format(i)] = json.dumps(value)
+            values.append("(:key_{0}, :value_{0}, sec2ttl(:ttl))".format(i))
+
+        query = """
+        INSERT INTO cache (key, value, ttl)
+        VALUES {values}
+        ON CONFLICT (key) DO UPDATE
+        SET value = EXCLUDED.value,
+            ttl = EXCLUDED.ttl;
+        """.format(values=','.join(values))
+        with self.client.connect() as conn:
+            conn.execute(query, placeholders)
+
+    def delete_many(self, keys):
+        if not keys:
+            return
+
+        query = "DELETE FROM cache WHERE key IN :keys;"
+        prefixed = tuple(self.prefix + key for key in keys)
+        with self.client.connect() as conn:
+            conn.execute(query, dict(keys=prefixed))
+
 
 def load_from_config(config):
     settings = config.get_settings()
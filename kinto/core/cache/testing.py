@@ -52,6 +52,9 @@ class CacheTest:
             (self.cache.get, ''),
             (self.cache.set, '', '', 42),
             (self.cache.delete, ''),
+            (self.cache.get_many, ['']),
+            (self.cache.set_many, {'': ''}, 42),
+            (self.cache.delete_many, ['']),
         ]
         for call in calls:
             self.assertRaises(exceptions.BackendError, *call)
@@ -114,6 +117,49 @@ class CacheTest:
     def test_delete_does_not_fail_if_record_is_unknown(self):
         self.cache.delete('foobar')
 
+    def test_get_many_returns_values_in_order(self):
+        self.cache.set('foo', 'a', 42)
+        self.cache.set('bar', {'b': 1}, 42)
+        retrieved = self.cache.get_many(['bar', 'unknown', 'foo'])
+        self.assertEqual(retrieved, [{'b': 1}, None, 'a'])
+
+    def test_get_many_returns_empty_list_if_no_keys(self):
+        self.assertEqual(self.cache.get_many([]), [])
+
+    def test_get_many_ignores_expired_values(self):
+        self.cache.set('foo', 'a', 0.01)
+        self.cache.set('bar', 'b', 42)
+        time.sleep(0.02)
+        retrieved = self.cache.get_many(['foo', 'bar'])
+        self.assertEqual(retrieved, [None, 'b'])
+
+    def test_set_many_adds_the_records(self):
+        self.cache.set_many({'foo': 'a', 'bar': ['b']}, 42)
+        self.assertEqual(self.cache.get('foo'), 'a')
+        self.assertEqual(self.cache.get('bar'), ['b'])
+
+    def test_set_many_overwrites_existing_values(self):
+        self.cache.set('foo', 'a', 42)
+        self.cache.set_many({'foo': 'b'}, 42)
+        self.assertEqual(self.cache.get('foo'), 'b')
+
+    def test_set_many_sets_the_ttl(self):
+        self.cache.set_many({'foo': 'a', 'bar': 'b'}, 10)
+        for key in ('foo', 'bar'):
+            ttl = self.cache.ttl(key)
+            self.assertGreater(ttl, 0)
+            self.assertLessEqual(ttl, 10)
+
+    def test_bytes_cannot_be_stored_with_set_many(self):
+        with pytest.raises(TypeError):
+            self.cache.set_many({'foo': 'a', 'bar': b'b'}, 42)
+
+    def test_delete_many_removes_the_records(self):
+        self.cache.set_many({'foo': 'a', 'bar': 'b', 'baz': 'c'}, 42)
+        self.cache.delete_many(['foo', 'bar', 'unknown'])
+        retrieved = self.cache.get_many(['foo', 'bar', 'baz'])
+        self.assertEqual(retrieved, [None, None, 'c'])
+
     def test_expire_expires_the_value(self):
         self.cache.set('foobar', 'toto', 42)
         self.cache.expire('foobar', 0.01)
@@ -205,3 +251,17 @@ class CacheTest:
         # The record should have expired
         retrieved = self.cache.get('prefix_foobar')
         self.assertIsNone(retrieved)
+
+    def test_prefix_value_used_with_many_operations(self):
+        backend_prefix = self.get_backend_prefix(prefix='prefix_')
+
+        backend_prefix.set_many({'foo': 'a', 'bar': 'b'}, 42)
+        obtained = self.cache.get_many(['prefix_foo', 'prefix_bar'])
+        self.assertEqual(obtained, ['a', 'b'])
+
+        obtained = backend_prefix.get_many(['foo', 'bar'])
+        self.assertEqual(obtained, ['a', 'b'])
+
+        backend_prefix.delete_many(['foo'])
+        obtained = self.cache.get_many(['prefix_foo', 'prefix_bar'])
+        self.assertEqual(obtained, [None, 'b'])
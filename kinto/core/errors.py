@@ -45,6 +45,8 @@ class ERRORS(Enum):
     +-------------+-------+------------------------------------------------+
     | 409         | 122   | Another resource violates constraint           |
     +-------------+-------+------------------------------------------------+
+    | 410         | 123   | Requested changes were purged                  |
+    +-------------+-------+------------------------------------------------+
     | 500         | 999   | Internal Server Error                          |
     +-------------+-------+------------------------------------------------+
     | 503         | 201   | Service Temporary unavailable due to high load |
@@ -68,6 +70,7 @@ class ERRORS(Enum):
     CLIENT_REACHED_CAPACITY = 117
     FORBIDDEN = 121
     CONSTRAINT_VIOLATED = 122
+    CHANGES_PURGED = 123
     UNDEFINED = 999
     BACKEND = 201
     SERVICE_DEPRECATED = 202
@@ -84,6 +87,9 @@ class ErrorSchema(colander.MappingSchema):
     details = colander.SchemaNode(Any(), missing=colander.drop)
 
 
+_error_schema = ErrorSchema()
+
+
 def http_error(httpexception, errno=None,
                code=None, error=None, message=None, info=None, details=None):
     """Return a JSON formated response matching the error HTTP API.
@@ -114,7 +120,7 @@ def http_error(httpexception, errno=None,
 
     response = httpexception
     response.errno = errno
-    response.json = ErrorSchema().deserialize(body)
+    response.json = _error_schema.deserialize(body)
     response.content_type = 'application/json'
     return response
 
@@ -1,5 +1,8 @@
+import functools
 import logging
 import re
+import time
+import types
 import warnings
 from datetime import datetime
 from dateutil import parser as dateparser
@@ -13,6 +16,7 @@ from pyramid.response import Response
 from pyramid.security import NO_PERMISSION_REQUIRED
 from pyramid.interfaces import IAuthenticationPolicy
 from pyramid.settings import asbool, aslist
+from pyramid.threadlocal import get_current_request
 from pyramid_multiauth import (MultiAuthenticationPolicy,
                                MultiAuthPolicySelected)
 
@@ -20,17 +24,16 @@ try:
     import newrelic.agent
 except ImportError:  # pragma: no cover
     newrelic = None
-try:
-    from werkzeug.contrib.profiler import ProfilerMiddleware
-except ImportError:  # pragma: no cover
-    pass
 
 from kinto.core import errors
 from kinto.core import utils
 from kinto.core import cache
 from kinto.core import storage
 from kinto.core import permission
+from kinto.core import metrics
+from kinto.core.profiler import SamplingProfiler
 from kinto.core.events import ResourceRead, ResourceChanged, ACTIONS
+from kinto.core.storage.postgresql.client import PostgreSQLClient
 
 
 logger = logging.getLogger(__name__)
@@ -56,7 +59,13 @@ def setup_json_serializer(config):
     requests.models.json = utils.json
 
     # Override json renderer using ujson
-    renderer = JSONRenderer(serializer=utils.json_serializer)
+    serializer = utils.json_serializer
+    # Stream large collections responses instead of encoding them at once.
+    threshold = config.get_settings()['json_streaming_threshold']
+    if threshold:
+        serializer = functools.partial(utils.json_stream_serializer,
+                                       threshold=int(threshold))
+    renderer = JSONRenderer(serializer=serializer)
     config.add_renderer('json', renderer)
 
 
@@ -212,6 +221,7 @@ def setup_storage(config):
 
     heartbeat = storage.heartbeat(backend)
     config.registry.heartbeats['storage'] = heartbeat
+    _setup_pools_heartbeat(config, 'storage', backend)
 
 
 def setup_permission(config):
@@ -228,6 +238,7 @@ def setup_permission(config):
 
     heartbeat = permission.heartbeat(backend)
     config.registry.heartbeats['permission'] = heartbeat
+    _setup_pools_heartbeat(config, 'permission', backend)
 
 
 def setup_cache(config):
@@ -244,58 +255,167 @@ def setup_cache(config):
 
     heartbeat = cache.heartbeat(backend)
     config.registry.heartbeats['cache'] = heartbeat
+    _setup_pools_heartbeat(config, 'cache', backend)
+
+
+def setup_backends_timings(config):
+    """Accumulate the number and duration of the backends calls on each request.
+
+    They are bound to the ``request.summary`` log context (e.g. ``storage_calls``
+    and ``storage_t``), and sent to StatsD if enabled.
+    """
+    for name in ('cache', 'storage', 'permission'):
+        backend = getattr(config.registry, name, None)
+        if backend is None:
+            continue
+        for attr in dir(backend):
+            method = getattr(backend, attr)
+            is_method = (isinstance(method, types.MethodType) and
+                         method.__self__ is backend)
+            if not attr.startswith('_') and is_method:
+                setattr(backend, attr, _timed_backend_call(name, backend, attr))
+
+
+def _timed_backend_call(name, backend, attr):
+    # The method is looked up on the class on each call, so that it can
+    # still be patched or replaced once the application is set up.
+    method = getattr(type(backend), attr)
+
+    @functools.wraps(method)
+    def wrapped(backend, *args, **kwargs):
+        method = getattr(type(backend), attr)
+        request = get_current_request()
+        if request is None:
+            return method(backend, *args, **kwargs)
+        # Subrequests (e.g. batch) are accounted in the request they belong to.
+        while getattr(request, 'parent', None) is not None:
+            request = request.parent
+
+        try:
+            calling, timings = request._backends_calls
+        except AttributeError:
+            calling, timings = request._backends_calls = (set(), {})
+
+        # Backends calling their own methods are only accounted once.
+        if name in calling:
+            return method(backend, *args, **kwargs)
+
+        calling.add(name)
+        started = time.perf_counter()
+        try:
+            return method(backend, *args, **kwargs)
+        finally:
+            duration = time.perf_counter() - started
+            calling.discard(name)
+            calls, total = timings.get(name, (0, 0.0))
+            timings[name] = (calls + 1, total + duration)
+
+    # Bound, so that it can be instrumented like other methods (e.g. StatsD).
+    return types.MethodType(wrapped, backend)
+
+
+def backends_timings(request):
+    """Return the number of calls and their total duration in milliseconds,
+    by backend name, for the specified request.
+
+    :rtype: dict
+    """
+    _, timings = getattr(request, '_backends_calls', (None, {}))
+    return {name: (calls, round(total * 1000, 3))
+            for name, (calls, total) in timings.items()}
+
+
+def _monitored_pools(backend):
+    """Return the connection pools of the backend that expose statistics."""
+    client = getattr(backend, 'client', None)
+    if not isinstance(client, PostgreSQLClient):
+        return []
+    return [pool for pool in client.pools if hasattr(pool, 'stats')]
+
+
+def _setup_pools_heartbeat(config, name, backend):
+    pools = _monitored_pools(backend)
+    if pools:
+        config.registry.heartbeat_pools[name] = pools
 
 
 def setup_statsd(config):
     settings = config.get_settings()
     config.registry.statsd = None
+    config.registry.metrics = None
 
-    if settings['statsd_url']:
+    if asbool(settings['metrics_enabled']):
+        # Keep metrics in memory, and expose them on the ``__metrics__`` endpoint.
+        client = metrics.load_from_config(config)
+        config.registry.metrics = client
+    elif settings['statsd_url']:
         statsd_mod = settings['statsd_backend']
         statsd_mod = config.maybe_dotted(statsd_mod)
         client = statsd_mod.load_from_config(config)
+    else:
+        return
 
-        config.registry.statsd = client
-
-        client.watch_execution_time(config.registry.cache, prefix='backend')
-        client.watch_execution_time(config.registry.storage, prefix='backend')
-        client.watch_execution_time(config.registry.permission, prefix='backend')
+    config.registry.statsd = client
+
+    client.watch_execution_time(config.registry.cache, prefix='backend')
+    client.watch_execution_time(config.registry.storage, prefix='backend')
+    client.watch_execution_time(config.registry.permission, prefix='backend')
+
+    # Report connection pools usage (pools shared between backends once).
+    instrumented = set()
+    for name in ('cache', 'storage', 'permission'):
+        backend = getattr(config.registry, name, None)
+        for pool in _monitored_pools(backend):
+            if id(pool) not in instrumented:
+                pool.instrument(client, prefix='pool.{}'.format(name))
+                instrumented.add(id(pool))
+
+    # Commit so that configured policy can be queried.
+    config.commit()
+    policy = config.registry.queryUtility(IAuthenticationPolicy)
+    if isinstance(policy, MultiAuthenticationPolicy):
+        for name, subpolicy in policy.get_policies():
+            client.watch_execution_time(subpolicy,
+                                        prefix='authentication',
+                                        classname=name)
+    else:
+        client.watch_execution_time(policy, prefix='authentication')
 
-        # Commit so that configured policy can be queried.
-        config.commit()
-        policy = config.registry.queryUtility(IAuthenticationPolicy)
-        if isinstance(policy, MultiAuthenticationPolicy):
-            for name, subpolicy in policy.get_policies():
-                client.watch_execution_time(subpolicy,
-                                            prefix='authentication',
-                                            classname=name)
-        else:
-            client.watch_execution_time(policy, prefix='authentication')
+    def on_new_response(event):
+        request = event.request
 
-        def on_new_response(event):
-            request = event.request
+        # Count unique users.
+        user_id = request.prefixed_userid
+        if user_id:
+            client.count('users', unique=user_id)
 
-            # Count unique users.
-            user_id = request.prefixed_userid
-            if user_id:
-                client.count('users', unique=user_id)
+        # Count authentication verifications.
+        if hasattr(request, 'authn_type'):
+            client.count('authn_type.{}'.format(request.authn_type))
 
-            # Count authentication verifications.
-            if hasattr(request, 'authn_type'):
-                client.count('authn_type.{}'.format(request.authn_type))
+        # Count view calls, and time them along with their backends calls.
+        service = request.current_service
+        if service:
+            client.count('view.{}.{}'.format(service.name, request.method))
 
-            # Count view calls.
-            service = request.current_service
-            if service:
-                client.count('view.{}.{}'.format(service.name, request.method))
+            if not hasattr(request, 'parent'):
+                key = 'request.{}.{}'.format(service.name, request.method)
+                received_at = getattr(request, '_received_at', None)
+                if received_at is not None:
+                    client.timing(key, utils.msec_time() - received_at)
+                for name, (_, duration) in backends_timings(request).items():
+                    client.timing('{}.{}'.format(key, name), duration)
 
-        config.add_subscriber(on_new_response, NewResponse)
+    config.add_subscriber(on_new_response, NewResponse)
 
-        return client
+    return client
 
 
 def install_middlewares(app, settings):
     "Install a set of middlewares defined in the ini file on the given app."
+    # Routes are matched by the profiler to aggregate samples by endpoint.
+    registry = getattr(app, 'registry', None)
+
     # Setup new-relic.
     if settings.get('newrelic_config'):
         ini_file = settings['newrelic_config']
@@ -303,11 +423,14 @@ def install_middlewares(app, settings):
         newrelic.agent.initialize(ini_file, env)
         app = newrelic.agent.WSGIApplicationWrapper(app)
 
-    # Adds the Werkzeug profiler.
+    # Adds the sampling profiler.
     if asbool(settings.get('profiler_enabled')):
-        profile_dir = settings['profiler_dir']
-        app = ProfilerMiddleware(app, profile_dir=profile_dir,
-                                 restrictions=('*kinto.core*'))
+        app = SamplingProfiler(app,
+                               profile_dir=settings['profiler_dir'],
+                               sampling_rate=float(settings['profiler_sampling_rate']),
+                               interval=float(settings['profiler_sampling_interval_seconds']),
+                               secret=settings.get('profiler_secret') or None,
+                               registry=registry)
 
     return app
 
@@ -365,6 +488,11 @@ def setup_logging(config):
             pass
 
         if not hasattr(request, 'parent'):
+            # Bind the backends calls that were made for this request.
+            for name, (calls, duration) in backends_timings(request).items():
+                request.log_context(**{'{}_calls'.format(name): calls,
+                                       '{}_t'.format(name): duration})
+
             # Ouput application request summary.
             summary_logger.info('', extra=request.log_context())
 
@@ -0,0 +1,143 @@
+import bisect
+import functools
+import re
+import threading
+import time
+
+from kinto.core import statsd
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Upper bounds (in seconds) of the timers histograms buckets."""
+
+INVALID_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_:]')
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class Timer:
+    """Time a block of code or a function, like the StatsD timers."""
+
+    def __init__(self, client, key):
+        self.client = client
+        self.key = key
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.client.observe(self.key, time.perf_counter() - started)
+        return wrapped
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.client.observe(self.key, time.perf_counter() - self._started)
+
+
+class Client(statsd.Client):
+    """In-process metrics registry, with the same interface as the StatsD client.
+
+    Counters, gauges and timers histograms are kept in memory, and rendered
+    using the Prometheus text format on the ``__metrics__`` endpoint. Unlike
+    StatsD, nothing is sent over the network when a metric is updated.
+
+    Unique counts (e.g. users) are ignored, since they would require to keep
+    every value in memory.
+    """
+    def __init__(self, prefix, buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._names = {}
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+
+    def _name(self, key):
+        try:
+            return self._names[key]
+        except KeyError:
+            name = INVALID_NAME_CHARS.sub('_', '{}_{}'.format(self.prefix, key))
+            self._names[key] = name
+            return name
+
+    def observe(self, key, seconds):
+        name = self._name(key) + '_seconds'
+        with self._lock:
+            try:
+                histogram = self._histograms[name]
+            except KeyError:
+                histogram = self._histograms[name] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def timer(self, key):
+        return Timer(self, key)
+
+    def timing(self, key, value):
+        # Durations are given in milliseconds, like with StatsD.
+        self.observe(key, value / 1000)
+
+    def count(self, key, unique=None):
+        if unique is not None:
+            return
+        name = self._name(key) + '_total'
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + 1
+
+    def gauge(self, key, value):
+        name = self._name(key)
+        with self._lock:
+            self._gauges[name] = value
+
+    def render(self):
+        """Return the current metrics values in the Prometheus text format.
+
+        :rtype: str
+        """
+        with self._lock:
+            counters = sorted(self._counters.items())
+            gauges = sorted(self._gauges.items())
+            histograms = sorted((name, list(h.counts), h.sum)
+                                for name, h in self._histograms.items())
+
+        lines = []
+        for name, value in counters:
+            lines += ['# TYPE {} counter'.format(name),
+                      '{} {}'.format(name, value)]
+        for name, value in gauges:
+            lines += ['# TYPE {} gauge'.format(name),
+                      '{} {}'.format(name, value)]
+        for name, counts, total in histograms:
+            lines.append('# TYPE {} histogram'.format(name))
+            cumulative = 0
+            bounds = [repr(float(b)) for b in self.buckets] + ['+Inf']
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append('{}_bucket{{le="{}"}} {}'.format(name, bound, cumulative))
+            lines += ['{}_sum {}'.format(name, total),
+                      '{}_count {}'.format(name, cumulative)]
+        return '\n'.join(lines) + '\n'
+
+
+def load_from_config(config):
+    settings = config.get_settings()
+    if settings['project_name'] != '':
+        prefix = settings['project_name']
+    else:
+        prefix = settings['statsd_prefix']
+    return Client(prefix)
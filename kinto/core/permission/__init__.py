@@ -171,6 +171,25 @@ class PermissionBase:
         """
         raise NotImplementedError
 
+    def apply_object_permissions(self, object_id, permissions, owner=None):
+        """Replace the given permissions of an object (see
+        :meth:`replace_object_permissions`), give the ``write`` permission to
+        the `owner`, and return the resulting permissions of the object.
+
+        Backends can override it to perform everything in one operation.
+
+        :param str object_id: The object to replace permissions on.
+        :param permissions: A dict of perm -> principals to be granted on
+        this object.
+        :param str owner: An optional principal to add to the ``write`` ACE.
+        :returns: The mapping of the object permissions with their principals.
+        :rtype: dict
+        """
+        self.replace_object_permissions(object_id, permissions)
+        if owner is not None:
+            self.add_principal_to_ace(object_id, 'write', owner)
+        return self.get_object_permissions(object_id)
+
     def delete_object_permissions(self, *object_id_list):
         """Delete all listed object permissions.
 
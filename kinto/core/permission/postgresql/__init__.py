@@ -409,6 +409,98 @@ class Permission(PermissionBase):
         with self.client.connect() as conn:
             conn.execute(query, placeholders)
 
+    def apply_object_permissions(self, object_id, permissions, owner=None):
+        permissions = {perm: set(principals) for perm, principals in permissions.items()}
+        # If the write ACE is replaced, the owner is part of the new one.
+        owner_replaced = owner is not None and 'write' in permissions
+        if owner_replaced:
+            permissions['write'].add(owner)
+
+        placeholders = {
+            'object_id': object_id,
+            'owner': owner,
+        }
+        specified_perms = []
+        new_aces = []
+        for i, (perm, principals) in enumerate(permissions.items()):
+            placeholders['perm_{}'.format(i)] = perm
+            specified_perms.append("(:perm_{})".format(i))
+            for principal in principals:
+                j = len(new_aces)
+                placeholders['principal_{}'.format(j)] = principal
+                new_aces.append("(:perm_{}, :principal_{})".format(i, j))
+
+        # Every sub-statement sees the ACEs as they were before the query.
+        # The resulting permissions are thus computed from the untouched
+        # existing ones, the new ones and the owner. Since a row cannot be
+        # deleted and inserted again within the same statement, the ACEs
+        # that are kept are left untouched.
+        ctes = []
+        results = []
+        if new_aces:
+            ctes.append("""
+            new_aces AS (
+              VALUES {}
+            ),
+            insert_new AS (
+              INSERT INTO access_control_entries(object_id, permission, principal)
+                SELECT :object_id, column1, column2
+                  FROM new_aces
+              ON CONFLICT DO NOTHING
+            )""".format(','.join(new_aces)))
+            results.append("SELECT column1, column2 FROM new_aces")
+
+        if specified_perms:
+            kept_aces = ''
+            if new_aces:
+                kept_aces = """
+                 AND (permission, principal) NOT IN (SELECT column1, column2
+                                                       FROM new_aces)"""
+            ctes.append("""
+            specified_perms AS (
+              VALUES {}
+            ),
+            delete_specified AS (
+              DELETE FROM access_control_entries
+               USING specified_perms
+               WHERE object_id = :object_id AND permission = column1{}
+            )""".format(','.join(specified_perms), kept_aces))
+            results.append("""
+            SELECT permission, principal
+              FROM access_control_entries
+             WHERE object_id = :object_id
+               AND permission NOT IN (SELECT column1 FROM specified_perms)""")
+        else:
+            results.append("""
+            SELECT permission, principal
+              FROM access_control_entries
+             WHERE object_id = :object_id""")
+
+        if owner is not None and not owner_replaced:
+            ctes.append("""
+            insert_owner AS (
+              INSERT INTO access_control_entries(object_id, permission, principal)
+              VALUES (:object_id, 'write', :owner)
+              ON CONFLICT DO NOTHING
+            )""")
+            results.append("SELECT 'write', :owner")
+
+        query = """
+        {ctes}
+        SELECT permission, principal
+          FROM ({results}) AS resulting (permission, principal);
+        """.format(ctes='WITH {}'.format(','.join(ctes)) if ctes else '',
+                   results=' UNION '.join(results))
+
+        with self.client.connect() as conn:
+            result = conn.execute(query, placeholders)
+            rows = result.fetchall()
+
+        resulting = {}
+        for row in rows:
+            resulting.setdefault(row['permission'], set()).add(row['principal'])
+        return resulting
+
     def delete_object_permissions(self, *object_id_list):
         if len(object_id_list) == 0:
             return
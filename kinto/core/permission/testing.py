@@ -43,6 +43,7 @@ class PermissionTest:
             (self.permission.get_object_permission_principals, '', ''),
             (self.permission.get_object_permissions, ''),
             (self.permission.replace_object_permissions, '', {'write': []}),
+            (self.permission.apply_object_permissions, '', {'write': []}, 'user1'),
             (self.permission.delete_object_permissions, ''),
             (self.permission.get_accessible_objects, []),
             (self.permission.get_authorized_principals, [('*', 'read')]),
@@ -473,6 +474,55 @@ class PermissionTest:
         permissions = self.permission.get_object_permissions('/url/a/id/1')
         self.assertEqual(len(permissions), 0)
 
+    def test_apply_object_permissions_replaces_given_sets_and_adds_owner(self):
+        self.permission.add_principal_to_ace('/url/a/id/1', 'write', 'user1')
+        self.permission.add_principal_to_ace('/url/a/id/1', 'read', 'user3')
+        self.permission.add_principal_to_ace('/url/a/id/1', 'obj:del', 'user1')
+
+        permissions = self.permission.apply_object_permissions('/url/a/id/1', {
+            "read": ["user2"],
+            "obj:del": [],
+            "new": ["user3", "user3"]
+        }, owner='owner')
+
+        expected = {
+            "write": {"user1", "owner"},
+            "read": {"user2"},
+            "new": {"user3"}
+        }
+        self.assertDictEqual(permissions, expected)
+        self.assertDictEqual(self.permission.get_object_permissions('/url/a/id/1'), expected)
+
+    def test_apply_object_permissions_keeps_owner_if_write_is_replaced(self):
+        self.permission.add_principal_to_ace('/url/a/id/1', 'write', 'owner')
+        self.permission.add_principal_to_ace('/url/a/id/1', 'write', 'user1')
+
+        permissions = self.permission.apply_object_permissions('/url/a/id/1', {
+            "write": ["user2"]
+        }, owner='owner')
+
+        expected = {"write": {"user2", "owner"}}
+        self.assertDictEqual(permissions, expected)
+        self.assertDictEqual(self.permission.get_object_permissions('/url/a/id/1'), expected)
+
+    def test_apply_object_permissions_does_not_duplicate_existing_owner(self):
+        self.permission.add_principal_to_ace('/url/a/id/1', 'write', 'owner')
+        permissions = self.permission.apply_object_permissions('/url/a/id/1', {},
+                                                               owner='owner')
+        self.assertDictEqual(permissions, {"write": {"owner"}})
+
+    def test_apply_object_permissions_supports_empty_input_without_owner(self):
+        self.permission.add_principal_to_ace('/url/a/id/1', 'read', 'user1')
+        permissions = self.permission.apply_object_permissions('/url/a/id/1', {})
+        self.assertDictEqual(permissions, {"read": {"user1"}})
+
+    def test_apply_object_permissions_on_new_object(self):
+        permissions = self.permission.apply_object_permissions('/url/a/id/1', {
+            "read": ["user1"],
+            "write": []
+        }, owner='owner')
+        self.assertDictEqual(permissions, {"read": {"user1"}, "write": {"owner"}})
+
     def test_delete_object_permissions_remove_all_given_objects_acls(self):
         self.permission.add_principal_to_ace('/url/a/id/1', 'write', 'user1')
         self.permission.add_principal_to_ace('/url/a/id/1', 'write', 'user2')
@@ -0,0 +1,168 @@
+import hmac
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+from pyramid.interfaces import IRoutesMapper
+
+
+logger = logging.getLogger(__name__)
+
+DUMP_INTERVAL_SECONDS = 10
+"""Minimum delay between two dumps of the collected stacks."""
+
+SECRET_HEADER = 'HTTP_PROFILER_SECRET'
+
+INVALID_FILENAME_CHARS = re.compile(r'[^a-zA-Z0-9_.-]+')
+
+
+class SamplingProfiler:
+    """WSGI middleware that samples the stacks of a fraction of the requests.
+
+    While sampled requests are being processed, a background thread records the
+    stack of their threads every ``interval`` seconds. Stacks are aggregated by
+    endpoint (HTTP method and route pattern), and dumped periodically in the
+    profiling directory using the *folded* format of flamegraph tools (e.g.
+    ``flamegraph.pl GET_v1_buckets.folded > GET_v1_buckets.svg``).
+
+    Requests can also be sampled explicitly using a ``Profiler-Secret`` header
+    whose value matches the ``secret`` parameter.
+    """
+
+    def __init__(self, app, profile_dir, sampling_rate=0.01, interval=0.005,
+                 secret=None, registry=None):
+        self.app = app
+        self.profile_dir = profile_dir
+        self.sampling_rate = sampling_rate
+        self.interval = interval
+        self.secret = secret
+        self.routes_mapper = None
+        if registry is not None:
+            self.routes_mapper = registry.queryUtility(IRoutesMapper)
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        # Samples of the requests being processed, by thread id.
+        self._active = {}
+        # Samples of the processed requests, by endpoint.
+        self._stacks = defaultdict(Counter)
+        self._dirty = set()
+        self._dumped_at = time.monotonic()
+
+    def __call__(self, environ, start_response):
+        if not self._is_sampled(environ):
+            return self.app(environ, start_response)
+
+        thread_id = threading.get_ident()
+        self._start(thread_id)
+        try:
+            app_iter = self.app(environ, start_response)
+        except BaseException:
+            self._stop(thread_id, environ)
+            raise
+        # Keep sampling while the response body is produced (e.g. streamed JSON).
+        return self._iter_and_stop(app_iter, thread_id, environ)
+
+    def _is_sampled(self, environ):
+        if self.secret and SECRET_HEADER in environ:
+            return hmac.compare_digest(environ[SECRET_HEADER], self.secret)
+        return self.sampling_rate > 0 and random.random() < self.sampling_rate
+
+    def _iter_and_stop(self, app_iter, thread_id, environ):
+        try:
+            yield from app_iter
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+            self._stop(thread_id, environ)
+
+    def _start(self, thread_id):
+        with self._lock:
+            self._active[thread_id] = Counter()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='profiler',
+                                                daemon=True)
+                self._thread.start()
+            self._wakeup.set()
+
+    def _stop(self, thread_id, environ):
+        endpoint = self.endpoint(environ)
+        with self._lock:
+            samples = self._active.pop(thread_id)
+            if samples:
+                self._stacks[endpoint].update(samples)
+                self._dirty.add(endpoint)
+
+    def _run(self):
+        this_thread = threading.get_ident()
+        while True:
+            self._wakeup.wait()
+            with self._lock:
+                idle = not self._active
+                if idle:
+                    self._wakeup.clear()
+                else:
+                    frames = sys._current_frames()
+                    for thread_id, samples in self._active.items():
+                        frame = frames.get(thread_id)
+                        if frame is not None and thread_id != this_thread:
+                            samples[folded_stack(frame)] += 1
+
+            is_due = time.monotonic() - self._dumped_at > DUMP_INTERVAL_SECONDS
+            if self._dirty and (idle or is_due):
+                self.dump()
+            if not idle:
+                time.sleep(self.interval)
+
+    def endpoint(self, environ):
+        """Return the name of the endpoint for the specified WSGI environ
+        (e.g. ``GET /v1/buckets/{bucket_id}``).
+        """
+        method = environ.get('REQUEST_METHOD', 'GET')
+        path = environ.get('PATH_INFO', '/')
+        if self.routes_mapper is not None:
+            for route in self.routes_mapper.get_routes():
+                if route.match(path) is not None:
+                    return '{} {}'.format(method, route.pattern)
+        return '{} {}'.format(method, path)
+
+    def dump(self):
+        """Write the stacks collected for the endpoints with new samples, one
+        file per endpoint.
+        """
+        with self._lock:
+            dirty = {endpoint: Counter(self._stacks[endpoint]) for endpoint in self._dirty}
+            self._dirty.clear()
+            self._dumped_at = time.monotonic()
+
+        for endpoint, stacks in dirty.items():
+            filename = INVALID_FILENAME_CHARS.sub('_', endpoint).strip('_') + '.folded'
+            filepath = os.path.join(self.profile_dir, filename)
+            try:
+                os.makedirs(self.profile_dir, exist_ok=True)
+                # Replace the previous dump at once, since it may be read meanwhile.
+                with open(filepath + '.tmp', 'w') as f:
+                    for stack, count in stacks.most_common():
+                        f.write('{} {}\n'.format(stack, count))
+                os.replace(filepath + '.tmp', filepath)
+            except OSError as e:
+                logger.error("Could not write profile of '{}': {}".format(endpoint, e))
+
+
+def folded_stack(frame):
+    """Return the stack of the specified frame as a string of function names
+    separated by semicolons, from the outermost call.
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get('__name__', '?')
+        names.append('{}:{}'.format(module, code.co_name))
+        frame = frame.f_back
+    return ';'.join(reversed(names))
@@ -1,4 +1,5 @@
 import logging
+import hashlib
 import re
 import functools
 
@@ -17,7 +18,7 @@ from kinto.core.events import ACTIONS
 from kinto.core.storage import exceptions as storage_exceptions, Filter, Sort
 from kinto.core.utils import (
     COMPARISON, classname, decode64, encode64, json, find_nested_value,
-    dict_subset, recursive_update_dict, apply_json_patch
+    dict_subset, recursive_update_dict, apply_json_patch, hmac_digest
 )
 
 from .model import Model, ShareableModel
@@ -27,6 +28,44 @@ from .viewset import ViewSet, ShareableViewSet
 
 logger = logging.getLogger(__name__)
 
+QUERY_PARAMS_CACHE_SIZE = 1024
+"""Number of distinct querystring parameters whose parsing is kept in memory."""
+
+FILTER_PARAM_REGEXP = re.compile(r'^({})_([\w\.]+)$'.format(
+    '|'.join([c.name.lower() for c in COMPARISON])))
+
+SORT_FIELD_REGEXP = re.compile(r'^([\-+]?)([\w\.]+)$')
+
+
+@functools.lru_cache(maxsize=QUERY_PARAMS_CACHE_SIZE)
+def _parse_filter_param(param):
+    """Return the comparison operator and the field of a querystring filter,
+    e.g. ``(COMPARISON.MIN, 'age')`` for ``min_age``.
+    """
+    m = FILTER_PARAM_REGEXP.match(param)
+    if m:
+        keyword, field = m.groups()
+        return getattr(COMPARISON, keyword.upper()), field
+    return COMPARISON.EQ, param
+
+
+@functools.lru_cache(maxsize=QUERY_PARAMS_CACHE_SIZE)
+def _parse_sort_field(specified):
+    """Return the field and direction of a ``_sort`` item, e.g.
+    ``('age', -1)`` for ``-age``, or ``None`` if malformed.
+    """
+    m = SORT_FIELD_REGEXP.match(specified.strip())
+    if m:
+        order, field = m.groups()
+        return field, -1 if order == '-' else 1
+    return None
+
+
+@functools.lru_cache(maxsize=QUERY_PARAMS_CACHE_SIZE)
+def _schema_fields(schema):
+    """Return the names of the fields defined in the resource schema."""
+    return tuple(c.name for c in schema().children)
+
 
 def register(depth=1, **kwargs):
     """Ressource class decorator.
@@ -172,8 +211,10 @@ class UserResource:
             parent_id=parent_id,
             auth=auth)
 
-        # Initialize timestamp as soon as possible.
-        self.timestamp
+        # Initialize timestamp as soon as possible. When listing records, it
+        # is obtained along with them (see ``collection_get()``).
+        if self.record_id is not None or request.method.lower() not in ('get', 'head'):
+            self.timestamp
 
     @reify
     def id_generator(self):
@@ -221,8 +262,8 @@ class UserResource:
 
     def _get_known_fields(self):
         """Return all the `field` defined in the ressource schema."""
-        known_fields = [c.name for c in self.schema().children] + \
-                       [self.model.id_field,
+        known_fields = [*_schema_fields(self.schema),
+                        self.model.id_field,
                         self.model.modified_field,
                         self.model.deleted_field]
         return known_fields
@@ -262,7 +303,6 @@ class UserResource:
         :raises: :exc:`~pyramid:pyramid.httpexceptions.HTTPBadRequest`
             if filters or sorting are invalid.
         """
-        self._add_timestamp_header(self.request.response)
         self._add_cache_header(self.request.response)
         self._raise_304_if_not_modified()
         # Collections are considered resources that always exist
@@ -278,20 +318,43 @@ class UserResource:
         filter_fields = [f.field for f in filters]
         include_deleted = self.model.modified_field in filter_fields
 
+        tokeninfo = self._decode_pagination_token()
         pagination_rules, offset = self._extract_pagination_rules_from_token(
-            limit, sorting)
-
-        records, total_records = self.model.get_records(
-            filters=filters,
+            tokeninfo, sorting)
+        snapshot = self._extract_pagination_snapshot(tokeninfo, filters, sorting)
+
+        storage_filters = filters
+        if snapshot:
+            # Next pages ignore the changes made since the first one, and
+            # reuse its total.
+            storage_filters = filters + [Filter(self.model.modified_field,
+                                                snapshot['timestamp'],
+                                                COMPARISON.MAX)]
+
+        records, total_records, timestamp = self.model.get_records_with_timestamp(
+            filters=storage_filters,
             sorting=sorting,
             limit=limit,
             pagination_rules=pagination_rules,
-            include_deleted=include_deleted)
+            include_deleted=include_deleted,
+            fields=partial_fields,
+            with_count=not snapshot)
+
+        if timestamp is not None:
+            # Obtained in the same round trip, consistent with the records.
+            self.timestamp = timestamp
+        self._add_timestamp_header(self.request.response)
+
+        if snapshot:
+            total_records = snapshot['total']
+        else:
+            snapshot = {'timestamp': self.timestamp, 'total': total_records}
 
         offset = offset + len(records)
         if limit and len(records) == limit and offset < total_records:
             lastrecord = records[-1]
-            next_page = self._next_page_url(sorting, limit, lastrecord, offset)
+            next_page = self._next_page_url(sorting, limit, lastrecord, offset,
+                                            filters=filters, snapshot=snapshot)
             headers['Next-Page'] = next_page
 
         if partial_fields:
@@ -365,7 +428,8 @@ class UserResource:
         filters = self._extract_filters()
         limit = self._extract_limit()
         sorting = self._extract_sorting(limit)
-        pagination_rules, offset = self._extract_pagination_rules_from_token(limit, sorting)
+        tokeninfo = self._decode_pagination_token()
+        pagination_rules, offset = self._extract_pagination_rules_from_token(tokeninfo, sorting)
 
         records, total_records = self.model.get_records(filters=filters,
                                                         sorting=sorting,
@@ -808,7 +872,7 @@ class UserResource:
         if record:
             current_timestamp = record[self.model.modified_field]
         else:
-            current_timestamp = self.model.timestamp()
+            current_timestamp = self.timestamp
 
         if current_timestamp == if_none_match:
             response = HTTPNotModified()
@@ -851,7 +915,7 @@ class UserResource:
         if record:
             current_timestamp = record[self.model.modified_field]
         else:
-            current_timestamp = self.model.timestamp()
+            current_timestamp = self.timestamp
 
         if current_timestamp != modified_since:
             error_msg = 'Resource was modified meanwhile'
@@ -951,13 +1015,7 @@ class UserResource:
                 )
                 continue
 
-            allKeywords = '|'.join([i.name.lower() for i in COMPARISON])
-            m = re.match(r'^('+allKeywords+')_([\w\.]+)$', param)
-            if m:
-                keyword, field = m.groups()
-                operator = getattr(COMPARISON, keyword.upper())
-            else:
-                operator, field = COMPARISON.EQ, param
+            operator, field = _parse_filter_param(param)
 
             if not self.is_known_field(field):
                 error_msg = "Unknown filter field '{}'".format(param)
@@ -985,11 +1043,10 @@ class UserResource:
         specified = self.request.validated['querystring'].get('_sort', [])
         sorting = []
         modified_field_used = self.model.modified_field in specified
-        for field in specified:
-            field = field.strip()
-            m = re.match(r'^([\-+]?)([\w\.]+)$', field)
-            if m:
-                order, field = m.groups()
+        for specified_field in specified:
+            parsed = _parse_sort_field(specified_field)
+            if parsed:
+                field, direction = parsed
 
                 if not self.is_known_field(field):
                     error_details = {
@@ -998,7 +1055,6 @@ class UserResource:
                     }
                     raise_invalid(self.request, **error_details)
 
-                direction = -1 if order == '-' else 1
                 sorting.append(Sort(field, direction))
 
         if not modified_field_used:
@@ -1035,32 +1091,61 @@ class UserResource:
 
         return self._build_pagination_rules(next_sorting, last_record, rules)
 
-    def _extract_pagination_rules_from_token(self, limit, sorting):
-        """Get pagination params."""
+    def _decode_pagination_token(self):
+        """Return the content of the pagination token from the querystring,
+        or ``None``.
+
+        :raises: :exc:`~pyramid:pyramid.httpexceptions.HTTPBadRequest`
+            if the token is malformed or its signature is invalid.
+        """
         token = self.request.validated['querystring'].get('_token', None)
+        if not token:
+            return None
+        try:
+            tokeninfo = json.loads(decode64(token))
+            if not isinstance(tokeninfo, dict):
+                raise ValueError()
+            if 'last_record' not in tokeninfo or 'offset' not in tokeninfo:
+                raise KeyError()
+            signature = tokeninfo.pop('signature', None)
+            if signature is not None and signature != self._sign_pagination_token(tokeninfo):
+                raise ValueError()
+        except (ValueError, KeyError, TypeError):
+            error_msg = '_token has invalid content'
+            error_details = {
+                'location': 'querystring',
+                'description': error_msg
+            }
+            raise_invalid(self.request, **error_details)
+        # Tokens built by previous versions are not signed.
+        tokeninfo['signed'] = signature is not None
+        return tokeninfo
+
+    def _extract_pagination_rules_from_token(self, tokeninfo, sorting):
+        """Get pagination params from the decoded pagination token."""
         filters = []
         offset = 0
-        if token:
-            try:
-                tokeninfo = json.loads(decode64(token))
-                if not isinstance(tokeninfo, dict):
-                    raise ValueError()
-                last_record = tokeninfo['last_record']
-                offset = tokeninfo['offset']
-            except (ValueError, KeyError, TypeError):
-                error_msg = '_token has invalid content'
-                error_details = {
-                    'location': 'querystring',
-                    'description': error_msg
-                }
-                raise_invalid(self.request, **error_details)
-
-            filters = self._build_pagination_rules(sorting, last_record)
+        if tokeninfo:
+            offset = tokeninfo['offset']
+            filters = self._build_pagination_rules(sorting, tokeninfo['last_record'])
         return filters, offset
 
-    def _next_page_url(self, sorting, limit, last_record, offset):
+    def _extract_pagination_snapshot(self, tokeninfo, filters, sorting):
+        """Return the collection timestamp and the total number of records
+        observed on the first page, if the decoded pagination token carries
+        them for the same filters and sorting.
+        """
+        if not tokeninfo or not tokeninfo['signed'] or 'query' not in tokeninfo:
+            return None
+        if tokeninfo['query'] != self._query_fingerprint(filters, sorting):
+            return None
+        return {'timestamp': tokeninfo['timestamp'], 'total': tokeninfo['total']}
+
+    def _next_page_url(self, sorting, limit, last_record, offset, filters=None,
+                       snapshot=None):
         """Build the Next-Page header from where we stopped."""
-        token = self._build_pagination_token(sorting, last_record, offset)
+        token = self._build_pagination_token(sorting, last_record, offset,
+                                             filters=filters, snapshot=snapshot)
 
         params = {**request_GET(self.request), '_limit': limit, '_token': token}
 
@@ -1069,12 +1154,17 @@ class UserResource:
                                                **self.request.matchdict)
         return next_page_url
 
-    def _build_pagination_token(self, sorting, last_record, offset):
+    def _build_pagination_token(self, sorting, last_record, offset, filters=None,
+                                snapshot=None):
         """Build a pagination token.
 
         It is a base64 JSON object with the sorting fields values of
         the last_record.
 
+        If a ``snapshot`` of the first page (collection timestamp and total
+        number of records) is provided, it is carried along with a fingerprint
+        of the ``filters`` and ``sorting``, and the token is signed.
+
         """
         token = {
             'last_record': {},
@@ -1086,8 +1176,29 @@ class UserResource:
             if last_value is not None:
                 token['last_record'][field] = last_value
 
+        if snapshot is not None:
+            token['query'] = self._query_fingerprint(filters or [], sorting)
+            token['timestamp'] = snapshot['timestamp']
+            token['total'] = snapshot['total']
+            token['signature'] = self._sign_pagination_token(token)
+
         return encode64(json.dumps(token))
 
+    def _query_fingerprint(self, filters, sorting):
+        """Return a short hash of the user, endpoint, filters and sorting of
+        the current request.
+        """
+        query = [self.request.prefixed_userid, self.request.path,
+                 [(f.field, f.value, f.operator.value) for f in filters],
+                 [(field, direction) for field, direction in sorting]]
+        return hashlib.sha1(json.dumps(query).encode('utf-8')).hexdigest()[:16]
+
+    def _sign_pagination_token(self, tokeninfo):
+        """Return the signature of the pagination token content."""
+        secret = self.request.registry.settings['userid_hmac_secret']
+        content = json.dumps(tokeninfo, sort_keys=True)
+        return hmac_digest(secret, content)[:16]
+
 
 class ShareableResource(UserResource):
     """Shareable resources allow to set permissions on records, in order to
@@ -1144,6 +1255,25 @@ class ShareableResource(UserResource):
 
         return filters
 
+    def collection_get(self):
+        """Add the permissions of the listed records in the response body, if
+        requested with ``?_expand=permissions``.
+
+        They are fetched for the whole page at once, and listed in the same
+        order as the records.
+        """
+        body = super().collection_get()
+
+        expand = self.request.validated['querystring'].get('_expand', [])
+        if 'permissions' in expand:
+            annotated = self.model.annotate_records(body['data'])
+            body['permissions'] = [
+                {k: list(p) for k, p in r[self.model.permissions_field].items()}
+                for r in annotated
+            ]
+
+        return body
+
     def _raise_412_if_modified(self, record=None):
         """Do not provide the permissions among the record fields.
         Ref: https://github.com/Kinto/kinto/issues/224
@@ -49,7 +49,7 @@ class Model:
             auth=self.auth)
 
     def get_records(self, filters=None, sorting=None, pagination_rules=None,
-                    limit=None, include_deleted=False, parent_id=None):
+                    limit=None, include_deleted=False, parent_id=None, fields=None):
         """Fetch the collection records.
 
         Override to post-process records after feching them from storage.
@@ -81,11 +81,16 @@ class Model:
 
         :param str parent_id: optional filter for parent id
 
+        :param list fields: optional list of fields to read from the records
+            (see :meth:`kinto.core.storage.StorageBase.get_all`).
+
         :returns: A tuple with the list of records in the current page,
             the total number of records in the result set.
         :rtype: tuple
         """
         parent_id = parent_id or self.parent_id
+        # Only pass the hint if specified, since older backends don't support it.
+        extras = {'fields': fields} if fields is not None else {}
         records, total_records = self.storage.get_all(
             collection_id=self.collection_id,
             parent_id=parent_id,
@@ -97,9 +102,55 @@ class Model:
             id_field=self.id_field,
             modified_field=self.modified_field,
             deleted_field=self.deleted_field,
-            auth=self.auth)
+            auth=self.auth,
+            **extras)
         return records, total_records
 
+    def get_records_with_timestamp(self, filters=None, sorting=None, pagination_rules=None,
+                                   limit=None, include_deleted=False, parent_id=None,
+                                   fields=None, with_count=True):
+        """Fetch the collection records, along with the collection current
+        timestamp if the storage can obtain it in the same round trip.
+
+        See :meth:`get_records` for the parameters. If ``with_count`` is
+        ``False``, the total number of records may not be computed (``None``).
+
+        If :meth:`get_records` is overridden, the records are fetched through
+        it, and the timestamp is left to :meth:`timestamp`.
+
+        :returns: A tuple with the list of records in the current page,
+            the total number of records in the result set, and the collection
+            timestamp (or ``None`` if it has to be fetched with :meth:`timestamp`).
+        :rtype: tuple
+        """
+        if type(self).get_records is not Model.get_records:
+            # Only pass the hint if specified, since older overrides don't support it.
+            extras = {'fields': fields} if fields is not None else {}
+            records, total_records = self.get_records(filters=filters,
+                                                      sorting=sorting,
+                                                      pagination_rules=pagination_rules,
+                                                      limit=limit,
+                                                      include_deleted=include_deleted,
+                                                      parent_id=parent_id,
+                                                      **extras)
+            return records, total_records, None
+
+        parent_id = parent_id or self.parent_id
+        return self.storage.get_all_with_timestamp(
+            collection_id=self.collection_id,
+            parent_id=parent_id,
+            filters=filters,
+            sorting=sorting,
+            pagination_rules=pagination_rules,
+            limit=limit,
+            include_deleted=include_deleted,
+            id_field=self.id_field,
+            modified_field=self.modified_field,
+            deleted_field=self.deleted_field,
+            auth=self.auth,
+            fields=fields,
+            with_count=with_count)
+
     def delete_records(self, filters=None, sorting=None, pagination_rules=None,
                        limit=None, parent_id=None):
         """Delete multiple collection records.
@@ -267,15 +318,17 @@ class ShareableModel(Model):
         self.current_principal = None
         self.prefixed_principals = None
 
-    def _allow_write(self, perm_object_id):
-        """Helper to give the ``write`` permission to the current user.
+    def _apply_permissions(self, perm_object_id, permissions):
+        """Helper to replace the specified permissions and give the ``write``
+        permission to the current user, returning the resulting permissions.
         """
-        self.permission.add_principal_to_ace(perm_object_id,
-                                             'write',
-                                             self.current_principal)
+        return self.permission.apply_object_permissions(perm_object_id,
+                                                        permissions,
+                                                        owner=self.current_principal)
 
-    def _annotate(self, record, perm_object_id):
-        permissions = self.permission.get_object_permissions(perm_object_id)
+    def _annotate(self, record, perm_object_id, permissions=None):
+        if permissions is None:
+            permissions = self.permission.get_object_permissions(perm_object_id)
         # Permissions are not returned if user only has read permission.
         writers = permissions.get('write', [])
         principals = self.prefixed_principals + [self.current_principal]
@@ -285,6 +338,18 @@ class ShareableModel(Model):
         annotated = {**record, self.permissions_field: permissions}
         return annotated
 
+    def annotate_records(self, records):
+        """Fetch the permissions of the specified records in one call, and add
+        them to the returned records.
+        """
+        perm_object_ids = [self.get_permission_object_id(object_id=r[self.id_field])
+                           for r in records]
+        if not perm_object_ids:
+            return []
+        permissions = self.permission.get_objects_permissions(perm_object_ids)
+        return [self._annotate(record, perm_object_id, perms)
+                for record, perm_object_id, perms in zip(records, perm_object_ids, permissions)]
+
     def delete_records(self, filters=None, sorting=None, pagination_rules=None,
                        limit=None, parent_id=None):
         """Delete permissions when collection records are deleted in bulk.
@@ -316,10 +381,9 @@ class ShareableModel(Model):
         record = super().create_record(record, parent_id, ignore_conflict=ignore_conflict)
         record_id = record[self.id_field]
         perm_object_id = self.get_permission_object_id(record_id)
-        self.permission.replace_object_permissions(perm_object_id, permissions)
-        self._allow_write(perm_object_id)
+        permissions = self._apply_permissions(perm_object_id, permissions)
 
-        return self._annotate(record, perm_object_id)
+        return self._annotate(record, perm_object_id, permissions)
 
     def update_record(self, record, parent_id=None):
         """Update record and the specified permissions.
@@ -333,10 +397,9 @@ class ShareableModel(Model):
         record = super().update_record(record, parent_id)
         record_id = record[self.id_field]
         perm_object_id = self.get_permission_object_id(record_id)
-        self.permission.replace_object_permissions(perm_object_id, permissions)
-        self._allow_write(perm_object_id)
+        permissions = self._apply_permissions(perm_object_id, permissions)
 
-        return self._annotate(record, perm_object_id)
+        return self._annotate(record, perm_object_id, permissions)
 
     def delete_record(self, record_id, parent_id=None, last_modified=None):
         """Delete record and its associated permissions.
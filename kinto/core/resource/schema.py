@@ -11,6 +11,11 @@ POSTGRESQL_MAX_INTEGER_VALUE = 2**63
 
 positive_big_integer = colander.Range(min=0, max=POSTGRESQL_MAX_INTEGER_VALUE)
 
+# Stateless nodes, used on every request to deserialize values which are not
+# part of a schema (e.g. arbitrary permissions or querystring filters).
+_principals_list = colander.SequenceSchema(colander.SchemaNode(colander.String()))
+_field_list = FieldList()
+
 
 class TimeStamp(TimeStamp):
     """This schema is deprecated, you shoud use `kinto.core.schema.TimeStamp` instead."""
@@ -132,9 +137,8 @@ class PermissionsSchema(colander.SchemaNode):
 
         # Else deserialize the fields that are not on the schema
         permissions = {}
-        perm_schema = colander.SequenceSchema(colander.SchemaNode(colander.String()))
         for perm, principals in cstruct.items():
-            permissions[perm] = perm_schema.deserialize(principals)
+            permissions[perm] = _principals_list.deserialize(principals)
 
         return permissions
 
@@ -202,7 +206,7 @@ class QuerySchema(colander.MappingSchema):
         for k, v in cstruct.items():
             # Deserialize lists used on in_ and exclude_ filters
             if k.startswith('in_') or k.startswith('exclude_'):
-                as_list = FieldList().deserialize(v)
+                as_list = _field_list.deserialize(v)
                 values[k] = [native_value(v) for v in as_list]
             else:
                 values[k] = native_value(v)
@@ -234,6 +238,7 @@ class CollectionGetQuerySchema(CollectionQuerySchema):
     """Querystring schema for GET collection requests."""
 
     _fields = FieldList()
+    _expand = FieldList(validator=colander.ContainsOnly(['permissions']))
 
 
 # Body Schemas
@@ -269,6 +274,37 @@ class RecordSchema(colander.MappingSchema):
         return colander.Mapping(unknown='raise')
 
 
+class SchemalessDataSchema(colander.MappingSchema):
+    """Record data of resources whose schema declares no field.
+
+    Colander would copy every value of the payload deeply, although they are
+    kept verbatim. Only the type of the payload is checked here.
+    """
+
+    @staticmethod
+    def schema_type():
+        return colander.Mapping(unknown='preserve')
+
+    @staticmethod
+    def accepts(node):
+        """Return ``True`` if the specified schema node keeps any mapping as it is.
+
+        :param node: a bound or unbound resource schema instance.
+        :rtype: bool
+        """
+        return (not node.children and
+                type(node.typ) is colander.Mapping and
+                node.typ.unknown == 'preserve' and
+                node.validator is None and
+                node.preparer is None and
+                type(node).deserialize is colander.SchemaNode.deserialize)
+
+    def deserialize(self, cstruct=colander.null):
+        if not isinstance(cstruct, dict):
+            return super().deserialize(cstruct)
+        return {**cstruct}
+
+
 class JsonPatchOperationSchema(colander.MappingSchema):
     """Single JSON Patch Operation."""
 
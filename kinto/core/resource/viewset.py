@@ -9,8 +9,8 @@ from kinto.core import authorization
 
 from .schema import (PermissionsSchema, RequestSchema, PayloadRequestSchema,
                      PatchHeaderSchema, CollectionQuerySchema, CollectionGetQuerySchema,
-                     RecordGetQuerySchema, RecordSchema, ResourceReponses,
-                     ShareableResourseResponses)
+                     RecordGetQuerySchema, RecordSchema, SchemalessDataSchema,
+                     ResourceReponses, ShareableResourseResponses)
 
 
 CONTENT_TYPES = ["application/json"]
@@ -111,6 +111,8 @@ class ViewSet:
     def update(self, **kwargs):
         """Update viewset attributes with provided values."""
         self.__dict__.update(**kwargs)
+        # Arguments may have changed, schemas have to be bound again.
+        self._bound_schemas = {}
 
     def get_view_arguments(self, endpoint_type, resource_cls, method):
         """Return the Pyramid/Cornice view arguments for the given endpoint
@@ -133,18 +135,23 @@ class ViewSet:
         endpoint_args = getattr(self, by_method, {})
         args.update(**endpoint_args)
 
-        request_schema = args.get('schema', RequestSchema())
-        record_schema = self.get_record_schema(resource_cls, method)
-        request_schema = request_schema.bind(body=record_schema)
-        response_schemas = self.responses.get_and_bind(endpoint_type, method,
-                                                       record=record_schema)
+        # Binding clones the whole schema tree. The viewset is instantiated
+        # once per resource class, so bind once and reuse on every app setup.
+        cache_key = (endpoint_type, resource_cls, method.lower())
+        try:
+            request_schema, response_schemas = self._bound_schemas[cache_key]
+        except KeyError:
+            request_schema = args.get('schema', RequestSchema())
+            record_schema = self.get_record_schema(resource_cls, method)
+            request_schema = request_schema.bind(body=record_schema)
+            response_schemas = self.responses.get_and_bind(endpoint_type, method,
+                                                           record=record_schema)
+            self._bound_schemas[cache_key] = (request_schema, response_schemas)
 
         args['schema'] = request_schema
         args['response_schemas'] = response_schemas
 
-        validators = args.get('validators', [])
-        validators.append(colander_validator)
-        args['validators'] = validators
+        args['validators'] = [*args.get('validators', []), colander_validator]
 
         return args
 
@@ -160,7 +167,12 @@ class ViewSet:
                 warnings.warn(message, DeprecationWarning)
                 resource_schema = resource_cls.mapping.__class__
 
-        record_schema = RecordSchema().bind(data=resource_schema())
+        data_schema = resource_schema()
+        # Schemaless records are passed through, only the envelope is validated.
+        if SchemalessDataSchema.accepts(data_schema):
+            data_schema = SchemalessDataSchema()
+
+        record_schema = RecordSchema().bind(data=data_schema)
 
         return record_schema
 
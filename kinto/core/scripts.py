@@ -1,16 +1,93 @@
 """
 kinto.core.scripts: utilities to build admin scripts for kinto-based services
 """
+import io
 import logging
 
 import transaction as current_transaction
 from pyramid.settings import asbool
 
 from kinto.core.storage import exceptions as storage_exceptions
+from kinto.core.utils import json
 
 
 logger = logging.getLogger(__name__)
 
+# Tables dumped by the ``export`` and ``import`` commands, in the order they
+# have to be restored. The collections timestamps are restored last, since
+# inserting records and tombstones bumps them.
+EXPORTED_TABLES = (
+    ('storage', 'records', 'ORDER BY last_modified'),
+    ('storage', 'deleted', 'ORDER BY last_modified'),
+    ('storage', 'timestamps', ''),
+    ('permission', 'user_principals', ''),
+    ('permission', 'access_control_entries', ''),
+)
+
+# All the tables of a database are exported within the same snapshot.
+EXPORT_TRANSACTION = 'SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY, DEFERRABLE;'
+
+IMPORT_QUERIES = {
+    'records': ("""
+    INSERT INTO records (id, parent_id, collection_id, last_modified, data)
+    SELECT line->>'id', line->>'parent_id', line->>'collection_id',
+           (line->>'last_modified')::TIMESTAMP, line->'data'
+      FROM import_lines
+     ORDER BY (line->>'last_modified')::TIMESTAMP;
+    """, """
+    UPDATE records
+       SET last_modified = (line->>'last_modified')::TIMESTAMP
+      FROM import_lines
+     WHERE id = line->>'id'
+       AND parent_id = line->>'parent_id'
+       AND collection_id = line->>'collection_id'
+       AND last_modified <> (line->>'last_modified')::TIMESTAMP;
+    """),
+    'deleted': ("""
+    INSERT INTO deleted (id, parent_id, collection_id, last_modified)
+    SELECT line->>'id', line->>'parent_id', line->>'collection_id',
+           (line->>'last_modified')::TIMESTAMP
+      FROM import_lines
+     ORDER BY (line->>'last_modified')::TIMESTAMP;
+    """, """
+    UPDATE deleted
+       SET last_modified = (line->>'last_modified')::TIMESTAMP
+      FROM import_lines
+     WHERE id = line->>'id'
+       AND parent_id = line->>'parent_id'
+       AND collection_id = line->>'collection_id'
+       AND last_modified <> (line->>'last_modified')::TIMESTAMP;
+    """),
+    'timestamps': ("""
+    INSERT INTO timestamps (parent_id, collection_id, last_modified)
+    SELECT line->>'parent_id', line->>'collection_id',
+           (line->>'last_modified')::TIMESTAMP
+      FROM import_lines
+    ON CONFLICT (parent_id, collection_id) DO UPDATE
+       SET last_modified = EXCLUDED.last_modified;
+    """,),
+    'user_principals': ("""
+    INSERT INTO user_principals (user_id, principal)
+    SELECT line->>'user_id', line->>'principal'
+      FROM import_lines
+    ON CONFLICT DO NOTHING;
+    """,),
+    'access_control_entries': ("""
+    INSERT INTO access_control_entries (object_id, permission, principal)
+    SELECT line->>'object_id', line->>'permission', line->>'principal'
+      FROM import_lines
+    ON CONFLICT DO NOTHING;
+    """,),
+}
+
+# With these unlikely quote and delimiter characters, the CSV format of
+# ``COPY`` leaves the JSON lines untouched (the text format escapes backslashes).
+COPY_OPTIONS = "(FORMAT csv, QUOTE E'\\x01', DELIMITER E'\\x02')"
+
+DEFAULT_IMPORT_BATCH_SIZE = 5000
+
+PROGRESS_STEP = 100000
+
 
 def migrate(env, dry_run=False):
     """
@@ -88,3 +165,142 @@ def delete_collection(env, bucket_id, collection_id):
     current_transaction.commit()
 
     return 0
+
+
+def _postgresql_clients(registry):
+    """Return the PostgreSQL clients of the storage and permission backends,
+    or ``None`` if one of them is not PostgreSQL.
+    """
+    clients = {}
+    for backend in ('storage', 'permission'):
+        client = getattr(getattr(registry, backend, None), 'client', None)
+        if client is None:
+            message = ('The {} backend must be PostgreSQL to export or '
+                       'import data.'.format(backend))
+            logger.error(message)
+            return None
+        clients[backend] = client
+    return clients
+
+
+class _ProgressWriter:
+    """File-like wrapper that counts the written lines and shows progress."""
+
+    def __init__(self, output, table):
+        self.output = output
+        self.table = table
+        self.count = 0
+
+    def write(self, data):
+        # psycopg2 only sends text to ``io.TextIOBase`` instances.
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        self.output.write(data)
+        before = self.count
+        self.count += data.count('\n')
+        if self.count // PROGRESS_STEP > before // PROGRESS_STEP:
+            logger.info('{} {} row(s) exported...'.format(self.count, self.table))
+
+
+def export_data(env, output):
+    """
+    Stream the content of the PostgreSQL storage and permission backends
+    to the specified file, as JSON lines.
+    """
+    registry = env['registry']
+    clients = _postgresql_clients(registry)
+    if clients is None:
+        return 61
+
+    # Group the tables by client (preserving their order), so that each
+    # database is exported from a single consistent snapshot.
+    groups = []
+    for backend, table, order in EXPORTED_TABLES:
+        client = clients[backend]
+        if not groups or groups[-1][0] is not client:
+            groups.append((client, []))
+        groups[-1][1].append((table, order))
+
+    for client, tables in groups:
+        with client.connect(readonly=True) as conn:
+            cursor = conn.connection().connection.cursor()
+            cursor.execute(EXPORT_TRANSACTION)
+            for table, order in tables:
+                query = """
+                COPY (SELECT json_build_object('table', '{table}', 'row', row_to_json(t))
+                        FROM {table} AS t
+                      {order})
+                  TO STDOUT WITH {options};
+                """.format(table=table, order=order, options=COPY_OPTIONS)
+                writer = _ProgressWriter(output, table)
+                cursor.copy_expert(query, writer)
+                logger.info('{} {} row(s) exported.'.format(writer.count, table))
+
+    return 0
+
+
+def _import_lines(client, table, lines):
+    with client.connect() as conn:
+        conn.execute("""
+        CREATE TEMPORARY TABLE import_lines (line JSONB) ON COMMIT DROP;
+        """)
+        cursor = conn.connection().connection.cursor()
+        cursor.copy_expert('COPY import_lines FROM STDIN WITH {};'.format(COPY_OPTIONS),
+                           io.StringIO(''.join(lines)))
+        for query in IMPORT_QUERIES[table]:
+            conn.execute(query)
+    current_transaction.commit()
+
+
+def import_data(env, input_file, batch_size=None):
+    """
+    Load the JSON lines produced by :func:`export_data` into the PostgreSQL
+    storage and permission backends, by chunks committed in separate
+    transactions.
+
+    The ``last_modified`` values of records and tombstones, as well as
+    collections timestamps, are restored exactly.
+    """
+    registry = env['registry']
+    settings = registry.settings
+    readonly_mode = asbool(settings.get('readonly', False))
+
+    if readonly_mode:
+        message = ('Cannot import data while in readonly mode.')
+        logger.error(message)
+        return 62
+
+    clients = _postgresql_clients(registry)
+    if clients is None:
+        return 61
+
+    backends = {table: backend for backend, table, _ in EXPORTED_TABLES}
+    batch_size = batch_size or DEFAULT_IMPORT_BATCH_SIZE
+
+    current_table = None
+    counts = {}
+    lines = []
+    for line in input_file:
+        if not line.strip():
+            continue
+        exported = json.loads(line)
+        table = exported['table']
+        if table not in backends:
+            logger.error("Unknown table '{}'.".format(table))
+            return 63
+        if lines and (table != current_table or len(lines) >= batch_size):
+            _import_lines(clients[backends[current_table]], current_table, lines)
+            lines = []
+        current_table = table
+        lines.append(json.dumps(exported['row']) + '\n')
+        counts[table] = counts.get(table, 0) + 1
+        if counts[table] % PROGRESS_STEP == 0:
+            logger.info('{} {} row(s) imported...'.format(counts[table], table))
+
+    if lines:
+        _import_lines(clients[backends[current_table]], current_table, lines)
+
+    for table, count in counts.items():
+        logger.info('{} {} row(s) imported.'.format(count, table))
+
+    return 0
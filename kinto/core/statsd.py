@@ -29,12 +29,18 @@ class Client:
     def timer(self, key):
         return self._client.timer(key)
 
+    def timing(self, key, value):
+        return self._client.timing(key, value)
+
     def count(self, key, unique=None):
         if unique is None:
             return self._client.incr(key, count=1)
         else:
             return self._client.set(key, unique)
 
+    def gauge(self, key, value):
+        return self._client.gauge(key, value)
+
 
 def statsd_count(request, count_key):
     statsd = request.registry.statsd
@@ -204,7 +204,7 @@ class StorageBase:
         """
         raise NotImplementedError
 
-    def purge_deleted(self, collection_id, parent_id, before=None,
+    def purge_deleted(self, collection_id, parent_id, before=None, limit=None,
                       id_field=DEFAULT_ID_FIELD,
                       modified_field=DEFAULT_MODIFIED_FIELD,
                       auth=None):
@@ -215,6 +215,8 @@ class StorageBase:
         :param str parent_id: the collection parent.
 
         :param int before: Optionnal timestamp to limit deletion (exclusive)
+        :param int limit: Optionnal maximum number of tombstones to delete,
+            in order to purge them in several chunks.
 
         :returns: The number of deleted objects.
         :rtype: int
@@ -227,7 +229,7 @@ class StorageBase:
                 id_field=DEFAULT_ID_FIELD,
                 modified_field=DEFAULT_MODIFIED_FIELD,
                 deleted_field=DEFAULT_DELETED_FIELD,
-                auth=None):
+                auth=None, fields=None):
         """Retrieve all objects in this `collection_id` for this `parent_id`.
 
         :param str collection_id: the collection id.
@@ -258,12 +260,71 @@ class StorageBase:
         :param bool include_deleted: Optionnally include the deleted objects
             that match the filters.
 
+        :param list fields: Optionnally, the fields to read from the objects
+            (as in ``_fields``). This is a hint to reduce the amount of data
+            read: backends may return other fields too (e.g. the ones used for
+            sorting).
+
         :returns: the limited list of objects, and the total number of
             matching objects in the collection (deleted ones excluded).
         :rtype: tuple
         """
         raise NotImplementedError
 
+    def get_all_with_timestamp(self, collection_id, parent_id, filters=None, sorting=None,
+                               pagination_rules=None, limit=None, include_deleted=False,
+                               id_field=DEFAULT_ID_FIELD,
+                               modified_field=DEFAULT_MODIFIED_FIELD,
+                               deleted_field=DEFAULT_DELETED_FIELD,
+                               auth=None, fields=None, with_count=True):
+        """Same as :meth:`get_all`, but also return the current timestamp of
+        the collection if it can be obtained along with the objects (e.g. in
+        the same database query).
+
+        :param bool with_count: if ``False``, the backend may skip counting
+            the matching objects, and return ``None`` instead.
+
+        :returns: the limited list of objects, the total number of matching
+            objects in the collection (deleted ones excluded), and the
+            collection timestamp or ``None`` if it has to be obtained with
+            :meth:`collection_timestamp`.
+        :rtype: tuple
+        """
+        # ``fields`` is only a hint, and may not be supported by ``get_all()``.
+        objects, count = self.get_all(collection_id, parent_id, filters=filters,
+                                      sorting=sorting, pagination_rules=pagination_rules,
+                                      limit=limit, include_deleted=include_deleted,
+                                      id_field=id_field, modified_field=modified_field,
+                                      deleted_field=deleted_field, auth=auth)
+        return objects, count, None
+
+    def iter_all(self, collection_id, parent_id, filters=None, sorting=None,
+                 pagination_rules=None, limit=None, include_deleted=False,
+                 id_field=DEFAULT_ID_FIELD,
+                 modified_field=DEFAULT_MODIFIED_FIELD,
+                 deleted_field=DEFAULT_DELETED_FIELD,
+                 auth=None, fields=None):
+        """Same as :meth:`get_all`, but yield the objects as they are read
+        from the backend, without holding them all in memory.
+
+        Unlike :meth:`get_all`, the total number of matching objects is not
+        computed, and the number of objects is not capped by the
+        ``storage_max_fetch_size`` setting.
+
+        .. note::
+
+            The iteration must be completed within the current transaction.
+
+        :rtype: generator
+        """
+        # ``fields`` is only a hint, and may not be supported by ``get_all()``.
+        objects, _ = self.get_all(collection_id, parent_id, filters=filters,
+                                  sorting=sorting, pagination_rules=pagination_rules,
+                                  limit=limit, include_deleted=include_deleted,
+                                  id_field=id_field, modified_field=modified_field,
+                                  deleted_field=deleted_field, auth=auth)
+        yield from objects
+
 
 def heartbeat(backend):
     def ping(request):
@@ -203,7 +203,7 @@ class Storage(MemoryBasedStorage):
         return existing
 
     @synchronized
-    def purge_deleted(self, collection_id, parent_id, before=None,
+    def purge_deleted(self, collection_id, parent_id, before=None, limit=None,
                       id_field=DEFAULT_ID_FIELD,
                       modified_field=DEFAULT_MODIFIED_FIELD,
                       auth=None):
@@ -216,14 +216,14 @@ class Storage(MemoryBasedStorage):
             if collection_id is not None:
                 collections = {collection_id: collections[collection_id]}
             for collection, colrecords in collections.items():
-                if before is None:
-                    kept = {}
-                else:
-                    kept = {key: value for key, value in
-                            colrecords.items()
-                            if value[modified_field] >= before}
-                self._cemetery[pid][collection] = kept
-                num_deleted += (len(colrecords) - len(kept))
+                purged = [key for key, value in colrecords.items()
+                          if before is None or value[modified_field] < before]
+                if limit is not None:
+                    purged = purged[:limit - num_deleted]
+                self._cemetery[pid][collection] = {key: value for key, value in
+                                                   colrecords.items()
+                                                   if key not in purged}
+                num_deleted += len(purged)
         return num_deleted
 
     @synchronized
@@ -232,7 +232,7 @@ class Storage(MemoryBasedStorage):
                 id_field=DEFAULT_ID_FIELD,
                 modified_field=DEFAULT_MODIFIED_FIELD,
                 deleted_field=DEFAULT_DELETED_FIELD,
-                auth=None):
+                auth=None, fields=None):
 
         records = _get_objects_by_parent_id(self._store, parent_id, collection_id)
 
@@ -249,6 +249,22 @@ class Storage(MemoryBasedStorage):
                                                  pagination_rules=pagination_rules, limit=limit)
         return records, count
 
+    @synchronized
+    def get_all_with_timestamp(self, collection_id, parent_id, filters=None, sorting=None,
+                               pagination_rules=None, limit=None, include_deleted=False,
+                               id_field=DEFAULT_ID_FIELD,
+                               modified_field=DEFAULT_MODIFIED_FIELD,
+                               deleted_field=DEFAULT_DELETED_FIELD,
+                               auth=None, fields=None, with_count=True):
+        timestamp = self._timestamps[parent_id].get(collection_id)
+        records, count = self.get_all(collection_id, parent_id, filters=filters,
+                                      sorting=sorting, pagination_rules=pagination_rules,
+                                      limit=limit, include_deleted=include_deleted,
+                                      id_field=id_field, modified_field=modified_field,
+                                      deleted_field=deleted_field, auth=auth,
+                                      fields=fields)
+        return records, count, timestamp
+
     @synchronized
     def delete_all(self, collection_id, parent_id, filters=None,
                    sorting=None, pagination_rules=None, limit=None,
@@ -290,7 +306,7 @@ def extract_record_set(records, filters, sorting,
         values = list(apply_filters(filtered, rule))
         paginated.update(dict(((x[id_field], x) for x in values)))
 
-    if paginated:
+    if pagination_rules:
         paginated = paginated.values()
     else:
         paginated = filtered
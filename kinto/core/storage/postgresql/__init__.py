@@ -1,17 +1,91 @@
+import functools
+import hashlib
 import logging
 import os
+import re
 import warnings
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, namedtuple
+
+from pyramid.settings import asbool
 
 from kinto.core.storage import (
-    StorageBase, exceptions,
+    StorageBase, Filter, exceptions,
     DEFAULT_ID_FIELD, DEFAULT_MODIFIED_FIELD, DEFAULT_DELETED_FIELD)
 from kinto.core.storage.postgresql.client import create_from_config
-from kinto.core.utils import COMPARISON, json, is_numeric
+from kinto.core.utils import COMPARISON, json, is_numeric, sqlalchemy
 
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct query shapes whose SQL is kept in memory.
+QUERIES_CACHE_SIZE = 512
+
+# Number of server-side prepared statements kept on each connection.
+PREPARED_STATEMENTS_PER_CONNECTION = 64
+
+# Number of rows transferred at once when iterating over records.
+ITER_BATCH_SIZE = 1000
+
+# Same as SQLAlchemy ``text()`` (e.g. ``:parent_id`` but not ``::JSONB``).
+_BIND_PARAMS_REGEXP = re.compile(r'(?<![:\w\x5c]):(\w+)(?!:)')
+
+PreparedStatement = namedtuple('PreparedStatement', ['name', 'prepare', 'execute'])
+
+
+@functools.lru_cache(maxsize=QUERIES_CACHE_SIZE)
+def _text(query):
+    """Return the SQLAlchemy clause for this query text, parsed only once."""
+    return sqlalchemy.text(query)
+
+
+@functools.lru_cache(maxsize=QUERIES_CACHE_SIZE)
+def _prepared_statement(query):
+    """Return the server-side ``PREPARE`` and ``EXECUTE`` clauses for this
+    query text, whose named placeholders become positional parameters.
+    """
+    params = []
+
+    def positional(match):
+        name = match.group(1)
+        if name not in params:
+            params.append(name)
+        return '${}'.format(params.index(name) + 1)
+
+    sql = _BIND_PARAMS_REGEXP.sub(positional, query).strip().rstrip(';')
+    name = 'kinto_{}'.format(hashlib.md5(sql.encode('utf-8')).hexdigest())
+    prepare = 'PREPARE {} AS {};'.format(name, sql)
+    execute = 'EXECUTE {}'.format(name)
+    if params:
+        execute += '({})'.format(', '.join(':{}'.format(p) for p in params))
+    return PreparedStatement(name, _text(prepare), _text(execute + ';'))
+
+
+def _pagination_row(pagination_rules):
+    """Return the filters of the row-value comparison that is equivalent to
+    these pagination rules, or ``None``.
+
+    The rules built for a sorting on ``(f1, f2)`` in descending order are
+    ``(f1 = x AND f2 < y) OR (f1 < x)``, which is ``(f1, f2) < (x, y)``.
+    Sortings with mixed directions cannot be expressed this way.
+    """
+    if not pagination_rules:
+        return None
+
+    row = pagination_rules[0]
+    operator = row[-1].operator
+    if operator not in (COMPARISON.LT, COMPARISON.GT) or len(pagination_rules) != len(row):
+        return None
+
+    for i, rule in enumerate(pagination_rules):
+        expected = row[:len(row) - i]
+        if [(f.field, f.value) for f in rule] != [(f.field, f.value) for f in expected]:
+            return None
+        operators = [COMPARISON.EQ] * (len(rule) - 1) + [operator]
+        if [f.operator for f in rule] != operators:
+            return None
+
+    return [Filter(f.field, f.value, operator) for f in row]
+
 
 class Storage(StorageBase):
     """Storage backend using PostgreSQL.
@@ -60,20 +134,58 @@ class Storage(StorageBase):
     <http://docs.sqlalchemy.org/en/rel_1_0/core/engines.html>`_
     for default values and behaviour.
 
+    The most frequent queries can be prepared on the server side, once per
+    connection, in order to save their parsing and planning::
+
+        kinto.storage_prepared_statements = true
+
     .. note::
 
         Using a `dedicated connection pool <http://pgpool.net>`_ is still
         recommended to allow load balancing, replication or limit the number
         of connections used in a multi-process deployment.
 
+        Prepared statements are bound to a database session, and thus not
+        supported by poolers that share sessions per transaction (e.g.
+        *PgBouncer* in ``transaction`` mode).
+
     """  # NOQA
 
-    schema_version = 15
+    schema_version = 17
 
-    def __init__(self, client, max_fetch_size, *args, **kwargs):
+    def __init__(self, client, max_fetch_size, prepared_statements=False,
+                 *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.client = client
         self._max_fetch_size = max_fetch_size
+        self._prepared_statements = prepared_statements
+
+    def _execute(self, conn, query, placeholders=None):
+        """Execute the query on the connection, using a server-side prepared
+        statement if enabled.
+
+        Queries with a list of values (e.g. ``IN`` filters) are never prepared,
+        since their shape changes with the number of values.
+        """
+        placeholders = placeholders or {}
+        has_lists = any(isinstance(v, tuple) for v in placeholders.values())
+        if not self._prepared_statements or has_lists:
+            return conn.execute(_text(query), placeholders)
+
+        statement = _prepared_statement(query)
+        # This dictionary follows the DBAPI connection (and is cleared if invalidated).
+        # The number of query shapes depends on clients (filters, sorting...), hence
+        # the least recently used statements are deallocated on the server.
+        prepared = conn.connection().info.setdefault('prepared_statements', OrderedDict())
+        if statement.name in prepared:
+            prepared.move_to_end(statement.name)
+        else:
+            while len(prepared) >= PREPARED_STATEMENTS_PER_CONNECTION:
+                evicted, _ = prepared.popitem(last=False)
+                conn.execute('DEALLOCATE {};'.format(evicted))
+            conn.execute(statement.prepare)
+            prepared[statement.name] = True
+        return conn.execute(statement.execute, placeholders)
 
     def _execute_sql_file(self, filepath):
         with open(filepath) as f:
@@ -197,6 +309,7 @@ class Storage(StorageBase):
         query = """
         DELETE FROM deleted;
         DELETE FROM records;
+        DELETE FROM record_counts;
         DELETE FROM timestamps;
         DELETE FROM metadata;
         """
@@ -205,13 +318,27 @@ class Storage(StorageBase):
         logger.debug('Flushed PostgreSQL storage tables')
 
     def collection_timestamp(self, collection_id, parent_id, auth=None):
+        placeholders = dict(parent_id=parent_id, collection_id=collection_id)
+
+        # Cheap indexed read first, since the timestamp usually exists.
+        query = """
+        SELECT as_epoch(last_modified) AS last_modified
+          FROM timestamps
+         WHERE parent_id = :parent_id
+           AND collection_id = :collection_id;
+        """
+        with self.client.connect(readonly=True) as conn:
+            result = self._execute(conn, query, placeholders)
+            if result.rowcount > 0:
+                return result.fetchone()['last_modified']
+
+        # Otherwise, initialize it.
         query = """
         SELECT as_epoch(collection_timestamp(:parent_id, :collection_id))
             AS last_modified;
         """
-        placeholders = dict(parent_id=parent_id, collection_id=collection_id)
         with self.client.connect(readonly=False) as conn:
-            result = conn.execute(query, placeholders)
+            result = self._execute(conn, query, placeholders)
             record = result.fetchone()
         return record['last_modified']
 
@@ -270,7 +397,7 @@ class Storage(StorageBase):
                             last_modified=record.get(modified_field),
                             data=json.dumps(query_record))
         with self.client.connect() as conn:
-            result = conn.execute(query % safe_holders, placeholders)
+            result = self._execute(conn, query % safe_holders, placeholders)
             inserted = result.fetchone()
 
         record[modified_field] = inserted['last_modified']
@@ -291,7 +418,7 @@ class Storage(StorageBase):
                             parent_id=parent_id,
                             collection_id=collection_id)
         with self.client.connect(readonly=True) as conn:
-            result = conn.execute(query, placeholders)
+            result = self._execute(conn, query, placeholders)
             if result.rowcount == 0:
                 raise exceptions.RecordNotFoundError(object_id)
             else:
@@ -336,7 +463,7 @@ class Storage(StorageBase):
                             data=json.dumps(query_record))
 
         with self.client.connect() as conn:
-            result = conn.execute(query, placeholders)
+            result = self._execute(conn, query, placeholders)
             updated = result.fetchone()
 
         record = {**record, id_field: object_id}
@@ -378,7 +505,7 @@ class Storage(StorageBase):
                             last_modified=last_modified)
 
         with self.client.connect() as conn:
-            result = conn.execute(query, placeholders)
+            result = self._execute(conn, query, placeholders)
             if result.rowcount == 0:
                 raise exceptions.RecordNotFoundError(object_id)
             inserted = result.fetchone()
@@ -498,16 +625,25 @@ class Storage(StorageBase):
 
         return records
 
-    def purge_deleted(self, collection_id, parent_id, before=None,
+    def purge_deleted(self, collection_id, parent_id, before=None, limit=None,
                       id_field=DEFAULT_ID_FIELD,
                       modified_field=DEFAULT_MODIFIED_FIELD,
                       auth=None):
         query = """
+        WITH matching_tombstones AS (
+            SELECT id, parent_id, collection_id
+              FROM deleted
+             WHERE {parent_id_filter}
+                   {collection_id_filter}
+                   {conditions_filter}
+             {pagination_limit}
+        )
         DELETE
         FROM deleted
-        WHERE {parent_id_filter}
-              {collection_id_filter}
-              {conditions_filter};
+        USING matching_tombstones
+        WHERE deleted.id = matching_tombstones.id
+          AND deleted.parent_id = matching_tombstones.parent_id
+          AND deleted.collection_id = matching_tombstones.collection_id;
         """
         id_field = id_field or self.id_field
         modified_field = modified_field or self.modified_field
@@ -532,6 +668,10 @@ class Storage(StorageBase):
                 'AND as_epoch(last_modified) < :before')
             placeholders['before'] = before
 
+        if limit:
+            safeholders['pagination_limit'] = 'LIMIT :limit'
+            placeholders['limit'] = limit
+
         with self.client.connect() as conn:
             result = conn.execute(query.format_map(safeholders), placeholders)
 
@@ -542,22 +682,145 @@ class Storage(StorageBase):
                 id_field=DEFAULT_ID_FIELD,
                 modified_field=DEFAULT_MODIFIED_FIELD,
                 deleted_field=DEFAULT_DELETED_FIELD,
-                auth=None):
+                auth=None, fields=None):
+        records, count_total, _ = self._get_all(
+            collection_id, parent_id, filters=filters, sorting=sorting,
+            pagination_rules=pagination_rules, limit=limit,
+            include_deleted=include_deleted, id_field=id_field,
+            modified_field=modified_field, deleted_field=deleted_field,
+            fields=fields)
+        return records, count_total
+
+    def get_all_with_timestamp(self, collection_id, parent_id, filters=None, sorting=None,
+                               pagination_rules=None, limit=None, include_deleted=False,
+                               id_field=DEFAULT_ID_FIELD,
+                               modified_field=DEFAULT_MODIFIED_FIELD,
+                               deleted_field=DEFAULT_DELETED_FIELD,
+                               auth=None, fields=None, with_count=True):
+        # The timestamp of several parents cannot be obtained.
+        with_timestamp = '*' not in parent_id
+        return self._get_all(
+            collection_id, parent_id, filters=filters, sorting=sorting,
+            pagination_rules=pagination_rules, limit=limit,
+            include_deleted=include_deleted, id_field=id_field,
+            modified_field=modified_field, deleted_field=deleted_field,
+            fields=fields, with_timestamp=with_timestamp, with_count=with_count)
+
+    def iter_all(self, collection_id, parent_id, filters=None, sorting=None,
+                 pagination_rules=None, limit=None, include_deleted=False,
+                 id_field=DEFAULT_ID_FIELD,
+                 modified_field=DEFAULT_MODIFIED_FIELD,
+                 deleted_field=DEFAULT_DELETED_FIELD,
+                 auth=None, fields=None):
+        query, placeholders, _ = self._format_get_all(
+            collection_id, parent_id, filters=filters, sorting=sorting,
+            pagination_rules=pagination_rules, limit=limit,
+            include_deleted=include_deleted, id_field=id_field,
+            modified_field=modified_field, deleted_field=deleted_field,
+            fields=fields, with_count=False)
+
+        with self.client.connect(readonly=True) as conn:
+            # Rows are transferred by batches from a named (server-side) cursor,
+            # as they are consumed.
+            connection = conn.connection().execution_options(stream_results=True)
+            result = connection.execute(_text(query), placeholders)
+            while True:
+                rows = result.fetchmany(ITER_BATCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    record = row['data']
+                    record[id_field] = row['id']
+                    record[modified_field] = row['last_modified']
+                    yield record
+
+    def _get_all(self, collection_id, parent_id, filters=None, sorting=None,
+                 pagination_rules=None, limit=None, include_deleted=False,
+                 id_field=DEFAULT_ID_FIELD,
+                 modified_field=DEFAULT_MODIFIED_FIELD,
+                 deleted_field=DEFAULT_DELETED_FIELD,
+                 fields=None, with_timestamp=False, with_count=True):
+        query, placeholders, sorting_sql = self._format_get_all(
+            collection_id, parent_id, filters=filters, sorting=sorting,
+            pagination_rules=pagination_rules, limit=limit,
+            include_deleted=include_deleted, id_field=id_field,
+            modified_field=modified_field, deleted_field=deleted_field,
+            fields=fields, max_fetch_size=self._max_fetch_size,
+            with_count=with_count)
+
+        if with_timestamp:
+            # Read the existing collection timestamp in the same query. The
+            # outer join returns one row even if no record matches.
+            query = """
+            WITH collection_ts AS (
+                SELECT as_epoch(last_modified) AS collection_timestamp
+                  FROM timestamps
+                 WHERE parent_id = :parent_id
+                   AND collection_id = :collection_id
+            ),
+            page AS ({records_query})
+            SELECT collection_ts.collection_timestamp,
+                   {count_total} page.id, page.last_modified, page.data
+              FROM (SELECT 1) AS one
+              LEFT JOIN collection_ts ON TRUE
+              LEFT JOIN page ON TRUE
+              {sorting};
+            """.format(records_query=query.strip().rstrip(';'),
+                       count_total='page.count_total,' if with_count else '',
+                       sorting=sorting_sql)
+
+        with self.client.connect(readonly=True) as conn:
+            result = self._execute(conn, query, placeholders)
+            retrieved = result.fetchmany(self._max_fetch_size)
+
+        timestamp = None
+        if with_timestamp:
+            timestamp = retrieved[0]['collection_timestamp']
+            if retrieved[0]['id'] is None:
+                retrieved = []
+
+        if not len(retrieved):
+            return [], 0 if with_count else None, timestamp
+
+        count_total = retrieved[0]['count_total'] if with_count else None
+
+        records = []
+        for result in retrieved:
+            record = result['data']
+            record[id_field] = result['id']
+            record[modified_field] = result['last_modified']
+            records.append(record)
+
+        return records, count_total, timestamp
+
+    def _format_get_all(self, collection_id, parent_id, filters=None, sorting=None,
+                        pagination_rules=None, limit=None, include_deleted=False,
+                        id_field=DEFAULT_ID_FIELD,
+                        modified_field=DEFAULT_MODIFIED_FIELD,
+                        deleted_field=DEFAULT_DELETED_FIELD,
+                        fields=None, max_fetch_size=None, with_count=True):
+        """Format the query that lists the records, along with their total
+        count if ``with_count`` is true.
+
+        If ``fields`` are specified, only their root keys and the ones used
+        for sorting and pagination are read from the records JSONB documents.
+
+        :returns: the query, its placeholders and the ``ORDER BY`` clause.
+        :rtype: tuple
+        """
         query = """
         WITH total_filtered AS (
-            SELECT COUNT(id) AS count
-              FROM records
-             WHERE {parent_id_filter}
-               AND collection_id = :collection_id
-               {conditions_filter}
+            {count_query}
         ),
         collection_filtered AS (
-            SELECT id, last_modified, data
+            SELECT id, last_modified, {data_projection} AS data
               FROM records
              WHERE {parent_id_filter}
                AND collection_id = :collection_id
                {conditions_filter}
-             LIMIT {max_fetch_size}
+               {pagination_rules}
+             {page_sorting}
+             {max_fetch_limit}
         ),
         fake_deleted AS (
             SELECT (:deleted_field)::JSONB AS data
@@ -568,7 +831,9 @@ class Storage(StorageBase):
              WHERE {parent_id_filter}
                AND collection_id = :collection_id
                {conditions_filter}
-               {deleted_limit}
+               {pagination_rules}
+             {page_sorting}
+             {deleted_limit}
         ),
         all_records AS (
             SELECT * FROM filtered_deleted
@@ -578,12 +843,11 @@ class Storage(StorageBase):
         paginated_records AS (
             SELECT DISTINCT id
               FROM all_records
-              {pagination_rules}
         )
-        SELECT total_filtered.count AS count_total,
+        SELECT {count_total}
                a.id, as_epoch(a.last_modified) AS last_modified, a.data
-          FROM paginated_records AS p JOIN all_records AS a ON (a.id = p.id),
-               total_filtered
+          FROM paginated_records AS p JOIN all_records AS a ON (a.id = p.id)
+               {total_filtered}
           {sorting}
           {pagination_limit};
         """
@@ -596,7 +860,25 @@ class Storage(StorageBase):
 
         # Safe strings
         safeholders = defaultdict(str)
-        safeholders['max_fetch_size'] = self._max_fetch_size
+        safeholders['data_projection'] = 'data'
+
+        if fields:
+            fields = set(fields)
+            fields.update(s.field for s in sorting or [])
+            fields.update(f.field for rule in pagination_rules or [] for f in rule)
+            root_fields = {f.split('.')[0] for f in fields} - {id_field, modified_field}
+            # As an array, so that the query shape does not depend on it.
+            safeholders['data_projection'] = """
+            (SELECT COALESCE(jsonb_object_agg(key, value), '{}'::JSONB)
+               FROM jsonb_each(data)
+              WHERE key = ANY(:projected_fields))
+            """
+            placeholders['projected_fields'] = sorted(root_fields)
+
+        if with_count:
+            # The count is not computed if the CTE is not referenced.
+            safeholders['count_total'] = 'total_filtered.count AS count_total,'
+            safeholders['total_filtered'] = ', total_filtered'
 
         # Handle parent_id as a regex only if it contains *
         if '*' in parent_id:
@@ -612,8 +894,22 @@ class Storage(StorageBase):
             safeholders['conditions_filter'] = 'AND {}'.format(safe_sql)
             placeholders.update(**holders)
 
-        if not include_deleted:
-            safeholders['deleted_limit'] = 'LIMIT 0'
+        if filters or '*' in parent_id:
+            safeholders['count_query'] = """
+            SELECT COUNT(id) AS count
+              FROM records
+             WHERE {parent_id_filter}
+               AND collection_id = :collection_id
+               {conditions_filter}
+            """.format_map(safeholders)
+        else:
+            # Unfiltered listings read the counter maintained by triggers.
+            safeholders['count_query'] = """
+            SELECT COALESCE(MAX(count), 0) AS count
+              FROM record_counts
+             WHERE parent_id = :parent_id
+               AND collection_id = :collection_id
+            """
 
         if sorting:
             sql, holders = self._format_sorting(sorting, id_field,
@@ -624,30 +920,81 @@ class Storage(StorageBase):
         if pagination_rules:
             sql, holders = self._format_pagination(pagination_rules, id_field,
                                                    modified_field)
-            safeholders['pagination_rules'] = 'WHERE {}'.format(sql)
+            safeholders['pagination_rules'] = 'AND ({})'.format(sql)
             placeholders.update(**holders)
 
         if limit:
-            # We validate the limit value in the resource class as integer.
-            safeholders['pagination_limit'] = 'LIMIT {}'.format(limit)
+            # As a placeholder, so that the query shape does not depend on it.
+            safeholders['pagination_limit'] = 'LIMIT :pagination_limit'
+            placeholders['pagination_limit'] = limit
+
+        if limit and sorting:
+            # Only read the page from the records and tombstones (e.g. by
+            # scanning an index from the pagination rules).
+            safeholders['page_sorting'] = safeholders['sorting']
+            safeholders['max_fetch_limit'] = safeholders['pagination_limit']
+            safeholders['deleted_limit'] = safeholders['pagination_limit']
+        elif max_fetch_size:
+            safeholders['max_fetch_limit'] = 'LIMIT {}'.format(max_fetch_size)
 
-        with self.client.connect(readonly=True) as conn:
-            result = conn.execute(query.format_map(safeholders), placeholders)
-            retrieved = result.fetchmany(self._max_fetch_size)
+        if not include_deleted:
+            safeholders['deleted_limit'] = 'LIMIT 0'
 
-        if not len(retrieved):
-            return [], 0
+        return query.format_map(safeholders), placeholders, safeholders['sorting']
 
-        count_total = retrieved[0]['count_total']
+    def _format_operand(self, filtr, id_field, modified_field, prefix, index):
+        """Format the field of a filter in SQL, along with the value it is
+        compared to.
 
-        records = []
-        for result in retrieved:
-            record = result['data']
-            record[id_field] = result['id']
-            record[modified_field] = result['last_modified']
-            records.append(record)
+        :returns: A SQL string with placeholders, the value and a dict mapping
+            the field placeholders to actual field names.
+        :rtype: tuple
+        """
+        value = filtr.value
+        holders = {}
 
-        return records, count_total
+        if filtr.field == id_field:
+            sql_field = 'id'
+            if isinstance(value, int):
+                value = str(value)
+        elif filtr.field == modified_field:
+            sql_field = 'as_epoch(last_modified)'
+        else:
+            column_name = "data"
+            # Subfields: ``person.name`` becomes ``data->person->>name``
+            subfields = filtr.field.split('.')
+            for j, subfield in enumerate(subfields):
+                # Safely escape field name
+                field_holder = '{}_field_{}_{}'.format(prefix, index, j)
+                holders[field_holder] = subfield
+                # Use ->> to convert the last level to text.
+                column_name += "->>" if j == len(subfields) - 1 else "->"
+                column_name += ":{}".format(field_holder)
+
+            # If field is missing, we default to ''.
+            sql_field = "coalesce({}, '')".format(column_name)
+            # Cast when comparing to number (eg. '4' < '12')
+            try:
+                if value and (is_numeric(value) or all([is_numeric(v) for v in value])):
+                    sql_field = "({})::numeric".format(column_name)
+            except TypeError:  # not iterable
+                pass
+
+        if filtr.operator not in (COMPARISON.IN, COMPARISON.EXCLUDE):
+            # For the IN operator, let psycopg escape the values list.
+            # Otherwise JSON-ify the native value (e.g. True -> 'true')
+            if not isinstance(value, str):
+                value = json.dumps(value).strip('"')
+        else:
+            # If not all numeric, fallback to string comparison.
+            if not all([is_numeric(v) for v in value]):
+                value = [str(v) for v in value]
+            value = tuple(value)
+            # WHERE field IN ();  -- Fails with syntax error.
+            if len(value) == 0:
+                value = (None,)
+
+        return sql_field, value, holders
 
     def _format_conditions(self, filters, id_field, modified_field,
                            prefix='filters'):
@@ -675,48 +1022,12 @@ class Storage(StorageBase):
         conditions = []
         holders = {}
         for i, filtr in enumerate(filters):
-            value = filtr.value
-
-            if filtr.field == id_field:
-                sql_field = 'id'
-                if isinstance(value, int):
-                    value = str(value)
-            elif filtr.field == modified_field:
-                sql_field = 'as_epoch(last_modified)'
-            else:
-                column_name = "data"
-                # Subfields: ``person.name`` becomes ``data->person->>name``
-                subfields = filtr.field.split('.')
-                for j, subfield in enumerate(subfields):
-                    # Safely escape field name
-                    field_holder = '{}_field_{}_{}'.format(prefix, i, j)
-                    holders[field_holder] = subfield
-                    # Use ->> to convert the last level to text.
-                    column_name += "->>" if j == len(subfields) - 1 else "->"
-                    column_name += ":{}".format(field_holder)
-
-                # If field is missing, we default to ''.
-                sql_field = "coalesce({}, '')".format(column_name)
-                # Cast when comparing to number (eg. '4' < '12')
-                try:
-                    if value and (is_numeric(value) or all([is_numeric(v) for v in value])):
-                        sql_field = "({})::numeric".format(column_name)
-                except TypeError:  # not iterable
-                    pass
-
-            if filtr.operator not in (COMPARISON.IN, COMPARISON.EXCLUDE):
-                # For the IN operator, let psycopg escape the values list.
-                # Otherwise JSON-ify the native value (e.g. True -> 'true')
-                if not isinstance(value, str):
-                    value = json.dumps(value).strip('"')
-            else:
-                # If not all numeric, fallback to string comparison.
-                if not all([is_numeric(v) for v in value]):
-                    value = [str(v) for v in value]
-                value = tuple(value)
-                # WHERE field IN ();  -- Fails with syntax error.
-                if len(value) == 0:
-                    value = (None,)
+            sql_field, value, field_holders = self._format_operand(filtr,
+                                                                   id_field,
+                                                                   modified_field,
+                                                                   prefix=prefix,
+                                                                   index=i)
+            holders.update(**field_holders)
 
             if filtr.operator == COMPARISON.LIKE:
                 value = '%{}%'.format(value)
@@ -739,7 +1050,9 @@ class Storage(StorageBase):
 
         .. note::
 
-            All rules are combined using OR.
+            All rules are combined using OR, unless they can be expressed
+            as a single row-value comparison (see
+            :meth:`_format_pagination_row`).
 
         .. note::
 
@@ -749,6 +1062,10 @@ class Storage(StorageBase):
             placeholders to actual values.
         :rtype: tuple
         """
+        row = _pagination_row(pagination_rules)
+        if row:
+            return self._format_pagination_row(row, id_field, modified_field)
+
         rules = []
         placeholders = {}
 
@@ -764,6 +1081,47 @@ class Storage(StorageBase):
         safe_sql = ' OR '.join(['({})'.format(r) for r in rules])
         return safe_sql, placeholders
 
+    def _format_pagination_row(self, row, id_field, modified_field):
+        """Format the pagination rules of a sorting whose fields all have the
+        same direction as a row-value comparison, for example
+        ``(f1, f2, as_epoch(last_modified)) < (:a, :b, :c)``.
+
+        If the first sorting field is the modified field, a redundant bound on
+        the ``last_modified`` column allows the planner to scan the
+        ``(parent_id, collection_id, last_modified)`` index from the page start.
+
+        :returns: A SQL string with placeholders, and a dict mapping
+            placeholders to actual values.
+        :rtype: tuple
+        """
+        operator = row[0].operator
+        fields = []
+        values = []
+        holders = {}
+        for i, filtr in enumerate(row):
+            sql_field, value, field_holders = self._format_operand(filtr,
+                                                                   id_field,
+                                                                   modified_field,
+                                                                   prefix='rules',
+                                                                   index=i)
+            holders.update(**field_holders)
+            value_holder = 'rules_value_{}'.format(i)
+            holders[value_holder] = value
+            fields.append(sql_field)
+            values.append(':{}'.format(value_holder))
+
+        safe_sql = '({}) {} ({})'.format(', '.join(fields), operator.value, ', '.join(values))
+
+        if row[0].field == modified_field:
+            # ``as_epoch()`` rounds to the millisecond: bound with a margin.
+            if operator == COMPARISON.LT:
+                bound = "last_modified < from_epoch(:rules_value_0) + INTERVAL '1 millisecond'"
+            else:
+                bound = "last_modified > from_epoch(:rules_value_0) - INTERVAL '1 millisecond'"
+            safe_sql = '{} AND {}'.format(bound, safe_sql)
+
+        return safe_sql, holders
+
     def _format_sorting(self, sorting, id_field, modified_field):
         """Format the sorting in SQL, with placeholders for safe escaping.
 
@@ -805,5 +1163,7 @@ class Storage(StorageBase):
 def load_from_config(config):
     settings = config.get_settings()
     max_fetch_size = int(settings['storage_max_fetch_size'])
+    prepared_statements = asbool(settings.get('storage_prepared_statements', False))
     client = create_from_config(config, prefix='storage_')
-    return Storage(client=client, max_fetch_size=max_fetch_size)
+    return Storage(client=client, max_fetch_size=max_fetch_size,
+                   prepared_statements=prepared_statements)
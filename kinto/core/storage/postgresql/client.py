@@ -1,23 +1,55 @@
 import contextlib
+import hashlib
 import logging
+import random
+import re
+import threading
+import time
 import warnings
 from collections import defaultdict
 
+from pyramid.settings import aslist
+from pyramid.threadlocal import get_current_request
+
 from kinto.core.storage import exceptions
 from kinto.core.utils import sqlalchemy
 import transaction as zope_transaction
 
 
 logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger('postgresql.slow_query')
+
+# Literals and placeholders, that vary between queries of the same shape.
+_FINGERPRINT_SUBSTITUTIONS = (
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    (re.compile(r'%\(\w+\)s|%s|\$\d+|(?<![:\w]):\w+'), '?'),
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    # Lists of values (e.g. ``IN`` filters) whatever their length.
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(?)'),
+    (re.compile(r'\s+'), ' '),
+)
+
+
+# Requests that never write, whose reads can be routed to replicas.
+READONLY_METHODS = ('GET', 'HEAD')
 
 
 class PostgreSQLClient:
-    def __init__(self, session_factory, commit_manually, invalidate):
+    def __init__(self, session_factory, commit_manually, invalidate,
+                 replica_session_factories=None):
         self.session_factory = session_factory
         self.commit_manually = commit_manually
         self.invalidate = invalidate
+        self.replica_session_factories = replica_session_factories or []
+        # Keeps track of the transaction that wrote, for each thread.
+        self._written = threading.local()
+
+    @property
+    def pools(self):
+        """The connection pools of the primary and replicas engines."""
+        factories = [self.session_factory] + self.replica_session_factories
+        return [factory.session_factory.kw['bind'].pool for factory in factories]
 
-    @contextlib.contextmanager
     def connect(self, readonly=False, force_commit=False):
         """
         Pulls a connection from the pool when context is entered and
@@ -25,9 +57,53 @@ class PostgreSQLClient:
 
         A COMMIT is performed on the current transaction if everything went
         well. Otherwise transaction is ROLLBACK, and everything cleaned up.
+
+        If replicas are configured, read-only connections are pulled from
+        one of them, unless the current request may write or the current
+        transaction has already written on the primary (*read-your-writes*).
         """
+        if readonly and self.replica_session_factories and not self._pinned_to_primary():
+            return self._connect_replica()
+        return self._connect_primary(readonly, force_commit)
+
+    def _pinned_to_primary(self):
+        # The reads of requests that may write (e.g. current object to merge
+        # changes into, timestamps for preconditions, permissions) must not
+        # lag behind the primary.
+        request = get_current_request()
+        if request is not None and request.method not in READONLY_METHODS:
+            return True
+        return self._has_written()
+
+    def _has_written(self):
+        if self.commit_manually:
+            # Changes are committed as soon as the connection is released.
+            return False
+        return getattr(self._written, 'transaction', None) is zope_transaction.get()
+
+    @contextlib.contextmanager
+    def _connect_replica(self):
+        session = None
+        try:
+            # Pull connection from the pool of a random replica.
+            session_factory = random.choice(self.replica_session_factories)
+            session = session_factory()
+            yield session
+        except sqlalchemy.exc.SQLAlchemyError as e:
+            logger.error(e)
+            raise exceptions.BackendError(original=e) from e
+        finally:
+            if session:
+                # Nothing to commit, give back to pool.
+                session.close()
+
+    @contextlib.contextmanager
+    def _connect_primary(self, readonly=False, force_commit=False):
         commit_manually = self.commit_manually and not readonly
         session = None
+        if not readonly and not self.commit_manually:
+            # Subsequent reads of this transaction will hit the primary.
+            self._written.transaction = zope_transaction.get()
         try:
             # Pull connection from pool.
             session = self.session_factory()
@@ -59,6 +135,63 @@ class PostgreSQLClient:
                 session.close()
 
 
+def normalize_query(statement):
+    """Return the shape of the specified SQL statement, where literals and
+    placeholders are replaced by ``?``.
+
+    :rtype: str
+    """
+    for regexp, replacement in _FINGERPRINT_SUBSTITUTIONS:
+        statement = regexp.sub(replacement, statement)
+    return statement.strip()
+
+
+def _request_origin():
+    """Return the resource name and the endpoint of the current request, if any."""
+    request = get_current_request()
+    if request is None or request.matched_route is None:
+        return None, None
+    endpoint = '{} {}'.format(request.method, request.matched_route.pattern)
+    try:
+        resource_name = request.current_resource_name
+    except AttributeError:
+        # Not a kinto.core resource (e.g. heartbeat).
+        resource_name = None
+    return resource_name, endpoint
+
+
+def _setup_slow_query_log(engine, threshold_ms):
+    """Log the queries executed on this engine that take more than the
+    specified number of milliseconds.
+    """
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info['query_started_at'] = time.perf_counter()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = (time.perf_counter() - conn.info.pop('query_started_at')) * 1000
+        if duration < threshold_ms:
+            return
+
+        query = normalize_query(statement)
+        fingerprint = hashlib.md5(query.encode('utf-8')).hexdigest()[:12]
+        if executemany:
+            params = sum(len(p) for p in parameters)
+        else:
+            params = len(parameters or ())
+        resource_name, endpoint = _request_origin()
+        message = 'Slow query {} ({:.0f} ms): {}'.format(fingerprint, duration, query)
+        slow_query_logger.warning(message, extra=dict(fingerprint=fingerprint,
+                                                      query=query,
+                                                      t=round(duration),
+                                                      params=params,
+                                                      rows=cursor.rowcount,
+                                                      resource_name=resource_name,
+                                                      endpoint=endpoint))
+
+    sqlalchemy.event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    sqlalchemy.event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+
+
 # Reuse existing client if same URL.
 _CLIENTS = defaultdict(dict)
 
@@ -80,6 +213,9 @@ def create_from_config(config, prefix='', with_transaction=True):
     settings.pop(prefix + 'max_fetch_size', None)
     settings.pop(prefix + 'max_size_bytes', None)
     settings.pop(prefix + 'prefix', None)
+    settings.pop(prefix + 'prepared_statements', None)
+    replica_urls = aslist(settings.pop(prefix + 'replica_urls', None) or '')
+    slow_query_threshold = settings.pop(prefix + 'slow_query_threshold_ms', None)
     transaction_per_request = with_transaction and settings.pop('transaction_per_request', False)
 
     url = settings[prefix + 'url']
@@ -96,6 +232,7 @@ def create_from_config(config, prefix='', with_transaction=True):
                                         'pool.QueuePoolWithMaxBacklog'))
     settings[poolclass_key] = config.maybe_dotted(settings[poolclass_key])
     engine = sqlalchemy.engine_from_config(settings, prefix=prefix, url=url)
+    engines = [engine]
 
     # Initialize thread-safe session factory.
     options = {}
@@ -104,8 +241,21 @@ def create_from_config(config, prefix='', with_transaction=True):
         options['extension'] = ZopeTransactionExtension()
     session_factory = scoped_session(sessionmaker(bind=engine, **options))
 
+    # Replicas are only read from, and never take part in the transaction.
+    replica_session_factories = []
+    for replica_url in replica_urls:
+        replica_engine = sqlalchemy.engine_from_config(settings, prefix=prefix,
+                                                       url=replica_url)
+        replica_session_factories.append(scoped_session(sessionmaker(bind=replica_engine)))
+        engines.append(replica_engine)
+
+    if slow_query_threshold is not None:
+        for bind in engines:
+            _setup_slow_query_log(bind, float(slow_query_threshold))
+
     # Store one client per URI.
     commit_manually = (not transaction_per_request)
-    client = PostgreSQLClient(session_factory, commit_manually, invalidate)
+    client = PostgreSQLClient(session_factory, commit_manually, invalidate,
+                              replica_session_factories=replica_session_factories)
     _CLIENTS[transaction_per_request][url] = client
     return client
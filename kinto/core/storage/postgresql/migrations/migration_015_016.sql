@@ -0,0 +1,55 @@
+-- Prevent writes while the counters are initialized.
+LOCK TABLE records IN SHARE MODE;
+
+--
+-- Number of records of each collection, maintained by triggers.
+--
+CREATE TABLE IF NOT EXISTS record_counts (
+  parent_id TEXT NOT NULL,
+  collection_id TEXT NOT NULL,
+  count BIGINT NOT NULL,
+  PRIMARY KEY (parent_id, collection_id)
+);
+
+--
+-- Trigger to maintain the number of records on INSERT/DELETE
+--
+DROP TRIGGER IF EXISTS tgr_records_count ON records;
+
+CREATE OR REPLACE FUNCTION count_records()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO record_counts (parent_id, collection_id, count)
+        VALUES (NEW.parent_id, NEW.collection_id, 1)
+        ON CONFLICT (parent_id, collection_id) DO UPDATE
+          SET count = record_counts.count + 1;
+    ELSE
+        UPDATE record_counts
+           SET count = count - 1
+         WHERE parent_id = OLD.parent_id
+           AND collection_id = OLD.collection_id;
+        -- Do not keep the counters of emptied (or purged) collections.
+        DELETE FROM record_counts
+         WHERE parent_id = OLD.parent_id
+           AND collection_id = OLD.collection_id
+           AND count <= 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tgr_records_count
+AFTER INSERT OR DELETE ON records
+FOR EACH ROW EXECUTE PROCEDURE count_records();
+
+INSERT INTO record_counts (parent_id, collection_id, count)
+SELECT parent_id, collection_id, COUNT(*)
+  FROM records
+ GROUP BY parent_id, collection_id
+ON CONFLICT (parent_id, collection_id) DO UPDATE
+  SET count = EXCLUDED.count;
+
+
+-- Bump storage schema version.
+INSERT INTO metadata (name, value) VALUES ('storage_schema_version', '16');
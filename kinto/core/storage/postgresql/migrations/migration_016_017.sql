@@ -0,0 +1,63 @@
+CREATE OR REPLACE FUNCTION bump_timestamp()
+RETURNS trigger AS $$
+DECLARE
+    previous TIMESTAMP;
+    current TIMESTAMP;
+
+BEGIN
+    --
+    -- This bumps the current timestamp to 1 msec after the previous one if
+    -- it is not higher (or higher if was bumped already).
+    --
+    -- If a bunch of requests from the same user on the same collection
+    -- arrive in the same millisecond, the unicity constraint can raise
+    -- an error (operation is cancelled).
+    -- See https://github.com/mozilla-services/cliquet/issues/25
+    --
+    IF NEW.last_modified IS NULL THEN
+        -- Most common case: a single upsert reads, locks and bumps the
+        -- collection timestamp, which becomes the record's one.
+        INSERT INTO timestamps (parent_id, collection_id, last_modified)
+        VALUES (NEW.parent_id, NEW.collection_id, clock_timestamp())
+        ON CONFLICT (parent_id, collection_id) DO UPDATE
+          SET last_modified = GREATEST(EXCLUDED.last_modified,
+                                       timestamps.last_modified + INTERVAL '1 milliseconds')
+        RETURNING last_modified INTO NEW.last_modified;
+
+        RETURN NEW;
+    END IF;
+
+    -- Lock the collection timestamp, concurrent writers could otherwise
+    -- compute theirs from the same previous value.
+    previous := NULL;
+    SELECT last_modified INTO previous
+      FROM timestamps
+     WHERE parent_id = NEW.parent_id
+       AND collection_id = NEW.collection_id
+       FOR UPDATE;
+
+    current := GREATEST(clock_timestamp(), previous + INTERVAL '1 milliseconds');
+
+    IF previous IS NOT NULL AND as_epoch(NEW.last_modified) = as_epoch(previous) THEN
+        -- If the one specified is equal to previous, bump it.
+        NEW.last_modified := current;
+    ELSIF previous IS NULL OR NEW.last_modified > previous THEN
+        -- Use record last-modified as collection timestamp.
+        current := NEW.last_modified;
+    END IF;
+
+    --
+    -- Upsert current collection timestamp.
+    --
+    INSERT INTO timestamps (parent_id, collection_id, last_modified)
+    VALUES (NEW.parent_id, NEW.collection_id, current)
+    ON CONFLICT (parent_id, collection_id) DO UPDATE
+      SET last_modified = current;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+
+-- Bump storage schema version.
+INSERT INTO metadata (name, value) VALUES ('storage_schema_version', '17');
@@ -13,6 +13,7 @@ class _QueueWithMaxBacklog(Queue):
     def __init__(self, maxsize=0, max_backlog=-1):
         self.max_backlog = max_backlog
         self.cur_backlog = 0
+        self.rejected = 0
         Queue.__init__(self, maxsize)
 
     def get(self, block=True, timeout=None):
@@ -20,12 +21,18 @@ class _QueueWithMaxBacklog(Queue):
         # so it's safe to acquire it both here and in the superclass method.
         with self.mutex:
             self.cur_backlog += 1
+            rejecting = False
             try:
                 if self.max_backlog >= 0:
                     if self.cur_backlog > self.max_backlog:
                         block = False
                         timeout = None
+                        rejecting = True
                 return Queue.get(self, block, timeout)
+            except Exception:
+                if rejecting:
+                    self.rejected += 1
+                raise
             finally:
                 self.cur_backlog -= 1
 
@@ -42,14 +49,60 @@ class QueuePoolWithMaxBacklog(QueuePool):
     of threads that can be in the queue waiting for a connection.  Once this
     limit has been reached, any further attempts to acquire a connection will
     be rejected immediately.
+
+    The pool usage can be inspected with :meth:`stats`, and reported to StatsD
+    once a client was provided with :meth:`instrument`.
     """
 
     def __init__(self, creator, max_backlog=-1, **kwds):
         QueuePool.__init__(self, creator, **kwds)
         self._pool = _QueueWithMaxBacklog(self._pool.maxsize, max_backlog)
+        self._statsd = None
+        self._statsd_prefix = None
 
     def recreate(self):
         new_self = QueuePool.recreate(self)
         new_self._pool = _QueueWithMaxBacklog(self._pool.maxsize,
                                               self._pool.max_backlog)
+        new_self._statsd = self._statsd
+        new_self._statsd_prefix = self._statsd_prefix
         return new_self
+
+    def instrument(self, statsd_client, prefix):
+        """Report the pool usage to StatsD on every connection checkout.
+
+        :param statsd_client: a :class:`kinto.core.statsd.Client` instance.
+        :param str prefix: the prefix of the StatsD keys (e.g. ``pool.storage``).
+        """
+        self._statsd = statsd_client
+        self._statsd_prefix = prefix
+
+    def stats(self):
+        """Return the current usage of the pool.
+
+        :rtype: dict
+        """
+        return {
+            'size': self.size(),
+            'checked_out': self.checkedout(),
+            'overflow': max(0, self.overflow()),
+            'backlog': self._pool.cur_backlog,
+            'max_backlog': self._pool.max_backlog,
+            'rejected': self._pool.rejected,
+        }
+
+    def _do_get(self):
+        if self._statsd is None:
+            return QueuePool._do_get(self)
+
+        rejected = self._pool.rejected
+        try:
+            with self._statsd.timer('{}.wait'.format(self._statsd_prefix)):
+                return QueuePool._do_get(self)
+        finally:
+            if self._pool.rejected > rejected:
+                self._statsd.count('{}.rejected'.format(self._statsd_prefix))
+            self._statsd.gauge('{}.checked_out'.format(self._statsd_prefix),
+                               self.checkedout())
+            self._statsd.gauge('{}.backlog'.format(self._statsd_prefix),
+                               self._pool.cur_backlog)
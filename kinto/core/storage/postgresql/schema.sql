@@ -66,6 +66,16 @@ CREATE TABLE IF NOT EXISTS timestamps (
   PRIMARY KEY (parent_id, collection_id)
 );
 
+--
+-- Number of records of each collection, maintained by triggers.
+--
+CREATE TABLE IF NOT EXISTS record_counts (
+  parent_id TEXT NOT NULL,
+  collection_id TEXT NOT NULL,
+  count BIGINT NOT NULL,
+  PRIMARY KEY (parent_id, collection_id)
+);
+
 
 --
 -- Helper that returns the current collection timestamp.
@@ -107,36 +117,45 @@ DECLARE
     current TIMESTAMP;
 
 BEGIN
-    previous := NULL;
-    SELECT last_modified INTO previous
-      FROM timestamps
-     WHERE parent_id = NEW.parent_id
-       AND collection_id = NEW.collection_id;
-
     --
-    -- This bumps the current timestamp to 1 msec in the future if the previous
-    -- timestamp is equal to the current one (or higher if was bumped already).
+    -- This bumps the current timestamp to 1 msec after the previous one if
+    -- it is not higher (or higher if was bumped already).
     --
     -- If a bunch of requests from the same user on the same collection
     -- arrive in the same millisecond, the unicity constraint can raise
     -- an error (operation is cancelled).
     -- See https://github.com/mozilla-services/cliquet/issues/25
     --
-    current := clock_timestamp();
-    IF previous IS NOT NULL AND previous >= current THEN
-        current := previous + INTERVAL '1 milliseconds';
+    IF NEW.last_modified IS NULL THEN
+        -- Most common case: a single upsert reads, locks and bumps the
+        -- collection timestamp, which becomes the record's one.
+        INSERT INTO timestamps (parent_id, collection_id, last_modified)
+        VALUES (NEW.parent_id, NEW.collection_id, clock_timestamp())
+        ON CONFLICT (parent_id, collection_id) DO UPDATE
+          SET last_modified = GREATEST(EXCLUDED.last_modified,
+                                       timestamps.last_modified + INTERVAL '1 milliseconds')
+        RETURNING last_modified INTO NEW.last_modified;
+
+        RETURN NEW;
     END IF;
 
-    IF NEW.last_modified IS NULL OR
-       (previous IS NOT NULL AND as_epoch(NEW.last_modified) = as_epoch(previous)) THEN
-        -- If record does not carry last-modified, or if the one specified
-        -- is equal to previous, assign it to current (i.e. bump it).
+    -- Lock the collection timestamp, concurrent writers could otherwise
+    -- compute theirs from the same previous value.
+    previous := NULL;
+    SELECT last_modified INTO previous
+      FROM timestamps
+     WHERE parent_id = NEW.parent_id
+       AND collection_id = NEW.collection_id
+       FOR UPDATE;
+
+    current := GREATEST(clock_timestamp(), previous + INTERVAL '1 milliseconds');
+
+    IF previous IS NOT NULL AND as_epoch(NEW.last_modified) = as_epoch(previous) THEN
+        -- If the one specified is equal to previous, bump it.
         NEW.last_modified := current;
-    ELSE
+    ELSIF previous IS NULL OR NEW.last_modified > previous THEN
         -- Use record last-modified as collection timestamp.
-        IF previous IS NULL OR NEW.last_modified > previous THEN
-            current := NEW.last_modified;
-        END IF;
+        current := NEW.last_modified;
     END IF;
 
     --
@@ -159,6 +178,38 @@ CREATE TRIGGER tgr_deleted_last_modified
 BEFORE INSERT ON deleted
 FOR EACH ROW EXECUTE PROCEDURE bump_timestamp();
 
+--
+-- Trigger to maintain the number of records on INSERT/DELETE
+--
+DROP TRIGGER IF EXISTS tgr_records_count ON records;
+
+CREATE OR REPLACE FUNCTION count_records()
+RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO record_counts (parent_id, collection_id, count)
+        VALUES (NEW.parent_id, NEW.collection_id, 1)
+        ON CONFLICT (parent_id, collection_id) DO UPDATE
+          SET count = record_counts.count + 1;
+    ELSE
+        UPDATE record_counts
+           SET count = count - 1
+         WHERE parent_id = OLD.parent_id
+           AND collection_id = OLD.collection_id;
+        -- Do not keep the counters of emptied (or purged) collections.
+        DELETE FROM record_counts
+         WHERE parent_id = OLD.parent_id
+           AND collection_id = OLD.collection_id
+           AND count <= 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tgr_records_count
+AFTER INSERT OR DELETE ON records
+FOR EACH ROW EXECUTE PROCEDURE count_records();
+
 --
 -- Metadata table
 --
@@ -171,4 +222,4 @@ INSERT INTO metadata (name, value) VALUES ('created_at', NOW()::TEXT);
 
 -- Set storage schema version.
 -- Should match ``kinto.core.storage.postgresql.PostgreSQL.schema_version``
-INSERT INTO metadata (name, value) VALUES ('storage_schema_version', '15');
+INSERT INTO metadata (name, value) VALUES ('storage_schema_version', '17');
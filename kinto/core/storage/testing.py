@@ -78,6 +78,7 @@ class BaseTestStorage:
             (self.storage.delete_all, {}),
             (self.storage.purge_deleted, {}),
             (self.storage.get_all, {}),
+            (self.storage.get_all_with_timestamp, {}),
         ]
         for call, kwargs in calls:
             kwargs.update(**self.storage_kw)
@@ -331,6 +332,65 @@ class BaseTestStorage:
         self.assertEqual(total_records, 10)
         self.assertEqual(len(records), 2)
 
+    def test_iter_all_yields_all_values(self):
+        for x in range(10):
+            self.create_record({'number': x})
+
+        records = self.storage.iter_all(**self.storage_kw)
+        self.assertFalse(isinstance(records, list))
+        self.assertEqual(sorted(r['number'] for r in records), list(range(10)))
+
+    def test_iter_all_handles_filters_sorting_and_limit(self):
+        for x in range(10):
+            self.create_record({'number': x})
+
+        records = self.storage.iter_all(filters=[Filter('number', 3, utils.COMPARISON.GT)],
+                                        sorting=[Sort('number', -1)],
+                                        limit=2,
+                                        **self.storage_kw)
+        self.assertEqual([r['number'] for r in records], [9, 8])
+
+    def test_iter_all_yields_the_same_records_as_get_all(self):
+        for x in range(3):
+            self.create_record({'number': x})
+        deleted = self.create_record()
+        self.storage.delete(object_id=deleted['id'], **self.storage_kw)
+
+        records, _ = self.storage.get_all(include_deleted=True,
+                                          sorting=[Sort('last_modified', 1)],
+                                          **self.storage_kw)
+        iterated = self.storage.iter_all(include_deleted=True,
+                                         sorting=[Sort('last_modified', 1)],
+                                         **self.storage_kw)
+        self.assertEqual(list(iterated), records)
+
+    def test_get_all_can_restrict_the_fields_to_read(self):
+        self.create_record({'title': 'a', 'blob': {'size': 42}})
+        records, count = self.storage.get_all(fields=['title', 'unknown'],
+                                              **self.storage_kw)
+        self.assertEqual(count, 1)
+        self.assertEqual(records[0]['title'], 'a')
+        self.assertIn('id', records[0])
+        self.assertIn('last_modified', records[0])
+        self.assertNotIn('unknown', records[0])
+
+    def test_get_all_with_restricted_fields_can_sort_and_paginate(self):
+        for x in range(4):
+            self.create_record({'title': 'a', 'number': x})
+        sorting = [Sort('number', -1)]
+        pagination_rules = [[Filter('number', 3, utils.COMPARISON.LT)]]
+        records, _ = self.storage.get_all(fields=['title'], sorting=sorting,
+                                          pagination_rules=pagination_rules,
+                                          limit=2, **self.storage_kw)
+        self.assertEqual([r['number'] for r in records], [2, 1])
+
+    def test_get_all_with_restricted_fields_returns_tombstones(self):
+        record = self.create_record({'title': 'a'})
+        self.storage.delete(object_id=record['id'], **self.storage_kw)
+        records, _ = self.storage.get_all(fields=['title'], include_deleted=True,
+                                          **self.storage_kw)
+        self.assertTrue(records[0]['deleted'])
+
     def test_get_all_handle_sorting_on_id(self):
         for x in range(3):
             self.create_record()
@@ -525,6 +585,35 @@ class BaseTestStorage:
         self.assertEqual(total_records, 10)
         self.assertEqual(len(records), 4)
 
+    def test_get_all_pages_follow_the_sorting_on_several_fields(self):
+        for x in range(10):
+            self.create_record({'number': x % 3, 'name': 'n{}'.format(x % 4)})
+
+        for directions in [(1, 1), (-1, -1), (1, -1)]:
+            sorting = [Sort('number', directions[0]), Sort('name', directions[1]),
+                       Sort('last_modified', directions[1])]
+            expected, _ = self.storage.get_all(sorting=sorting, **self.storage_kw)
+
+            pages = []
+            rules = []
+            while True:
+                records, _ = self.storage.get_all(sorting=sorting, pagination_rules=rules,
+                                                  limit=3, **self.storage_kw)
+                if not records:
+                    break
+                pages.extend(records)
+                last = records[-1]
+                # Same rules as the ones built by the resource.
+                rules = []
+                for i in range(len(sorting), 0, -1):
+                    rule = [Filter(s.field, last[s.field], utils.COMPARISON.EQ)
+                            for s in sorting[:i - 1]]
+                    field, direction = sorting[i - 1]
+                    operator = utils.COMPARISON.LT if direction < 0 else utils.COMPARISON.GT
+                    rules.append(rule + [Filter(field, last[field], operator)])
+
+            self.assertEqual([r['id'] for r in pages], [r['id'] for r in expected])
+
 
 class TimestampsTest:
     def test_timestamp_are_incremented_on_create(self):
@@ -572,6 +661,37 @@ class TimestampsTest:
         # No duplicated timestamps
         self.assertEqual(len(set(obtained)), len(obtained))
 
+    def test_get_all_with_timestamp_returns_the_collection_timestamp(self):
+        self.create_record()
+        self.create_record()
+        records, count, timestamp = self.storage.get_all_with_timestamp(**self.storage_kw)
+        self.assertEqual(len(records), 2)
+        self.assertEqual(count, 2)
+        self.assertEqual(timestamp, self.storage.collection_timestamp(**self.storage_kw))
+
+    def test_get_all_with_timestamp_returns_the_timestamp_if_no_record_match(self):
+        self.create_record()
+        filters = [Filter('id', 'unknown', utils.COMPARISON.EQ)]
+        records, count, timestamp = self.storage.get_all_with_timestamp(filters=filters,
+                                                                        **self.storage_kw)
+        self.assertEqual(records, [])
+        self.assertEqual(count, 0)
+        self.assertEqual(timestamp, self.storage.collection_timestamp(**self.storage_kw))
+
+    def test_get_all_with_timestamp_returns_none_if_collection_never_written(self):
+        records, count, timestamp = self.storage.get_all_with_timestamp(**self.storage_kw)
+        self.assertEqual(records, [])
+        self.assertIsNone(timestamp)
+
+    def test_get_all_with_timestamp_keeps_sorting_and_limit(self):
+        for i in range(4):
+            self.create_record({'number': i})
+        sorting = [Sort('number', -1)]
+        records, count, _ = self.storage.get_all_with_timestamp(sorting=sorting, limit=3,
+                                                                **self.storage_kw)
+        self.assertEqual([r['number'] for r in records], [3, 2, 1])
+        self.assertEqual(count, 4)
+
     def test_the_timestamp_is_not_updated_when_collection_remains_empty(self):
         # Get timestamp once.
         first = self.storage.collection_timestamp(**self.storage_kw)
@@ -985,6 +1105,27 @@ class DeletedRecordsTest:
         num_removed = self.storage.purge_deleted(**self.storage_kw)
         self.assertEqual(num_removed, 0)
 
+    def test_purge_deleted_can_be_limited(self):
+        for i in range(3):
+            self.create_record()
+        self.storage.delete_all(**self.storage_kw)
+        num_removed = self.storage.purge_deleted(limit=2, **self.storage_kw)
+        self.assertEqual(num_removed, 2)
+        num_removed = self.storage.purge_deleted(limit=2, **self.storage_kw)
+        self.assertEqual(num_removed, 1)
+
+    def test_purge_deleted_limit_applies_across_parents(self):
+        self.create_record(parent_id='abc', collection_id='c')
+        self.create_record(parent_id='abd', collection_id='c')
+        self.storage.delete_all(parent_id='ab*', collection_id=None)
+        num_removed = self.storage.purge_deleted(parent_id='ab*',
+                                                 collection_id=None,
+                                                 limit=1)
+        self.assertEqual(num_removed, 1)
+        records, count = self.storage.get_all(parent_id='ab*', collection_id='c',
+                                              include_deleted=True)
+        self.assertEqual(len(records), 1)
+
     def test_purge_deleted_remove_with_before_remove_olders_exclusive(self):
         older = self.create_record()
         newer = self.create_record()
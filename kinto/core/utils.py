@@ -32,6 +32,48 @@ def json_serializer(v, **kw):
     return json.dumps(v, escape_forward_slashes=False)
 
 
+def json_stream(value, chunk_size=100):
+    """Encode the specified mapping as JSON, in successive chunks of bytes.
+
+    The items of its top-level lists (e.g. ``data`` in collection responses)
+    are encoded by groups of ``chunk_size``, so that the encoded body never
+    sits in memory at once.
+
+    :param dict value: the mapping to encode.
+    :param int chunk_size: the number of list items encoded per chunk.
+    :rtype: generator
+    """
+    if not value:
+        yield b'{}'
+        return
+
+    separator = b'{'
+    for key, item in value.items():
+        yield separator + json_serializer(key).encode('utf-8') + b':'
+        separator = b','
+        if not isinstance(item, list):
+            yield json_serializer(item).encode('utf-8')
+            continue
+        yield b'['
+        for i in range(0, len(item), chunk_size):
+            chunk = ','.join(json_serializer(v) for v in item[i:i + chunk_size])
+            yield (b',' if i else b'') + chunk.encode('utf-8')
+        yield b']'
+    yield b'}'
+
+
+def json_stream_serializer(v, threshold, **kw):
+    """Serialize the mappings that contain a list longer than ``threshold``
+    with :func:`json_stream`, and any other value with
+    :func:`json_serializer`.
+    """
+    if isinstance(v, dict):
+        lists = [item for item in v.values() if isinstance(item, list)]
+        if any(len(item) > threshold for item in lists):
+            return json_stream(v)
+    return json_serializer(v, **kw)
+
+
 def strip_whitespace(v):
     """Remove whitespace, newlines, and tabs from the beginning/end
     of a string.
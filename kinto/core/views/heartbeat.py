@@ -3,6 +3,8 @@ from concurrent.futures import ThreadPoolExecutor, wait
 
 import colander
 import transaction
+from pyramid import httpexceptions
+from pyramid.response import Response
 from pyramid.security import NO_PERMISSION_REQUIRED
 
 from kinto.core import Service
@@ -74,6 +76,12 @@ def get_heartbeat(request):
     if has_error:
         request.response.status = 503
 
+    # The connection pools usage is informative, and not part of the health checks.
+    pools = request.registry.heartbeat_pools
+    if pools:
+        status['pools'] = {name: [pool.stats() for pool in backend_pools]
+                           for name, backend_pools in pools.items()}
+
     return status
 
 
@@ -101,3 +109,29 @@ def get_lbheartbeat(request):
     """
     status = {}
     return status
+
+
+metrics = Service(name="metrics", path='/__metrics__',
+                  description="Server metrics")
+
+
+class MetricsResponseSchema(colander.MappingSchema):
+    body = colander.SchemaNode(colander.String())
+
+
+metrics_responses = {
+    '200': MetricsResponseSchema(
+        description="Return the metrics in the Prometheus text format.")
+}
+
+
+@metrics.get(permission=NO_PERMISSION_REQUIRED, tags=['Utilities'],
+             operation_id='__metrics__', response_schemas=metrics_responses)
+def get_metrics(request):
+    """Return the in-process metrics, if enabled (see ``metrics_enabled`` setting)."""
+    client = request.registry.metrics
+    if client is None:
+        raise httpexceptions.HTTPNotFound()
+
+    return Response(client.render(),
+                    content_type='text/plain; version=0.0.4', charset='utf-8')
@@ -10,6 +10,7 @@ from kinto.core.utils import (
     build_request, reapply_cors, hmac_digest, instance_uri, view_lookup)
 
 from kinto.authorization import RouteFactory
+from kinto.views import reclaim_pending_children
 from kinto.views.buckets import Bucket
 from kinto.views.collections import Collection
 
@@ -99,6 +100,9 @@ def resource_create_object(request, resource_cls, uri):
         }
         raise_invalid(resource.request, **error_details)
 
+    # Make sure the children of a previously deleted object are not resurrected.
+    reclaim_pending_children(request, uri)
+
     data = {'id': obj_id}
     obj = resource.model.create_record(data, ignore_conflict=True)
     # Since the current request is not a resource (but a straight Service),
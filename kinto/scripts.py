@@ -0,0 +1,100 @@
+"""
+kinto.scripts: admin scripts for Kinto objects
+"""
+import logging
+
+import transaction as current_transaction
+from pyramid.settings import asbool
+
+from kinto.core.utils import msec_time
+from kinto.views import reclaim_pending_deletions
+from kinto.views.records import get_tombstones_ttl, set_tombstones_horizon
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DELETION_BATCH_SIZE = 1000
+
+
+def reclaim_deleted(env, batch_size=None):
+    """
+    Delete the children of the buckets and collections that were marked for
+    deletion, by chunks committed in separate transactions.
+    """
+    registry = env['registry']
+    settings = registry.settings
+    readonly_mode = asbool(settings.get('readonly', False))
+
+    if readonly_mode:
+        message = ('Cannot reclaim deleted objects while in readonly mode.')
+        logger.error(message)
+        return 41
+
+    batch_size = (batch_size or
+                  int(settings.get('deletion_batch_size') or 0) or
+                  DEFAULT_DELETION_BATCH_SIZE)
+
+    reclaimed = reclaim_pending_deletions(registry.storage,
+                                          registry.permission,
+                                          batch_size=batch_size,
+                                          commit=current_transaction.commit)
+    if len(reclaimed) == 0:
+        logger.info('No deleted objects to reclaim.')
+    for object_uri in reclaimed:
+        logger.info("Children of '{}' were deleted.".format(object_uri))
+
+    return 0
+
+
+def compact_tombstones(env, batch_size=None):
+    """
+    Purge the records tombstones older than the retention duration configured
+    for their collection, by chunks committed in separate transactions.
+    """
+    registry = env['registry']
+    settings = registry.settings
+    storage = registry.storage
+    readonly_mode = asbool(settings.get('readonly', False))
+
+    if readonly_mode:
+        message = ('Cannot compact tombstones while in readonly mode.')
+        logger.error(message)
+        return 51
+
+    batch_size = batch_size or DEFAULT_DELETION_BATCH_SIZE
+    now = msec_time()
+
+    # Listings are not capped by ``storage_max_fetch_size`` with ``iter_all()``,
+    # but must be consumed before the transaction is committed.
+    buckets = storage.iter_all(collection_id='bucket', parent_id='', fields=['id'])
+    bucket_ids = [b['id'] for b in buckets]
+    for bucket_id in bucket_ids:
+        bucket_uri = '/buckets/{}'.format(bucket_id)
+        collections = storage.iter_all(collection_id='collection', parent_id=bucket_uri,
+                                       fields=['id'])
+        collection_ids = [c['id'] for c in collections]
+        for collection_id in collection_ids:
+            ttl = get_tombstones_ttl(settings, bucket_id, collection_id)
+            if ttl is None:
+                continue
+            collection_uri = '{}/collections/{}'.format(bucket_uri, collection_id)
+            before = now - ttl * 1000
+            # Advertise the purge before it happens, so that clients never
+            # obtain an incomplete set of changes.
+            set_tombstones_horizon(storage, collection_uri, before)
+            current_transaction.commit()
+
+            num_purged = 0
+            while True:
+                purged = storage.purge_deleted(collection_id='record',
+                                               parent_id=collection_uri,
+                                               before=before,
+                                               limit=batch_size)
+                current_transaction.commit()
+                num_purged += purged
+                if not purged:
+                    break
+            message = "{} tombstone(s) of '{}' were purged."
+            logger.info(message.format(num_purged, collection_uri))
+
+    return 0
@@ -6,6 +6,11 @@ from pyramid.httpexceptions import HTTPNotFound
 from kinto.core.errors import http_error, ERRORS
 
 
+# Storage collection where the objects whose children have to be
+# reclaimed are tracked.
+PENDING_DELETION_COLLECTION = 'pending_deletion'
+
+
 class NameGenerator(generators.Generator):
     def __call__(self):
         alpha_num = string.ascii_letters + string.digits
@@ -36,3 +41,119 @@ def object_exists_or_404(request, collection_id, object_id, parent_id=''):
         }
         response = http_error(HTTPNotFound(), errno=ERRORS.MISSING_RESOURCE, details=details)
         raise response
+
+
+def delete_children(request, object_uri):
+    """Delete the children of the deleted object, along with their tombstones
+    and permissions.
+
+    If the ``deletion_batch_size`` setting is set, the object is only marked
+    for deletion, and its children are reclaimed later in chunks of this size
+    (see :func:`reclaim_pending_deletions`). Their permissions are deleted
+    right away though, so that they are not listed among the accessible objects.
+    """
+    storage = request.registry.storage
+    permission = request.registry.permission
+    batch_size = int(request.registry.settings['deletion_batch_size'] or 0)
+
+    if not batch_size:
+        reclaim_children(storage, permission, object_uri)
+        return
+
+    permission.delete_object_permissions(object_uri + '/*')
+    try:
+        storage.create(collection_id=PENDING_DELETION_COLLECTION,
+                       parent_id='',
+                       record={'id': object_uri})
+    except exceptions.UnicityError:
+        # Already pending.
+        pass
+
+
+def reclaim_children(storage, permission, object_uri, batch_size=None, commit=None):
+    """Delete everything whose parent is the specified object, or one of
+    its children.
+
+    :param int batch_size: Optional maximum number of objects deleted per
+        storage call.
+    :param commit: Optional function called after each chunk, in order to
+        commit them in separate transactions.
+    """
+    commit = commit or (lambda: None)
+    descendants_pattern = object_uri + '/*'
+    for parent_id in (object_uri, descendants_pattern):
+        while True:
+            deleted = storage.delete_all(parent_id=parent_id,
+                                         collection_id=None,
+                                         limit=batch_size,
+                                         with_deleted=False)
+            commit()
+            if not batch_size or not deleted:
+                break
+        # Remove remaining tombstones too.
+        while True:
+            purged = storage.purge_deleted(parent_id=parent_id,
+                                           collection_id=None,
+                                           limit=batch_size)
+            commit()
+            if not batch_size or not purged:
+                break
+    # Remove related permissions.
+    permission.delete_object_permissions(descendants_pattern)
+    commit()
+
+
+def reclaim_pending_deletion(storage, permission, object_uri, batch_size=None, commit=None):
+    """Reclaim the children of the specified object, if it was marked for
+    deletion.
+
+    :returns: ``True`` if it was pending.
+    """
+    try:
+        storage.get(collection_id=PENDING_DELETION_COLLECTION,
+                    parent_id='',
+                    object_id=object_uri)
+    except exceptions.RecordNotFoundError:
+        return False
+
+    reclaim_children(storage, permission, object_uri, batch_size=batch_size, commit=commit)
+    storage.delete(collection_id=PENDING_DELETION_COLLECTION,
+                   parent_id='',
+                   object_id=object_uri,
+                   with_deleted=False)
+    if commit:
+        commit()
+    return True
+
+
+def reclaim_pending_children(request, object_uri):
+    """Before an object is created, reclaim the children of a previously
+    deleted object with the same URI, if still pending, so that they are not
+    resurrected.
+
+    This is done within the current request, by chunks of the
+    ``deletion_batch_size`` setting.
+    """
+    batch_size = int(request.registry.settings['deletion_batch_size'] or 0)
+    reclaim_pending_deletion(request.registry.storage,
+                             request.registry.permission,
+                             object_uri,
+                             batch_size=batch_size or None)
+
+
+def reclaim_pending_deletions(storage, permission, batch_size, commit=None):
+    """Reclaim the children of every object marked for deletion.
+
+    :returns: The list of reclaimed objects URIs.
+    """
+    # Not capped by ``storage_max_fetch_size``, and listed before the first
+    # chunk is committed.
+    pending = storage.iter_all(collection_id=PENDING_DELETION_COLLECTION,
+                               parent_id='', fields=['id'])
+    object_uris = [marker['id'] for marker in pending]
+    reclaimed = []
+    for object_uri in object_uris:
+        if reclaim_pending_deletion(storage, permission, object_uri,
+                                    batch_size=batch_size, commit=commit):
+            reclaimed.append(object_uri)
+    return reclaimed
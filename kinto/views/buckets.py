@@ -3,6 +3,8 @@ from kinto.core.utils import instance_uri
 from kinto.core.events import ResourceChanged, ACTIONS
 from pyramid.events import subscriber
 
+from kinto.views import delete_children, reclaim_pending_children
+
 
 @resource.register(name='bucket',
                    collection_path='/buckets',
@@ -14,6 +16,17 @@ class Bucket(resource.ShareableResource):
         # Buckets are not isolated by user, unlike Kinto-Core resources.
         return ''
 
+    def process_record(self, new, old=None):
+        """Make sure the children of a previously deleted bucket with the
+        same id are not resurrected, before it is created again.
+        """
+        new = super().process_record(new, old)
+        bucket_id = new.get(self.model.id_field)
+        if old is None and bucket_id is not None:
+            bucket_uri = instance_uri(self.request, 'bucket', id=bucket_id)
+            reclaim_pending_children(self.request, bucket_uri)
+        return new
+
 
 @subscriber(ResourceChanged,
             for_resources=('bucket',),
@@ -21,19 +34,8 @@ class Bucket(resource.ShareableResource):
 def on_buckets_deleted(event):
     """Some buckets were deleted, delete sub-resources.
     """
-    storage = event.request.registry.storage
-    permission = event.request.registry.permission
-
     for change in event.impacted_records:
         bucket = change['old']
         bucket_uri = instance_uri(event.request, 'bucket', id=bucket['id'])
         # Delete everything whose parent_id starts with bucket_uri.
-        parent_pattern = bucket_uri + '*'
-        storage.delete_all(parent_id=parent_pattern,
-                           collection_id=None,
-                           with_deleted=False)
-        # Remove remaining tombstones too.
-        storage.purge_deleted(parent_id=parent_pattern,
-                              collection_id=None)
-        # Remove related permissions
-        permission.delete_object_permissions(parent_pattern)
+        delete_children(event.request, bucket_uri)
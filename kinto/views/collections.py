@@ -5,6 +5,8 @@ from kinto.core.events import ResourceChanged, ACTIONS
 from jsonschema import exceptions as jsonschema_exceptions
 from pyramid.events import subscriber
 
+from kinto.views import delete_children, reclaim_pending_children
+
 
 class JSONSchemaMapping(colander.SchemaNode):
     def schema_type(self, **kw):
@@ -42,6 +44,19 @@ class Collection(resource.ShareableResource):
         parent_id = utils.instance_uri(request, 'bucket', id=bucket_id)
         return parent_id
 
+    def process_record(self, new, old=None):
+        """Make sure the records of a previously deleted collection with the
+        same id are not resurrected, before it is created again.
+        """
+        new = super().process_record(new, old)
+        collection_id = new.get(self.model.id_field)
+        if old is None and collection_id is not None:
+            collection_uri = utils.instance_uri(self.request, 'collection',
+                                                bucket_id=self.request.matchdict['bucket_id'],
+                                                id=collection_id)
+            reclaim_pending_children(self.request, collection_uri)
+        return new
+
 
 @subscriber(ResourceChanged,
             for_resources=('collection',),
@@ -49,18 +64,10 @@ class Collection(resource.ShareableResource):
 def on_collections_deleted(event):
     """Some collections were deleted, delete records.
     """
-    storage = event.request.registry.storage
-    permission = event.request.registry.permission
-
     for change in event.impacted_records:
         collection = change['old']
         bucket_id = event.payload['bucket_id']
-        parent_id = utils.instance_uri(event.request, 'collection',
-                                       bucket_id=bucket_id,
-                                       id=collection['id'])
-        storage.delete_all(collection_id=None,
-                           parent_id=parent_id,
-                           with_deleted=False)
-        storage.purge_deleted(collection_id=None,
-                              parent_id=parent_id)
-        permission.delete_object_permissions(parent_id + '*')
+        collection_uri = utils.instance_uri(event.request, 'collection',
+                                            bucket_id=bucket_id,
+                                            id=collection['id'])
+        delete_children(event.request, collection_uri)
@@ -59,8 +59,12 @@ class PermissionsModel:
     def timestamp(self, parent_id=None):
         return 0
 
+    def get_records_with_timestamp(self, *args, with_count=True, **kwargs):
+        records, total_records = self.get_records(*args, **kwargs)
+        return records, total_records, self.timestamp()
+
     def get_records(self, filters=None, sorting=None, pagination_rules=None,
-                    limit=None, include_deleted=False, parent_id=None):
+                    limit=None, include_deleted=False, parent_id=None, fields=None):
         # Invert the permissions inheritance tree.
         perms_descending_tree = {}
         for on_resource, tree in PERMISSIONS_INHERITANCE_TREE.items():
@@ -166,6 +170,11 @@ class Permissions(resource.ShareableResource):
         super().__init__(request, context)
         self.model = PermissionsModel(request)
 
+    def collection_get(self):
+        # Entries already list the permissions of the current user on
+        # each object, there is nothing to expand.
+        return resource.UserResource.collection_get(self)
+
     def _extract_sorting(self, limit):
         # Permissions entries are not stored with timestamp, so do not
         # force it.
@@ -2,8 +2,10 @@ import copy
 
 import jsonschema
 from kinto.core import resource, utils
-from kinto.core.errors import raise_invalid
+from kinto.core.errors import http_error, raise_invalid, ERRORS
+from kinto.core.storage import exceptions as storage_exceptions
 from jsonschema import exceptions as jsonschema_exceptions
+from pyramid import httpexceptions
 from pyramid.security import Authenticated
 from pyramid.settings import asbool
 
@@ -12,6 +14,50 @@ from kinto.views import object_exists_or_404
 
 _parent_path = '/buckets/{{bucket_id}}/collections/{{collection_id}}'
 
+# Storage collection where the timestamp of the oldest retained tombstone of
+# each collection is kept, once they were compacted.
+TOMBSTONES_HORIZON_COLLECTION = 'tombstones_horizon'
+
+
+def get_tombstones_ttl(settings, bucket_id, collection_id):
+    """Return the retention duration of records tombstones in seconds, as
+    configured for this collection, for its bucket, or globally.
+    """
+    by_bucket = '{}_record_tombstones_ttl_seconds'.format(bucket_id)
+    by_collection = '{}_{}_record_tombstones_ttl_seconds'.format(bucket_id, collection_id)
+    ttl = settings.get(by_collection,
+                       settings.get(by_bucket,
+                                    settings.get('record_tombstones_ttl_seconds')))
+    if ttl is None or ttl == '':
+        return None
+    return int(ttl)
+
+
+def get_tombstones_horizon(storage, collection_uri):
+    """Return the timestamp before which the records tombstones of this
+    collection were purged, or ``None``.
+    """
+    try:
+        horizon = storage.get(collection_id=TOMBSTONES_HORIZON_COLLECTION,
+                              parent_id=collection_uri,
+                              object_id='record')
+    except storage_exceptions.RecordNotFoundError:
+        return None
+    return horizon['before']
+
+
+def set_tombstones_horizon(storage, collection_uri, before):
+    """Record that the records tombstones of this collection older than
+    ``before`` are about to be purged.
+    """
+    current = get_tombstones_horizon(storage, collection_uri)
+    if current is not None and current >= before:
+        return
+    storage.update(collection_id=TOMBSTONES_HORIZON_COLLECTION,
+                   parent_id=collection_uri,
+                   object_id='record',
+                   record={'before': before})
+
 
 @resource.register(name='record',
                    collection_path=_parent_path + '/records',
@@ -75,6 +121,7 @@ class Record(resource.ShareableResource):
         return new
 
     def collection_get(self):
+        self._raise_410_if_changes_purged()
         result = super().collection_get()
         self._handle_cache_expires(self.request.response)
         return result
@@ -84,6 +131,37 @@ class Record(resource.ShareableResource):
         self._handle_cache_expires(self.request.response)
         return result
 
+    def _raise_410_if_changes_purged(self):
+        """If the tombstones that were created after the ``_since`` timestamp
+        (or ``gt_last_modified``, ``min_last_modified``) have been compacted,
+        the client cannot obtain a complete set of changes and must resync
+        from scratch.
+
+        The horizon is checked whenever it exists, even if the tombstones
+        retention is not configured anymore.
+
+        :raises: :exc:`~pyramid:pyramid.httpexceptions.HTTPGone`
+        """
+        querystring = self.request.validated['querystring']
+        modified_field = self.model.modified_field
+        params = ('_since', 'gt_' + modified_field, 'min_' + modified_field)
+        # Other values (e.g. strings) are not timestamps.
+        bounds = [querystring[param] for param in params
+                  if type(querystring.get(param)) is int]
+        if not bounds:
+            return
+        since = min(bounds)
+
+        collection_uri = self.get_parent_id(self.request)
+        horizon = get_tombstones_horizon(self.model.storage, collection_uri)
+        if horizon is not None and since < horizon:
+            error_msg = ('Deleted records older than {} were purged, a full resync '
+                         'is required.'.format(horizon))
+            raise http_error(httpexceptions.HTTPGone(),
+                             errno=ERRORS.CHANGES_PURGED,
+                             message=error_msg,
+                             details={'oldest_timestamp': horizon})
+
     def _handle_cache_expires(self, response):
         """If the parent collection defines a ``cache_expires`` attribute,
         then cache-control response headers are sent.
@@ -61,7 +61,6 @@ MONITORING_REQUIRES = [
     'raven',
     'statsd',
     'newrelic',
-    'werkzeug',
 ]
 
 ENTRY_POINTS = {
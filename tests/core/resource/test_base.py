@@ -16,6 +16,7 @@ class ResourceTest(BaseTest):
 
     def test_raise_if_backend_fails_to_obtain_timestamp(self):
         request = self.get_request()
+        request.method = 'POST'
 
         with mock.patch.object(request.registry.storage,
                                'collection_timestamp',
@@ -26,6 +27,8 @@ class ResourceTest(BaseTest):
     def test_raise_unavailable_if_fail_to_obtain_timestamp_with_readonly(self):
         request = self.get_request()
 
+        request.method = 'POST'
+
         excepted_exc = httpexceptions.HTTPServiceUnavailable
 
         request.registry.settings = {'readonly': 'true'}
@@ -36,6 +39,36 @@ class ResourceTest(BaseTest):
                 self.resource_class(request)
                 self.assertIn('writable', cm.exception.message)
 
+    def test_timestamp_is_not_obtained_on_init_when_listing_records(self):
+        request = self.get_request()
+        with mock.patch.object(request.registry.storage,
+                               'collection_timestamp') as mocked:
+            self.resource_class(request)
+        self.assertFalse(mocked.called)
+
+    def test_timestamp_is_obtained_along_with_records_when_listing(self):
+        self.resource.timestamp  # Initialize the collection.
+        request = self.get_request()
+        request.validated = self.validated
+        resource = self.resource_class(request)
+        with mock.patch.object(request.registry.storage,
+                               'collection_timestamp') as mocked:
+            resource.collection_get()
+        self.assertFalse(mocked.called)
+        self.assertEqual(request.response.headers['ETag'],
+                         '"{}"'.format(self.resource.timestamp))
+
+    def test_raise_unavailable_if_fail_to_obtain_timestamp_when_listing_with_readonly(self):
+        request = self.get_request()
+        request.validated = self.validated
+        request.registry.settings = {**request.registry.settings, 'readonly': 'true'}
+        resource = self.resource_class(request)
+        with mock.patch.object(request.registry.storage,
+                               'collection_timestamp',
+                               side_effect=storage_exceptions.BackendError):
+            with self.assertRaises(httpexceptions.HTTPServiceUnavailable):
+                resource.collection_get()
+
 
 class ShareableResourceTest(BaseTest):
     resource_class = ShareableResource
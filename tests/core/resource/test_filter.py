@@ -1,6 +1,7 @@
 from pyramid import httpexceptions
 
 from kinto.core.errors import ERRORS
+from kinto.core.resource import _parse_filter_param
 from . import BaseTest
 
 
@@ -195,6 +196,14 @@ class FilteringTest(BaseTest):
         self.assertRaises(httpexceptions.HTTPBadRequest,
                           self.resource.collection_get)
 
+    def test_filter_parameters_are_parsed_once(self):
+        self.validated['querystring'] = {'min_status': 2}
+        self.resource.collection_get()
+        hits = _parse_filter_param.cache_info().hits
+        result = self.resource.collection_get()
+        self.assertEqual(_parse_filter_param.cache_info().hits, hits + 1)
+        self.assertEqual(len(result['data']), 4)
+
 
 class SubobjectFilteringTest(BaseTest):
     def setUp(self):
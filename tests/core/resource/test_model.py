@@ -1,3 +1,4 @@
+import mock
 from pyramid import httpexceptions
 
 from . import BaseTest
@@ -14,6 +15,25 @@ class ModelTest(BaseTest):
         self.assertEqual(len(records), 1)
         self.assertDictEqual(records[0], self.record)
 
+    def test_fields_are_only_passed_to_storage_if_specified(self):
+        with mock.patch.object(self.model.storage, 'get_all',
+                               return_value=([], 0)) as mocked:
+            self.model.get_records()
+            self.assertNotIn('fields', mocked.call_args[1])
+            self.model.get_records(fields=['field'])
+            self.assertEqual(mocked.call_args[1]['fields'], ['field'])
+
+    def test_list_goes_through_overridden_get_records(self):
+        class PostProcessedModel(self.model.__class__):
+            def get_records(self, *args, **kwargs):
+                records, count = super().get_records(*args, **kwargs)
+                return [{**r, 'processed': True} for r in records], count
+
+        self.model.__class__ = PostProcessedModel
+        result = self.resource.collection_get()
+        self.assertTrue(result['data'][0]['processed'])
+        self.assertEqual(self.resource.timestamp, self.record['last_modified'])
+
 
 class CreateTest(BaseTest):
     def setUp(self):
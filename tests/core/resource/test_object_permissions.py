@@ -34,6 +34,44 @@ class CollectionPermissionTest(PermissionTest):
         self.assertNotIn('permissions', result)
 
 
+class ExpandCollectionPermissionTest(PermissionTest):
+    def setUp(self):
+        super().setUp()
+        self.resource.model.get_permission_object_id = (
+            lambda object_id=None: '/articles/{}'.format(object_id))
+        self.record1 = self.resource.model.create_record({})
+        self.record2 = self.resource.model.create_record({})
+        self.permission.add_principal_to_ace('/articles/{}'.format(self.record2['id']),
+                                             'read', 'account:readonly')
+        self.resource.request.validated['querystring'] = {'_expand': ['permissions']}
+
+    def test_permissions_are_provided_in_collection_get_if_expanded(self):
+        result = self.resource.collection_get()
+        by_id = dict(zip([r['id'] for r in result['data']], result['permissions']))
+        self.assertEqual(by_id[self.record1['id']], {'write': ['basicauth:bob']})
+        self.assertEqual(by_id[self.record2['id']], {'write': ['basicauth:bob'],
+                                                     'read': ['account:readonly']})
+
+    def test_permissions_are_fetched_in_one_call(self):
+        with mock.patch.object(self.permission, 'get_objects_permissions',
+                               wraps=self.permission.get_objects_permissions) as mocked:
+            self.resource.collection_get()
+        self.assertEqual(mocked.call_count, 1)
+
+    def test_permissions_are_hidden_if_user_has_only_read_permission(self):
+        self.resource.model.current_principal = 'account:readonly'
+        self.resource.model.prefixed_principals = []
+        result = self.resource.collection_get()
+        self.assertEqual(result['permissions'], [{}, {}])
+
+    def test_permissions_are_not_fetched_if_page_is_empty(self):
+        self.resource.model.delete_records()
+        with mock.patch.object(self.permission, 'get_objects_permissions') as mocked:
+            result = self.resource.collection_get()
+        self.assertEqual(result['permissions'], [])
+        self.assertFalse(mocked.called)
+
+
 class ObtainRecordPermissionTest(PermissionTest):
     def setUp(self):
         super().setUp()
@@ -178,6 +216,18 @@ class SpecifyRecordPermissionTest(PermissionTest):
                          {'id': self.record['id'],
                           'last_modified': self.record['last_modified']})
 
+    def test_permissions_are_written_and_read_at_once_with_put(self):
+        perms = {'write': ['jean-louis']}
+        self.resource.request.validated['body']['permissions'] = perms
+        self.resource.request.method = 'PUT'
+        applied = {'write': {'basicauth:bob', 'jean-louis'}}
+        with mock.patch.object(self.permission, 'apply_object_permissions',
+                               return_value=applied) as mocked:
+            result = self.resource.put()
+        mocked.assert_called_with(self.record_uri, perms, owner='basicauth:bob')
+        self.assertEqual(sorted(result['permissions']['write']),
+                         ['basicauth:bob', 'jean-louis'])
+
 
 class DeletedRecordPermissionTest(PermissionTest):
     def setUp(self):
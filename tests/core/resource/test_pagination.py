@@ -5,6 +5,7 @@ import mock
 from urllib.parse import parse_qs, urlparse
 from pyramid.httpexceptions import HTTPBadRequest
 
+from kinto.core.storage import Sort
 from kinto.core.utils import json
 
 from . import BaseTest
@@ -202,6 +203,65 @@ class PaginationTest(BasePaginationTest):
         self.assertRaises(HTTPBadRequest, self.resource.collection_get)
 
 
+class SnapshotPaginationTest(BasePaginationTest):
+    def setUp(self):
+        super().setUp()
+        self.resource.request.path = '/records'
+        self.sorting = [Sort('last_modified', -1)]
+        self.timestamp = self.model.timestamp()
+        self.last_record = {'last_modified': self.timestamp + 1}
+
+    def _use_token(self, filters=None, total=42, **kwargs):
+        snapshot = {'timestamp': self.timestamp, 'total': total}
+        token = self.resource._build_pagination_token(self.sorting, self.last_record, 10,
+                                                      filters=filters or [],
+                                                      snapshot=snapshot)
+        self.validated['querystring'] = {'_limit': 50, '_token': token, **kwargs}
+
+    def test_next_pages_reuse_the_total_of_the_first_page(self):
+        self._use_token()
+        with mock.patch.object(self.model, 'get_records_with_timestamp',
+                               wraps=self.model.get_records_with_timestamp) as mocked:
+            self.resource.collection_get()
+        self.assertFalse(mocked.call_args[1]['with_count'])
+        self.assertEqual(self.last_response.headers['Total-Records'], '42')
+
+    def test_token_is_decoded_once_per_request(self):
+        self._use_token()
+        with mock.patch.object(self.resource, '_decode_pagination_token',
+                               wraps=self.resource._decode_pagination_token) as mocked:
+            self.resource.collection_get()
+        self.assertEqual(mocked.call_count, 1)
+
+    def test_next_pages_ignore_records_changed_after_the_first_page(self):
+        self._use_token()
+        self.model.create_record({'title': 'new'})
+        result = self.resource.collection_get()
+        self.assertEqual(len(result['data']), 20)
+        self.assertNotIn('new', [r['title'] for r in result['data']])
+
+    def test_snapshot_is_ignored_if_filters_are_different(self):
+        self._use_token(status=2)
+        self.resource.collection_get()
+        self.assertEqual(self.last_response.headers['Total-Records'], '5')
+
+    def test_unsigned_tokens_are_accepted_without_snapshot(self):
+        token = {'last_record': self.last_record, 'offset': 10,
+                 'timestamp': self.timestamp, 'total': 42}
+        self.validated['querystring'] = {
+            '_limit': 50, '_token': b64encode(json.dumps(token).encode('ascii')).decode('ascii')}
+        self.resource.collection_get()
+        self.assertEqual(self.last_response.headers['Total-Records'], '20')
+
+    def test_raises_bad_request_if_token_signature_is_invalid(self):
+        self._use_token()
+        tokeninfo = json.loads(b64decode(self.validated['querystring']['_token']))
+        tokeninfo['total'] = 1
+        self.validated['querystring']['_token'] = b64encode(
+            json.dumps(tokeninfo).encode('ascii')).decode('ascii')
+        self.assertRaises(HTTPBadRequest, self.resource.collection_get)
+
+
 class PaginatedDeleteTest(BasePaginationTest):
     def test_handle_limit_on_delete(self):
         self.validated['querystring'] = {'_limit': 3}
@@ -247,6 +307,25 @@ class BuildPaginationTokenTest(BaseTest):
         tokeninfo = json.loads(b64decode(token).decode('ascii'))
         self.assertEqual(tokeninfo['offset'], 42)
 
+    def test_token_without_snapshot_is_not_signed(self):
+        token = self.resource._build_pagination_token([('last_modified', -1)],
+                                                      self.record,
+                                                      42)
+        tokeninfo = json.loads(b64decode(token).decode('ascii'))
+        self.assertNotIn('signature', tokeninfo)
+
+    def test_token_carries_the_snapshot_of_the_first_page(self):
+        self.resource.request.path = '/records'
+        token = self.resource._build_pagination_token([('last_modified', -1)],
+                                                      self.record,
+                                                      42, filters=[],
+                                                      snapshot={'timestamp': 1234, 'total': 50})
+        tokeninfo = json.loads(b64decode(token).decode('ascii'))
+        self.assertEqual(tokeninfo['timestamp'], 1234)
+        self.assertEqual(tokeninfo['total'], 50)
+        self.assertIn('query', tokeninfo)
+        self.assertIn('signature', tokeninfo)
+
     def test_no_sorting_default_to_modified_field(self):
         token = self.resource._build_pagination_token([('last_modified', -1)],
                                                       self.record,
@@ -1,3 +1,4 @@
+import mock
 from pyramid import httpexceptions
 
 from kinto.core.resource import ShareableResource
@@ -43,6 +44,22 @@ class PartialFieldsTest(PartialResponseBase):
         self.assertIn('field', record)
         self.assertNotIn('other', record)
 
+    def test_fields_parameter_is_passed_to_the_storage_on_get_all(self):
+        self.validated['querystring']['_fields'] = ['field']
+        storage = self.resource.model.storage
+        with mock.patch.object(storage, 'get_all_with_timestamp',
+                               wraps=storage.get_all_with_timestamp) as mocked:
+            self.resource.collection_get()
+        fields = mocked.call_args[1]['fields']
+        self.assertEqual(sorted(fields), ['field', 'id', 'last_modified'])
+
+    def test_fields_parameter_do_projection_on_sorted_get_all(self):
+        self.model.create_record({'field': 'other value', 'other': 'zzz'})
+        self.validated['querystring'] = {'_fields': ['field'], '_sort': ['-other']}
+        result = self.resource.collection_get()
+        self.assertEqual(result['data'][0]['field'], 'other value')
+        self.assertNotIn('other', result['data'][0])
+
     def test_fail_if_fields_parameter_is_invalid(self):
         self.validated['querystring']['_fields'] = 'invalid_field'
         self.assertRaises(httpexceptions.HTTPBadRequest, self.resource.get)
@@ -226,6 +226,40 @@ class RecordSchemaTest(unittest.TestCase):
         self.assertRaises(colander.UnsupportedFields, bound.deserialize, value)
 
 
+class SchemalessDataSchemaTest(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = schema.SchemalessDataSchema()
+
+    def test_nested_values_are_kept_as_they_are(self):
+        nested = {'tags': ['a', {'b': 1}]}
+        deserialized = self.schema.deserialize({'foo': nested})
+        self.assertEqual(deserialized, {'foo': nested})
+        self.assertIs(deserialized['foo'], nested)
+
+    def test_raises_invalid_if_not_a_mapping(self):
+        self.assertRaises(colander.Invalid, self.schema.deserialize, ['foo'])
+        self.assertRaises(colander.Invalid, self.schema.deserialize, 'foo')
+
+    def test_accepts_schemas_without_fields(self):
+        self.assertTrue(self.schema.accepts(schema.ResourceSchema()))
+
+    def test_does_not_accept_schemas_with_fields(self):
+        class Book(schema.ResourceSchema):
+            title = colander.SchemaNode(colander.String())
+        self.assertFalse(self.schema.accepts(Book()))
+
+    def test_does_not_accept_schemas_without_unknown_fields(self):
+        class Strict(schema.ResourceSchema):
+            class Options:
+                preserve_unknown = False
+        self.assertFalse(self.schema.accepts(Strict()))
+
+    def test_does_not_accept_schemas_with_validator(self):
+        node = schema.ResourceSchema(validator=colander.Length(max=2))
+        self.assertFalse(self.schema.accepts(node))
+
+
 class RequestSchemaTest(unittest.TestCase):
 
     def setUp(self):
@@ -3,6 +3,7 @@ import random
 from pyramid import httpexceptions
 
 from kinto.core.errors import ERRORS
+from kinto.core.resource import _parse_sort_field
 
 from . import BaseTest
 
@@ -116,6 +117,13 @@ class SortingTest(BaseTest):
         self.assertGreater(result['data'][0]['last_modified'],
                            result['data'][1]['last_modified'])
 
+    def test_sort_fields_are_parsed_once(self):
+        self.resource.request.validated['querystring'] = {'_sort': ['-status']}
+        self.resource.collection_get()
+        hits = _parse_sort_field.cache_info().hits
+        self.resource.collection_get()
+        self.assertEqual(_parse_sort_field.cache_info().hits, hits + 1)
+
 
 class SubobjectSortingTest(BaseTest):
     def setUp(self):
@@ -12,6 +12,9 @@ class SinceModifiedTest(ThreadMixin, BaseTest):
     def setUp(self):
         super().setUp()
         self.validated['body'] = {'data': {}}
+        # Records are created with the same resource instance: obtain the
+        # collection timestamp before, like for a ``POST`` request.
+        self.resource.timestamp
 
         with mock.patch.object(self.model.storage,
                                '_bump_timestamp') as msec_mocked:
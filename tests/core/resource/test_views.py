@@ -1,6 +1,7 @@
 import mock
 import uuid
 
+from kinto.core import utils
 from kinto.core.storage import exceptions as storage_exceptions
 from kinto.core.errors import ERRORS
 from kinto.core.testing import unittest, FormattedErrorMixin
@@ -749,6 +750,41 @@ class PaginationNextURLTest(BaseWebTest, unittest.TestCase):
         self.assertIn('https://server.name:443', resp.headers['Next-Page'])
 
 
+class StreamedCollectionTest(BaseWebTest, unittest.TestCase):
+    @classmethod
+    def get_app_settings(cls, extras=None):
+        settings = super().get_app_settings(extras)
+        settings['json_streaming_threshold'] = 2
+        return settings
+
+    def setUp(self):
+        super().setUp()
+        for i in range(3):
+            self.app.post_json(self.collection_url,
+                               {'data': {'name': 'Champignon/{}'.format(i)}},
+                               headers=self.headers)
+
+    def test_large_collections_are_streamed(self):
+        with mock.patch('kinto.core.utils.json_stream',
+                        wraps=utils.json_stream) as mocked:
+            resp = self.app.get(self.collection_url, headers=self.headers)
+        self.assertTrue(mocked.called)
+        self.assertEqual(resp.headers['Content-Type'], 'application/json')
+        names = sorted(r['name'] for r in resp.json['data'])
+        self.assertEqual(names, ['Champignon/0', 'Champignon/1', 'Champignon/2'])
+
+    def test_small_collections_are_not_streamed(self):
+        with mock.patch('kinto.core.utils.json_stream') as mocked:
+            resp = self.app.get(self.collection_url + '?_limit=2', headers=self.headers)
+        self.assertFalse(mocked.called)
+        self.assertEqual(len(resp.json['data']), 2)
+
+    def test_streamed_collections_are_served_in_batch_requests(self):
+        body = {'requests': [{'method': 'GET', 'path': self.collection_url}]}
+        resp = self.app.post_json('/batch', body, headers=self.headers)
+        self.assertEqual(len(resp.json['responses'][0]['body']['data']), 3)
+
+
 class SchemaLessPartialResponseTest(BaseWebTest, unittest.TestCase):
     """Extra tests for :mod:`tests.core.resource.test_partial_response`
     """
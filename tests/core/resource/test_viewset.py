@@ -6,6 +6,7 @@ from pyramid import testing
 
 from kinto.core import authorization, DEFAULT_SETTINGS
 from kinto.core.resource import ViewSet, ShareableViewSet, register_resource
+from kinto.core.resource.schema import ResourceSchema
 from kinto.core.resource.viewset import PartialSchema, StrictSchema
 from kinto.core.testing import unittest
 
@@ -415,6 +416,59 @@ class TestViewsetBindedSchemas(unittest.TestCase):
         invalid = {'header': {'Response-Behavior': 'impolite'}}
         self.assertRaises(colander.Invalid, schema.deserialize, invalid)
 
+    def test_schemas_are_bound_once_per_resource_and_method(self):
+        first = self.viewset.record_arguments(self.resource, 'PUT')
+        second = self.viewset.record_arguments(self.resource, 'put')
+        self.assertIs(first['schema'], second['schema'])
+        other = self.viewset.record_arguments(self.resource, 'GET')
+        self.assertIsNot(first['schema'], other['schema'])
+        other = self.viewset.record_arguments(mock.MagicMock(), 'PUT')
+        self.assertIsNot(first['schema'], other['schema'])
+
+    def test_schemas_are_bound_again_when_viewset_is_updated(self):
+        first = self.viewset.collection_arguments(self.resource, 'GET')
+        self.viewset.update(collection_get_arguments={})
+        second = self.viewset.collection_arguments(self.resource, 'GET')
+        self.assertIsNot(first['schema'], second['schema'])
+        self.assertNotIn('_fields', second['schema']['querystring'])
+
+    def test_validators_are_not_appended_to_viewset_arguments(self):
+        validators = [mock.sentinel.validator]
+        self.viewset.update(collection_get_arguments={'validators': validators})
+        self.viewset.collection_arguments(self.resource, 'GET')
+        arguments = self.viewset.collection_arguments(self.resource, 'GET')
+        self.assertEqual(arguments['validators'],
+                         [mock.sentinel.validator, colander_validator])
+        self.assertEqual(validators, [mock.sentinel.validator])
+
+    def test_schemaless_records_data_is_not_copied(self):
+        self.resource = mock.MagicMock(spec=['schema', 'permissions'])
+        self.resource.schema = ResourceSchema
+        arguments = self.viewset.record_arguments(self.resource, 'PUT')
+        data = {'nested': {'foo': ['bar']}}
+        deserialized = arguments['schema'].deserialize({'body': {'data': data}})
+        self.assertIs(deserialized['body']['data']['nested'], data['nested'])
+
+    def test_schemaless_records_data_must_be_a_mapping(self):
+        self.resource = mock.MagicMock(spec=['schema', 'permissions'])
+        self.resource.schema = ResourceSchema
+        arguments = self.viewset.record_arguments(self.resource, 'PUT')
+        invalid = {'body': {'data': ['foo']}}
+        with self.assertRaises(colander.Invalid) as cm:
+            arguments['schema'].deserialize(invalid)
+        self.assertIn('body.data', cm.exception.asdict())
+
+    def test_records_data_is_validated_if_schema_has_fields(self):
+        class Book(ResourceSchema):
+            title = colander.SchemaNode(colander.String())
+        self.resource = mock.MagicMock(spec=['schema', 'permissions'])
+        self.resource.schema = Book
+        arguments = self.viewset.record_arguments(self.resource, 'PUT')
+        invalid = {'body': {'data': {'title': {'not': 'a string'}}}}
+        with self.assertRaises(colander.Invalid) as cm:
+            arguments['schema'].deserialize(invalid)
+        self.assertIn('body.data.title', cm.exception.asdict())
+
 
 class TestViewsetSchemasTest(unittest.TestCase):
 
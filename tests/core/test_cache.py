@@ -26,6 +26,17 @@ class CacheBaseTest(unittest.TestCase):
         for call in calls:
             self.assertRaises(NotImplementedError, *call)
 
+    def test_many_operations_fallback_to_single_key_operations(self):
+        with mock.patch.object(self.cache, 'get', return_value='a') as mocked:
+            self.assertEqual(self.cache.get_many(['foo', 'bar']), ['a', 'a'])
+            mocked.assert_any_call('bar')
+        with mock.patch.object(self.cache, 'set') as mocked:
+            self.cache.set_many({'foo': 'a'}, 42)
+            mocked.assert_called_with('foo', 'a', 42)
+        with mock.patch.object(self.cache, 'delete') as mocked:
+            self.cache.delete_many(['foo'])
+            mocked.assert_called_with('foo')
+
 
 class MemoryCacheTest(CacheTest, unittest.TestCase):
     backend = memory_backend
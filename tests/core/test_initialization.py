@@ -205,26 +205,32 @@ class ApplicationWrapperTest(unittest.TestCase):
         mocked_newrelic.initialize.assert_not_called()
         self.assertEquals(app, mock.sentinel.app)
 
-    @mock.patch('kinto.core.initialization.ProfilerMiddleware')
+    @mock.patch('kinto.core.initialization.SamplingProfiler')
     def test_profiler_is_not_installed_if_set_to_false(self, mocked_profiler):
         settings = {'profiler_enabled': False}
         app = kinto.core.install_middlewares(mock.sentinel.app, settings)
-        mocked_profiler.initialize.assert_not_called()
+        mocked_profiler.assert_not_called()
         self.assertEquals(app, mock.sentinel.app)
 
-    @mock.patch('kinto.core.initialization.ProfilerMiddleware')
+    @mock.patch('kinto.core.initialization.SamplingProfiler')
     def test_profiler_is_installed_if_set_to_true(self, mocked_profiler):
         settings = {
             'profiler_enabled': True,
-            'profiler_dir': '/tmp/path'
+            'profiler_dir': '/tmp/path',
+            'profiler_sampling_rate': '0.5',
+            'profiler_sampling_interval_seconds': '0.01',
+            'profiler_secret': 'secret',
         }
         mocked_profiler.return_value = 'wrappedApp'
         app = kinto.core.install_middlewares(mock.sentinel.app, settings)
 
         mocked_profiler.assert_called_with(
             mock.sentinel.app,
-            restrictions='*kinto.core*',
-            profile_dir='/tmp/path')
+            profile_dir='/tmp/path',
+            sampling_rate=0.5,
+            interval=0.01,
+            secret='secret',
+            registry=None)
 
         self.assertEquals(app, 'wrappedApp')
 
@@ -321,6 +327,13 @@ class StatsDConfigurationTest(unittest.TestCase):
         app.get('/v0/coucou', status=404)
         self.assertFalse(self.mocked.count.called)
 
+    def test_statsd_times_views_and_methods(self):
+        kinto.core.initialize(self.config, '0.0.1', 'project_name')
+        app = webtest.TestApp(self.config.make_wsgi_app())
+        app.get('/v0/__heartbeat__')
+        keys = [args[0] for args, _ in self.mocked().timing.call_args_list]
+        self.assertIn('request.heartbeat.GET', keys)
+
     @mock.patch('kinto.core.utils.hmac_digest')
     def test_statsd_counts_unique_users(self, digest_mocked):
         digest_mocked.return_value = 'mat'
@@ -5,6 +5,9 @@ from pyramid import testing
 
 from kinto.core import DEFAULT_SETTINGS
 from kinto.core import initialization
+from kinto.core import metrics
+from kinto.core import statsd
+from kinto.core.testing import skip_if_no_statsd
 
 from .support import BaseWebTest
 
@@ -63,6 +66,84 @@ class RequestSummaryTest(BaseWebTest, unittest.TestCase):
         event_dict = self.logger_context()
         self.assertEqual(event_dict['authn_type'], 'basicauth')
 
+    def test_backends_calls_are_bound(self):
+        self.app.get('/mushrooms', headers=self.headers)
+        event_dict = self.logger_context()
+        self.assertGreaterEqual(event_dict['storage_calls'], 1)
+        self.assertIsInstance(event_dict['storage_t'], float)
+
+    def test_backends_calls_are_not_bound_if_backend_is_not_called(self):
+        self.app.get('/', headers=self.headers)
+        event_dict = self.logger_context()
+        self.assertNotIn('storage_calls', event_dict)
+        self.assertNotIn('storage_t', event_dict)
+
+    def test_subrequests_backends_calls_are_bound_to_batch_request(self):
+        self.app.get('/mushrooms', headers=self.headers)  # Init collection timestamp.
+        body = {'requests': [{'path': '/mushrooms'}]}
+        self.app.post_json('/batch', body, headers=self.headers)
+        single = self.logger_context()['storage_calls']
+        body = {'requests': [{'path': '/mushrooms'}, {'path': '/mushrooms'}]}
+        self.app.post_json('/batch', body, headers=self.headers)
+        event_dict = self.logger_context()
+        self.assertEqual(event_dict['storage_calls'], 2 * single)
+
+
+class BackendsTimingsTest(unittest.TestCase):
+    class Backend:
+        def get(self):
+            return 'value'
+
+        def get_many(self):
+            return [self.get(), self.get()]
+
+    def setUp(self):
+        config = testing.setUp()
+        config.registry.storage = self.Backend()
+        initialization.setup_backends_timings(config)
+        self.storage = config.registry.storage
+        self.request = testing.DummyRequest()
+        self.addCleanup(testing.tearDown)
+
+    def test_calls_are_accumulated_on_current_request(self):
+        with mock.patch('kinto.core.initialization.get_current_request',
+                        return_value=self.request):
+            self.storage.get()
+            self.storage.get()
+        timings = initialization.backends_timings(self.request)
+        self.assertEqual(timings['storage'][0], 2)
+
+    def test_backends_calling_their_own_methods_are_accounted_once(self):
+        with mock.patch('kinto.core.initialization.get_current_request',
+                        return_value=self.request):
+            self.assertEqual(self.storage.get_many(), ['value', 'value'])
+        timings = initialization.backends_timings(self.request)
+        self.assertEqual(timings['storage'][0], 1)
+
+    def test_calls_outside_requests_are_not_accounted(self):
+        with mock.patch('kinto.core.initialization.get_current_request',
+                        return_value=None):
+            self.assertEqual(self.storage.get(), 'value')
+        self.assertEqual(initialization.backends_timings(self.request), {})
+
+    @skip_if_no_statsd
+    def test_timed_methods_are_still_timed_by_statsd(self):
+        with mock.patch('kinto.core.statsd.statsd_module'):
+            client = statsd.Client('localhost', 8125, 'prefix')
+        client.watch_execution_time(self.storage, prefix='backend')
+        client._client.timer.assert_any_call('backend.backend.get')
+        client._client.timer.assert_any_call('backend.backend.get_many')
+
+    def test_timed_methods_are_timed_by_metrics_client(self):
+        client = metrics.Client('prefix')
+        client.watch_execution_time(self.storage, prefix='backend')
+        self.storage.get()
+        self.assertIn('prefix_backend_backend_get_seconds_count 1', client.render())
+
+    def test_methods_patched_on_class_are_still_called(self):
+        with mock.patch.object(self.Backend, 'get', return_value='patched'):
+            self.assertEqual(self.storage.get(), 'patched')
+
 
 class BatchSubrequestTest(BaseWebTest, unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,68 @@
+import mock
+
+from pyramid import testing
+
+from kinto.core.testing import unittest
+from kinto.core import metrics
+
+
+class TestedClass:
+    def test_method(self):
+        pass
+
+    def _private_method(self):
+        pass
+
+
+class MetricsClientTest(unittest.TestCase):
+    def setUp(self):
+        self.client = metrics.Client('prefix', buckets=(0.1, 1.0))
+
+    def test_counts_are_rendered_as_counters(self):
+        self.client.count('view.heartbeat.GET')
+        self.client.count('view.heartbeat.GET')
+        self.assertIn('# TYPE prefix_view_heartbeat_GET_total counter\n'
+                      'prefix_view_heartbeat_GET_total 2\n', self.client.render())
+
+    def test_unique_counts_are_ignored(self):
+        self.client.count('users', unique='mat')
+        self.assertNotIn('users', self.client.render())
+
+    def test_gauges_keep_the_last_value(self):
+        self.client.gauge('pool.storage.backlog', 3)
+        self.client.gauge('pool.storage.backlog', 1)
+        self.assertIn('prefix_pool_storage_backlog 1\n', self.client.render())
+
+    def test_timings_are_rendered_as_cumulative_histograms(self):
+        self.client.timing('request.heartbeat.GET', 50)
+        self.client.timing('request.heartbeat.GET', 500)
+        self.client.timing('request.heartbeat.GET', 5000)
+        rendered = self.client.render()
+        name = 'prefix_request_heartbeat_GET_seconds'
+        self.assertIn('# TYPE {} histogram'.format(name), rendered)
+        self.assertIn('{}_bucket{{le="0.1"}} 1\n'.format(name), rendered)
+        self.assertIn('{}_bucket{{le="1.0"}} 2\n'.format(name), rendered)
+        self.assertIn('{}_bucket{{le="+Inf"}} 3\n'.format(name), rendered)
+        self.assertIn('{}_sum 5.55\n'.format(name), rendered)
+        self.assertIn('{}_count 3\n'.format(name), rendered)
+
+    def test_timer_can_be_used_as_context_manager(self):
+        with mock.patch('kinto.core.metrics.time.perf_counter', side_effect=[1, 1.5]):
+            with self.client.timer('pool.storage.wait'):
+                pass
+        self.assertIn('prefix_pool_storage_wait_seconds_sum 0.5\n', self.client.render())
+
+    def test_public_methods_are_timed(self):
+        obj = TestedClass()
+        self.client.watch_execution_time(obj, prefix='test')
+        obj.test_method()
+        obj._private_method()
+        rendered = self.client.render()
+        self.assertIn('prefix_test_testedclass_test_method_seconds_count 1\n', rendered)
+        self.assertNotIn('private', rendered)
+
+    def test_load_from_config_uses_project_name_as_prefix(self):
+        config = testing.setUp()
+        config.add_settings({'project_name': 'projectname', 'statsd_prefix': 'prefix'})
+        client = metrics.load_from_config(config)
+        self.assertEqual(client.prefix, 'projectname')
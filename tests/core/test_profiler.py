@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import time
+
+import mock
+from pyramid.config import Configurator
+
+from kinto.core.profiler import SamplingProfiler, folded_stack
+from kinto.core.testing import unittest
+
+
+def slow_app(environ, start_response):
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    time.sleep(0.05)
+    return [b'ok']
+
+
+class SamplingProfilerTest(unittest.TestCase):
+    def setUp(self):
+        self.profile_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.profile_dir)
+
+        config = Configurator()
+        config.add_route('bucket', '/v1/buckets/{id}')
+        config.commit()
+        self.profiler = SamplingProfiler(slow_app, self.profile_dir,
+                                         sampling_rate=0, interval=0.001,
+                                         secret='s3cr3t', registry=config.registry)
+
+    def call(self, **environ):
+        environ = {'REQUEST_METHOD': 'GET', 'PATH_INFO': '/v1/buckets/abc', **environ}
+        return b''.join(self.profiler(environ, mock.MagicMock()))
+
+    def profile_files(self):
+        return os.listdir(self.profile_dir)
+
+    def test_requests_are_not_sampled_by_default(self):
+        self.assertEqual(self.call(), b'ok')
+        self.assertIsNone(self.profiler._thread)
+
+    def test_requests_are_sampled_according_to_rate(self):
+        self.profiler.sampling_rate = 1.0
+        self.call()
+        self.profiler.dump()
+        self.assertEqual(self.profile_files(), ['GET_v1_buckets_id.folded'])
+
+    def test_requests_are_sampled_with_secret_header(self):
+        self.call(HTTP_PROFILER_SECRET='s3cr3t')
+        self.profiler.dump()
+        with open(os.path.join(self.profile_dir, 'GET_v1_buckets_id.folded')) as f:
+            lines = f.read().splitlines()
+        self.assertTrue(lines)
+        stack, count = lines[0].rsplit(' ', 1)
+        self.assertIn('tests.core.test_profiler:slow_app', stack)
+        self.assertGreater(int(count), 0)
+
+    def test_requests_are_not_sampled_with_wrong_secret(self):
+        self.profiler.sampling_rate = 1.0
+        self.call(HTTP_PROFILER_SECRET='wrong')
+        self.assertIsNone(self.profiler._thread)
+
+    def test_request_is_not_tracked_anymore_if_application_fails(self):
+        self.profiler.app = mock.MagicMock(side_effect=ValueError)
+        with self.assertRaises(ValueError):
+            self.call(HTTP_PROFILER_SECRET='s3cr3t')
+        self.assertEqual(self.profiler._active, {})
+
+    @mock.patch('kinto.core.profiler.logger')
+    def test_dump_errors_are_logged(self, mocked_logger):
+        not_a_dir = os.path.join(self.profile_dir, 'file')
+        open(not_a_dir, 'w').close()
+        self.profiler.profile_dir = not_a_dir
+        self.profiler._stacks['GET /'] = {'a;b': 1}
+        self.profiler._dirty.add('GET /')
+        self.profiler.dump()
+        self.assertTrue(mocked_logger.error.called)
+
+    def test_endpoint_is_the_route_pattern(self):
+        environ = {'REQUEST_METHOD': 'PUT', 'PATH_INFO': '/v1/buckets/abc'}
+        self.assertEqual(self.profiler.endpoint(environ), 'PUT /v1/buckets/{id}')
+
+    def test_endpoint_is_the_path_if_no_route_matches(self):
+        environ = {'REQUEST_METHOD': 'GET', 'PATH_INFO': '/unknown'}
+        self.assertEqual(self.profiler.endpoint(environ), 'GET /unknown')
+
+    def test_samples_are_dumped_when_profiler_is_idle(self):
+        self.call(HTTP_PROFILER_SECRET='s3cr3t')
+        for _ in range(100):  # Wait for the sampler thread to dump.
+            if self.profile_files():
+                break
+            time.sleep(0.01)
+        self.assertEqual(self.profile_files(), ['GET_v1_buckets_id.folded'])
+
+    def test_folded_stack_starts_with_outermost_call(self):
+        def inner():
+            import sys
+            return folded_stack(sys._getframe())
+        stack = inner().split(';')
+        self.assertEqual(stack[-1], 'tests.core.test_profiler:inner')
+        self.assertEqual(stack[-2], 'tests.core.test_profiler:'
+                                    'test_folded_stack_starts_with_outermost_call')
@@ -45,6 +45,7 @@ class PostgresqlStorageMigrationTest(unittest.TestCase):
         DROP TABLE IF EXISTS records CASCADE;
         DROP TABLE IF EXISTS deleted CASCADE;
         DROP TABLE IF EXISTS metadata CASCADE;
+        DROP TABLE IF EXISTS record_counts CASCADE;
         DROP FUNCTION IF EXISTS resource_timestamp(VARCHAR, VARCHAR);
         DROP FUNCTION IF EXISTS collection_timestamp(VARCHAR, VARCHAR);
         DROP FUNCTION IF EXISTS bump_timestamp();
@@ -165,6 +166,7 @@ class PostgresqlStorageMigrationTest(unittest.TestCase):
         # Check that previously created record is still here
         migrated, count = self.storage.get_all('test', 'jean-louis')
         self.assertEqual(migrated[0], before)
+        self.assertEqual(count, 1)
 
         # Check that new records can be created
         r = self.storage.create('test', ',jean-louis', {'drink': 'mate'})
@@ -226,6 +228,27 @@ class PostgresqlStorageMigrationTest(unittest.TestCase):
         assert len(records) == 1
         assert count == 1
 
+    def test_migration_16_initializes_records_counters(self):
+        self.storage.create('test', 'jean-louis', {'drink': 'mate'})
+        self.storage.create('test', 'jean-louis', {'drink': 'cacao'})
+        # Set the schema version back to 15, without counters.
+        with self.storage.client.connect() as conn:
+            query = """
+            DROP TABLE record_counts;
+            DROP TRIGGER tgr_records_count ON records;
+            UPDATE metadata SET value = '15'
+            WHERE name = 'storage_schema_version';
+            """
+            conn.execute(query)
+
+        self.storage.initialize_schema()
+
+        _, count = self.storage.get_all('test', 'jean-louis')
+        assert count == 2
+        self.storage.create('test', 'jean-louis', {'drink': 'tea'})
+        _, count = self.storage.get_all('test', 'jean-louis')
+        assert count == 3
+
 
 @skip_if_no_postgresql
 class PostgresqlPermissionMigrationTest(unittest.TestCase):
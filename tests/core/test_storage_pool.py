@@ -2,6 +2,8 @@ import time
 import threading
 import unittest
 
+import mock
+
 from pyramid import testing
 
 from kinto.core.testing import skip_if_no_postgresql
@@ -29,6 +31,11 @@ class QueuePoolWithMaxBacklogTest(unittest.TestCase):
         session = client.session_factory()
         self.engine = session.get_bind()
 
+    def tearDown(self):
+        # Engine is shared between tests, give connections back to the pool.
+        for connection in self.connections:
+            connection.close()
+
     def take_connection(self):
         try:
             self.connections.append(self.engine.connect())
@@ -79,3 +86,77 @@ class QueuePoolWithMaxBacklogTest(unittest.TestCase):
         other = pool.recreate()
         self.assertEqual(pool._pool.__class__, other._pool.__class__)
         self.assertEqual(other._pool.max_backlog, 2)
+
+    def test_stats_reflect_the_pool_usage(self):
+        self.exhaust_pool()
+        stats = self.engine.pool.stats()
+        stats.pop('rejected')
+        self.assertEqual(stats, {'size': 2, 'checked_out': 3, 'overflow': 1,
+                                 'backlog': 0, 'max_backlog': 2})
+
+    def test_stats_count_rejected_connections(self):
+        before = self.engine.pool.stats()['rejected']
+        self.exhaust_pool()
+        thread1 = threading.Thread(target=self.take_connection)
+        thread1.start()
+        thread2 = threading.Thread(target=self.take_connection)
+        thread2.start()
+        time.sleep(0.1)  # Let threads wait in the backlog.
+        self.take_connection()
+        self.assertEqual(self.engine.pool.stats()['rejected'], before + 1)
+        thread1.join()
+        thread2.join()
+        # Blocked threads timed out, but were not rejected.
+        self.assertEqual(self.engine.pool.stats()['rejected'], before + 1)
+
+    def test_instrumented_pool_reports_to_statsd(self):
+        statsd_client = mock.MagicMock()
+        self.engine.pool.instrument(statsd_client, prefix='pool.test')
+        self.take_connection()
+        statsd_client.timer.assert_called_with('pool.test.wait')
+        statsd_client.gauge.assert_any_call('pool.test.checked_out', 1)
+        statsd_client.gauge.assert_any_call('pool.test.backlog', 0)
+        self.assertFalse(statsd_client.count.called)
+
+    def test_instrumented_pool_reports_rejections_to_statsd(self):
+        self.exhaust_pool()
+        statsd_client = mock.MagicMock()
+        self.engine.pool.instrument(statsd_client, prefix='pool.test')
+        with mock.patch.object(self.engine.pool._pool, 'max_backlog', 0):
+            self.take_connection()
+        statsd_client.count.assert_called_with('pool.test.rejected')
+
+    def test_recreate_keeps_the_statsd_client(self):
+        from kinto.core.storage.postgresql.pool import QueuePoolWithMaxBacklog
+        pool = QueuePoolWithMaxBacklog(None, max_backlog=2, pool_size=2)
+        statsd_client = mock.sentinel.statsd
+        pool.instrument(statsd_client, prefix='pool.test')
+        other = pool.recreate()
+        self.assertEqual(other._statsd, statsd_client)
+        self.assertEqual(other._statsd_prefix, 'pool.test')
+
+
+@skip_if_no_postgresql
+class PoolsHeartbeatTest(unittest.TestCase):
+    def setUp(self):
+        from kinto.core.storage.postgresql.client import create_from_config
+
+        self.config = testing.setUp(settings={
+            'pooltest_url': 'sqlite:///:memory:',
+            'pooltest_pool_size': 2,
+        })
+        self.config.registry.heartbeat_pools = {}
+        self.backend = mock.MagicMock()
+        self.backend.client = create_from_config(self.config, prefix='pooltest_')
+
+    def test_pools_are_shown_in_heartbeat(self):
+        from kinto.core.initialization import _setup_pools_heartbeat
+        _setup_pools_heartbeat(self.config, 'storage', self.backend)
+        pools = self.config.registry.heartbeat_pools['storage']
+        self.assertEqual(len(pools), 1)
+        self.assertIn('checked_out', pools[0].stats())
+
+    def test_no_pools_in_heartbeat_if_backend_has_no_client(self):
+        from kinto.core.initialization import _setup_pools_heartbeat
+        _setup_pools_heartbeat(self.config, 'storage', object())
+        self.assertNotIn('storage', self.config.registry.heartbeat_pools)
@@ -14,7 +14,7 @@ from kinto.core.utils import (
     native_value, strip_whitespace, random_bytes_hex, read_env, hmac_digest,
     current_service, follow_subrequest, build_request, dict_subset, dict_merge,
     parse_resource, prefixed_principals, recursive_update_dict,
-    find_nested_value
+    find_nested_value, json, json_serializer, json_stream, json_stream_serializer
 )
 from kinto.core.testing import DummyRequest
 
@@ -174,6 +174,34 @@ class FollowSubrequestTest(unittest.TestCase):
         self.assertEqual(subrequest.bound_data, redirected.bound_data)
 
 
+class JsonStreamTest(unittest.TestCase):
+    def encode(self, value, **kwargs):
+        return b''.join(json_stream(value, **kwargs))
+
+    def test_encoded_value_is_equivalent_to_serialized_value(self):
+        value = {'data': [{'id': i, 'url': 'a/b'} for i in range(5)],
+                 'total': 5, 'permissions': []}
+        encoded = self.encode(value, chunk_size=2)
+        self.assertEqual(encoded.decode('utf-8'), json_serializer(value))
+
+    def test_list_items_are_encoded_by_chunks(self):
+        chunks = list(json_stream({'data': list(range(5))}, chunk_size=2))
+        self.assertEqual(chunks, [b'{"data":', b'[', b'0,1', b',2,3', b',4', b']', b'}'])
+
+    def test_empty_mapping_is_encoded(self):
+        self.assertEqual(self.encode({}), b'{}')
+
+    def test_non_ascii_characters_are_encoded_as_utf8(self):
+        value = {'data': [{'name': 'Cèpe'}]}
+        self.assertEqual(json.loads(self.encode(value).decode('utf-8')), value)
+
+    def test_serializer_only_streams_lists_longer_than_threshold(self):
+        self.assertIsInstance(json_stream_serializer({'data': [1, 2]}, threshold=2), str)
+        self.assertNotIsInstance(json_stream_serializer({'data': [1, 2, 3]}, threshold=2),
+                                 str)
+        self.assertIsInstance(json_stream_serializer([1, 2, 3], threshold=2), str)
+
+
 class DictSubsetTest(unittest.TestCase):
 
     def test_extract_by_keys(self):
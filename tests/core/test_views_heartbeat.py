@@ -20,6 +20,15 @@ class SuccessTest(BaseWebTest, unittest.TestCase):
         response = self.app.get('/__heartbeat__', status=200)
         self.assertEqual(response.json['probe'], None)
 
+    def test_pools_usage_is_shown_apart_from_health_checks(self):
+        pool = mock.MagicMock()
+        pool.stats.return_value = {'size': 5, 'checked_out': 1}
+        with mock.patch.dict(self.app.app.registry.heartbeat_pools, [('storage', [pool])]):
+            response = self.app.get('/__heartbeat__', status=200)
+        self.assertEqual(response.json['pools'], {'storage': [{'size': 5, 'checked_out': 1}]})
+        self.assertNotIn('storage_pool', response.json)
+        self.assertEqual(response.json['storage'], True)
+
 
 class FailureTest(BaseWebTest, unittest.TestCase):
 
@@ -65,3 +74,23 @@ class LoadBalancerHeartbeat(BaseWebTest, unittest.TestCase):
     def test_returns_200_with_empty_body(self):
         resp = self.app.get('/__lbheartbeat__', status=200)
         self.assertEqual(resp.json, {})
+
+
+class MetricsTest(BaseWebTest, unittest.TestCase):
+    @classmethod
+    def get_app_settings(cls, extras=None):
+        return super().get_app_settings({'metrics_enabled': True, **(extras or {})})
+
+    def test_returns_metrics_in_prometheus_text_format(self):
+        self.app.get('/mushrooms', headers=self.headers)
+        response = self.app.get('/__metrics__')
+        self.assertEqual(response.content_type, 'text/plain')
+        self.assertIn('myapp_view_mushroom_collection_GET_total 1\n', response.text)
+        self.assertIn('myapp_request_mushroom_collection_GET_storage_seconds_count 1\n',
+                      response.text)
+        self.assertIn('myapp_backend_storage_get_all_with_timestamp_seconds_count 1\n',
+                      response.text)
+
+    def test_returns_404_if_metrics_are_not_enabled(self):
+        app = self.make_app(settings={'metrics_enabled': False})
+        app.get('/__metrics__', status=404)
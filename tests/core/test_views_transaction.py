@@ -54,7 +54,7 @@ class PostgreSQLTest(BaseWebTest):
     def run_failing_post(self):
         patch = mock.patch.object(
             self.permission,
-            'add_principal_to_ace',
+            'apply_object_permissions',
             side_effect=BackendError('boom'))
         self.addCleanup(patch.stop)
         patch.start()
@@ -127,6 +127,37 @@ class TransactionTest(PostgreSQLTest, unittest.TestCase):
         self.assertEqual(len(resp.json['data']), 0)
 
 
+@skip_if_no_postgresql
+class ReadReplicasTest(PostgreSQLTest, unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Replicas are simulated with plain sessions on the primary database.
+        self.replicas = []
+        for backend in (self.storage, self.permission):
+            engine = backend.client.session_factory.session_factory.kw['bind']
+            replica = mock.MagicMock(wraps=sqlalchemy.orm.sessionmaker(bind=engine))
+            patch = mock.patch.object(backend.client, 'replica_session_factories', [replica])
+            self.addCleanup(patch.stop)
+            patch.start()
+            self.replicas.append(replica)
+
+    def test_read_only_requests_read_from_replicas(self):
+        self.app.get('/mushrooms', headers=self.headers)
+        self.assertTrue(any(replica.called for replica in self.replicas))
+
+    def test_read_modify_write_requests_only_use_primary(self):
+        resp = self.app.post_json('/mushrooms', {'data': {'name': 'Cep'}},
+                                  headers=self.headers)
+        record = resp.json['data']
+        for replica in self.replicas:
+            replica.reset_mock()
+        headers = {**self.headers, 'If-Match': '"{}"'.format(record['last_modified'])}
+        self.app.patch_json('/mushrooms/{}'.format(record['id']),
+                            {'data': {'name': 'Cèpe'}}, headers=headers)
+        self.assertFalse(any(replica.called for replica in self.replicas))
+
+
 class IntegrityConstraintTest(PostgreSQLTest, unittest.TestCase):
 
     @classmethod
@@ -176,7 +207,7 @@ class TransactionCacheTest(PostgreSQLTest, unittest.TestCase):
 
         patch = mock.patch.object(
             self.permission,
-            'add_principal_to_ace',
+            'apply_object_permissions',
             wraps=cache_and_fails)
         self.addCleanup(patch.stop)
         patch.start()
@@ -255,6 +255,30 @@ class DefaultBucketViewTest(FormattedErrorMixin, DefaultBucketWebTest):
         assert resp.headers['Location'].endswith('/buckets/default/collections/foo/records/bar')
 
 
+class DeferredDefaultBucketDeletionTest(DefaultBucketWebTest):
+
+    @classmethod
+    def get_app_settings(cls, extras=None):
+        settings = super().get_app_settings(extras)
+        settings['deletion_batch_size'] = 1
+        return settings
+
+    def setUp(self):
+        super().setUp()
+        self.app.put_json('/buckets/default/collections/tasks/records/r1',
+                          MINIMALIST_RECORD, headers=self.headers)
+        self.app.delete('/buckets/default', headers=self.headers)
+
+    def test_former_records_are_not_resurrected(self):
+        self.app.get('/buckets/default/collections/tasks/records/r1',
+                     headers=self.headers, status=404)
+
+    def test_records_created_along_with_the_bucket_are_kept(self):
+        record_url = '/buckets/default/collections/tasks/records/r2'
+        self.app.put_json(record_url, MINIMALIST_RECORD, headers=self.headers, status=201)
+        self.app.get(record_url, headers=self.headers)
+
+
 class HelloViewTest(DefaultBucketWebTest):
 
     def test_returns_bucket_id_and_url_if_authenticated(self):
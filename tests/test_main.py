@@ -119,6 +119,45 @@ class TestMain(unittest.TestCase):
             assert res == mock.sentinel.del_col_code
             assert del_col.call_count == 1
 
+    def test_cli_reclaim_deleted_run_reclaim_deleted_script(self):
+        with mock.patch('kinto.__main__.kinto_scripts.reclaim_deleted') as reclaim:
+            reclaim.return_value = mock.sentinel.reclaim_code
+            res = main(['init', '--ini', TEMP_KINTO_INI, '--backend', 'memory'])
+            assert res == 0
+            res = main(['reclaim-deleted', '--ini', TEMP_KINTO_INI,
+                        '--batch-size', '100'])
+            assert res == mock.sentinel.reclaim_code
+            assert reclaim.call_args[0][1] == 100
+
+    def test_cli_compact_tombstones_run_compact_tombstones_script(self):
+        with mock.patch('kinto.__main__.kinto_scripts.compact_tombstones') as compact:
+            compact.return_value = mock.sentinel.compact_code
+            res = main(['init', '--ini', TEMP_KINTO_INI, '--backend', 'memory'])
+            assert res == 0
+            res = main(['compact-tombstones', '--ini', TEMP_KINTO_INI])
+            assert res == mock.sentinel.compact_code
+            assert compact.call_args[0][1] is None
+
+    def test_cli_export_run_export_data_script(self):
+        with mock.patch('kinto.__main__.scripts.export_data') as export:
+            export.return_value = mock.sentinel.export_code
+            res = main(['init', '--ini', TEMP_KINTO_INI, '--backend', 'memory'])
+            assert res == 0
+            res = main(['export', '--ini', TEMP_KINTO_INI])
+            assert res == mock.sentinel.export_code
+            assert export.call_args[0][1] is sys.stdout
+
+    def test_cli_import_run_import_data_script(self):
+        with mock.patch('kinto.__main__.scripts.import_data') as import_:
+            import_.return_value = mock.sentinel.import_code
+            res = main(['init', '--ini', TEMP_KINTO_INI, '--backend', 'memory'])
+            assert res == 0
+            res = main(['import', '--ini', TEMP_KINTO_INI, '--input', TEMP_KINTO_INI,
+                        '--batch-size', '10'])
+            assert res == mock.sentinel.import_code
+            assert import_.call_args[0][1].name == TEMP_KINTO_INI
+            assert import_.call_args[0][2] == 10
+
     def test_cli_start_runs_pserve(self):
         with mock.patch('kinto.__main__.pserve.main') as mocked_pserve:
             res = main(['init', '--ini', TEMP_KINTO_INI, '--backend', 'memory'])
@@ -0,0 +1,123 @@
+import mock
+
+from kinto import scripts
+from kinto.core.storage import memory
+from kinto.core.testing import unittest
+from kinto.views.records import get_tombstones_horizon, set_tombstones_horizon
+
+
+class ReclaimDeletedTest(unittest.TestCase):
+    def setUp(self):
+        self.registry = mock.MagicMock(settings={})
+
+    def test_reclaim_deleted_in_read_only_display_an_error(self):
+        with mock.patch('kinto.scripts.logger') as mocked:
+            self.registry.settings = {'readonly': 'true'}
+            code = scripts.reclaim_deleted({'registry': self.registry})
+            assert code == 41
+            mocked.error.assert_any_call('Cannot reclaim deleted objects '
+                                         'while in readonly mode.')
+
+    def test_reclaim_deleted_commits_every_chunk(self):
+        with mock.patch('kinto.scripts.reclaim_pending_deletions') as mocked:
+            mocked.return_value = ['/buckets/a']
+            code = scripts.reclaim_deleted({'registry': self.registry}, batch_size=42)
+        assert code == 0
+        mocked.assert_called_with(self.registry.storage, self.registry.permission,
+                                  batch_size=42,
+                                  commit=scripts.current_transaction.commit)
+
+    def test_reclaim_deleted_uses_batch_size_from_settings(self):
+        self.registry.settings = {'deletion_batch_size': '12'}
+        with mock.patch('kinto.scripts.reclaim_pending_deletions') as mocked:
+            mocked.return_value = []
+            scripts.reclaim_deleted({'registry': self.registry})
+        self.assertEqual(mocked.call_args[1]['batch_size'], 12)
+
+    def test_reclaim_deleted_has_a_default_batch_size(self):
+        with mock.patch('kinto.scripts.reclaim_pending_deletions') as mocked:
+            mocked.return_value = []
+            scripts.reclaim_deleted({'registry': self.registry})
+        self.assertEqual(mocked.call_args[1]['batch_size'],
+                         scripts.DEFAULT_DELETION_BATCH_SIZE)
+
+
+class CompactTombstonesTest(unittest.TestCase):
+    def setUp(self):
+        self.storage = memory.Storage()
+        self.registry = mock.MagicMock(storage=self.storage,
+                                       settings={'record_tombstones_ttl_seconds': '3600'})
+        self.storage.create(collection_id='bucket', parent_id='',
+                            record={'id': 'beers'})
+        self.storage.create(collection_id='collection', parent_id='/buckets/beers',
+                            record={'id': 'barley'})
+        self.collection_uri = '/buckets/beers/collections/barley'
+        for i in range(3):
+            record = self.storage.create(collection_id='record',
+                                         parent_id=self.collection_uri,
+                                         record={})
+            self.storage.delete(collection_id='record',
+                                parent_id=self.collection_uri,
+                                object_id=record['id'])
+        self.timestamps = sorted(r['last_modified'] for r in self.get_tombstones())
+        patch = mock.patch('kinto.scripts.current_transaction')
+        self.transaction = patch.start()
+        self.addCleanup(patch.stop)
+
+    def get_tombstones(self):
+        records, _ = self.storage.get_all(collection_id='record',
+                                          parent_id=self.collection_uri,
+                                          include_deleted=True)
+        return records
+
+    def test_compact_tombstones_in_read_only_display_an_error(self):
+        with mock.patch('kinto.scripts.logger') as mocked:
+            self.registry.settings = {'readonly': 'true'}
+            code = scripts.compact_tombstones({'registry': self.registry})
+            assert code == 51
+            mocked.error.assert_any_call('Cannot compact tombstones '
+                                         'while in readonly mode.')
+
+    def test_compact_tombstones_purges_expired_tombstones_by_chunks(self):
+        with mock.patch('kinto.scripts.msec_time', return_value=3600000 + self.timestamps[2] + 1):
+            code = scripts.compact_tombstones({'registry': self.registry}, batch_size=2)
+        assert code == 0
+        self.assertEqual(self.get_tombstones(), [])
+        # The horizon, two chunks and an empty one.
+        self.assertEqual(self.transaction.commit.call_count, 4)
+
+    def test_compact_tombstones_records_the_oldest_retained_timestamp(self):
+        now = 3600000 + self.timestamps[1]
+        with mock.patch('kinto.scripts.msec_time', return_value=now):
+            scripts.compact_tombstones({'registry': self.registry})
+        self.assertEqual(len(self.get_tombstones()), 2)
+        self.assertEqual(get_tombstones_horizon(self.storage, self.collection_uri),
+                         self.timestamps[1])
+
+    def test_compact_tombstones_never_moves_the_horizon_back(self):
+        set_tombstones_horizon(self.storage, self.collection_uri, self.timestamps[2])
+        now = 3600000 + self.timestamps[1]
+        with mock.patch('kinto.scripts.msec_time', return_value=now):
+            scripts.compact_tombstones({'registry': self.registry})
+        self.assertEqual(get_tombstones_horizon(self.storage, self.collection_uri),
+                         self.timestamps[2])
+
+    def test_compact_tombstones_ignores_collections_without_ttl(self):
+        self.registry.settings = {'beers_record_tombstones_ttl_seconds': ''}
+        scripts.compact_tombstones({'registry': self.registry})
+        self.assertEqual(len(self.get_tombstones()), 3)
+        self.assertIsNone(get_tombstones_horizon(self.storage, self.collection_uri))
+
+    def test_compact_tombstones_ttl_can_be_set_per_collection(self):
+        self.registry.settings = {'record_tombstones_ttl_seconds': '3600',
+                                  'beers_barley_record_tombstones_ttl_seconds': '0'}
+        with mock.patch('kinto.scripts.msec_time', return_value=self.timestamps[2]):
+            scripts.compact_tombstones({'registry': self.registry})
+        self.assertEqual(len(self.get_tombstones()), 1)
+
+    def test_compact_tombstones_lists_buckets_and_collections_without_cap(self):
+        with mock.patch.object(self.storage, 'iter_all', wraps=self.storage.iter_all) as mocked:
+            with mock.patch('kinto.scripts.msec_time', return_value=self.timestamps[2]):
+                scripts.compact_tombstones({'registry': self.registry})
+        listed = [c[1]['collection_id'] for c in mocked.call_args_list]
+        self.assertEqual(listed, ['bucket', 'collection'])
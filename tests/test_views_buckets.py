@@ -1,8 +1,10 @@
 import unittest
 
+import mock
 from pyramid.security import Authenticated
 
 from kinto.core.testing import get_user_headers
+from kinto.views import reclaim_pending_deletions
 
 from .support import (BaseWebTest,
                       MINIMALIST_BUCKET, MINIMALIST_GROUP,
@@ -261,3 +263,87 @@ class BucketDeletionTest(BaseWebTest, unittest.TestCase):
         headers = {**self.headers, 'If-None-Match': '*'}
         self.app.put_json(self.bucket_url, MINIMALIST_BUCKET,
                           headers=headers, status=201)
+
+    def test_buckets_whose_id_starts_with_the_same_prefix_are_kept(self):
+        self.app.put_json('/buckets/beersbis', MINIMALIST_BUCKET,
+                          headers=self.headers)
+        self.app.put_json('/buckets/beersbis/collections/barley', MINIMALIST_COLLECTION,
+                          headers=self.headers)
+        self.app.put_json(self.bucket_url, MINIMALIST_BUCKET,
+                          headers=self.headers)
+        self.app.delete(self.bucket_url, headers=self.headers)
+        self.app.get('/buckets/beersbis/collections/barley', headers=self.headers)
+
+
+class DeferredBucketDeletionTest(BucketDeletionTest):
+
+    @classmethod
+    def get_app_settings(cls, extras=None):
+        settings = super().get_app_settings(extras)
+        settings['deletion_batch_size'] = 1
+        settings['experimental_permissions_endpoint'] = True
+        return settings
+
+    def test_children_are_kept_until_reclaimed(self):
+        records, _ = self.storage.get_all(collection_id='record',
+                                          parent_id='/buckets/beers/*')
+        self.assertEqual(len(records), 1)
+
+    def test_children_are_deleted_once_reclaimed(self):
+        reclaimed = reclaim_pending_deletions(self.storage, self.permission,
+                                              batch_size=1)
+        self.assertEqual(reclaimed, ['/buckets/beers'])
+        for parent_id in ('/buckets/beers', '/buckets/beers/*'):
+            records, _ = self.storage.get_all(collection_id=None,
+                                              parent_id=parent_id,
+                                              include_deleted=True)
+            self.assertEqual(len(records), 0)
+        permissions = self.permission.get_accessible_objects([self.principal])
+        self.assertEqual([uri for uri in permissions if uri.startswith('/buckets/beers/')],
+                         [])
+        # Nothing left to reclaim.
+        self.assertEqual(reclaim_pending_deletions(self.storage, self.permission,
+                                                   batch_size=1), [])
+
+    def test_children_created_along_with_the_bucket_are_kept(self):
+        body = {
+            'defaults': {'method': 'PUT'},
+            'requests': [
+                {'path': self.bucket_url, 'body': MINIMALIST_BUCKET},
+                {'path': self.bucket_url + '/collections/c2', 'body': MINIMALIST_COLLECTION},
+                {'path': self.bucket_url + '/collections/c2/records/r1',
+                 'body': MINIMALIST_RECORD},
+            ]
+        }
+        resp = self.app.post_json('/batch', body, headers=self.headers)
+        self.assertEqual([r['status'] for r in resp.json['responses']], [201, 201, 201])
+        resp = self.app.get(self.bucket_url + '/collections', headers=self.headers)
+        self.assertEqual([c['id'] for c in resp.json['data']], ['c2'])
+        self.app.get(self.bucket_url + '/collections/c2/records/r1', headers=self.headers)
+        self.app.get(self.record_url, headers=self.headers, status=404)
+
+    def test_children_are_reclaimed_by_chunks_on_creation(self):
+        with mock.patch('kinto.views.reclaim_children') as mocked:
+            self.app.put_json(self.bucket_url, MINIMALIST_BUCKET,
+                              headers=self.headers)
+        mocked.assert_called_with(self.storage, self.permission, self.bucket_url,
+                                  batch_size=1, commit=None)
+
+    def test_children_permissions_are_not_listed_until_reclaimed(self):
+        resp = self.app.get('/permissions', headers=self.headers)
+        uris = [p['uri'] for p in resp.json['data']]
+        self.assertEqual([uri for uri in uris if uri.startswith('/buckets/beers')], [])
+
+    def test_pending_deletions_are_listed_without_cap(self):
+        with mock.patch.object(self.storage, 'iter_all', wraps=self.storage.iter_all) as mocked:
+            reclaimed = reclaim_pending_deletions(self.storage, self.permission,
+                                                  batch_size=1)
+        self.assertEqual(reclaimed, ['/buckets/beers'])
+        self.assertEqual(mocked.call_args[1]['collection_id'], 'pending_deletion')
+
+    def test_chunks_are_committed_separately(self):
+        commit = mock.Mock()
+        reclaim_pending_deletions(self.storage, self.permission, batch_size=1,
+                                  commit=commit)
+        # Every chunk is committed, plus the removal of the marker.
+        self.assertGreater(commit.call_count, 4)
@@ -1,6 +1,7 @@
 import unittest
 
 from kinto.core.testing import get_user_headers
+from kinto.views import reclaim_pending_deletions
 
 from .support import (BaseWebTest, MINIMALIST_BUCKET,
                       MINIMALIST_COLLECTION, MINIMALIST_RECORD)
@@ -148,6 +149,53 @@ class CollectionDeletionTest(BaseWebTest, unittest.TestCase):
         self.app.put_json(self.collection_url, MINIMALIST_COLLECTION,
                           headers=headers, status=201)
 
+    def test_collections_whose_id_starts_with_the_same_prefix_are_kept(self):
+        self.app.put_json(self.collection_url + 'bis', MINIMALIST_COLLECTION,
+                          headers=self.headers)
+        self.app.post_json(self.collection_url + 'bis/records', MINIMALIST_RECORD,
+                           headers=self.headers)
+        self.app.put_json(self.collection_url, MINIMALIST_COLLECTION,
+                          headers=self.headers)
+        self.app.delete(self.collection_url, headers=self.headers)
+        resp = self.app.get(self.collection_url + 'bis/records', headers=self.headers)
+        self.assertEqual(len(resp.json['data']), 1)
+
+
+class DeferredCollectionDeletionTest(CollectionDeletionTest):
+
+    @classmethod
+    def get_app_settings(cls, extras=None):
+        settings = super().get_app_settings(extras)
+        settings['deletion_batch_size'] = 1
+        return settings
+
+    def test_records_are_kept_until_reclaimed(self):
+        records, _ = self.storage.get_all(collection_id='record',
+                                          parent_id=self.collection_url)
+        self.assertEqual(len(records), 1)
+
+    def test_records_are_deleted_once_reclaimed(self):
+        reclaimed = reclaim_pending_deletions(self.storage, self.permission,
+                                              batch_size=1)
+        self.assertEqual(reclaimed, [self.collection_url])
+        records, _ = self.storage.get_all(collection_id='record',
+                                          parent_id=self.collection_url,
+                                          include_deleted=True)
+        self.assertEqual(len(records), 0)
+
+    def test_records_created_along_with_the_collection_are_kept(self):
+        body = {
+            'defaults': {'method': 'PUT'},
+            'requests': [
+                {'path': self.collection_url, 'body': MINIMALIST_COLLECTION},
+                {'path': self.collection_url + '/records/r1', 'body': MINIMALIST_RECORD},
+            ]
+        }
+        resp = self.app.post_json('/batch', body, headers=self.headers)
+        self.assertEqual([r['status'] for r in resp.json['responses']], [201, 201])
+        resp = self.app.get(self.collection_url + '/records', headers=self.headers)
+        self.assertEqual([r['id'] for r in resp.json['data']], ['r1'])
+
 
 class CollectionCreationTest(BaseWebTest, unittest.TestCase):
 
@@ -44,6 +44,10 @@ class EntriesTest(PermissionsViewTest):
         permissions = resp.json['data']
         self.assertEqual(len(permissions), 4)
 
+    def test_permissions_entries_are_not_expanded(self):
+        resp = self.app.get('/permissions?_expand=permissions', headers=self.headers)
+        self.assertNotIn('permissions', resp.json)
+
     def test_permissions_can_be_listed_anonymously(self):
         self.app.patch_json('/buckets/beers/collections/barley',
                             {'permissions': {'write': ['system.Everyone']}},
@@ -4,6 +4,7 @@ import re
 import unittest
 
 from kinto.core.testing import get_user_headers
+from kinto.views.records import set_tombstones_horizon
 
 from .support import (BaseWebTest, MINIMALIST_RECORD,
                       MINIMALIST_GROUP, MINIMALIST_BUCKET,
@@ -153,6 +154,26 @@ class RecordsViewTest(BaseWebTest, unittest.TestCase):
         self.assertEqual(names,
                          ['Stout 2', 'Stout 1', 'Stout 0', 'Hulled Barley'])
 
+    def test_records_permissions_can_be_expanded_in_list(self):
+        record = {**MINIMALIST_RECORD, 'permissions': {'read': ['system.Everyone']}}
+        resp = self.app.post_json(self.collection_url, record, headers=self.headers)
+        other_id = resp.json['data']['id']
+
+        resp = self.app.get(self.collection_url + '?_expand=permissions',
+                            headers=self.headers)
+        permissions = dict(zip([r['id'] for r in resp.json['data']],
+                               resp.json['permissions']))
+        self.assertEqual(permissions[other_id]['read'], ['system.Everyone'])
+        self.assertNotIn('read', permissions[self.record['id']])
+
+    def test_records_permissions_are_not_expanded_by_default(self):
+        resp = self.app.get(self.collection_url, headers=self.headers)
+        self.assertNotIn('permissions', resp.json)
+
+    def test_unknown_expand_values_are_rejected(self):
+        self.app.get(self.collection_url + '?_expand=parents',
+                     headers=self.headers, status=400)
+
     def test_wrong_create_permissions_cannot_be_added_on_records(self):
         record = {**MINIMALIST_RECORD, 'permissions': {'record:create': ['fxa:user']}}
         self.app.put_json(self.record_url,
@@ -403,3 +424,48 @@ class RecordsViewPatchTest(BaseWebTest, unittest.TestCase):
                             json,
                             headers=self.patch_headers,
                             status=400)
+
+
+class RecordsTombstonesCompactionTest(BaseWebTest, unittest.TestCase):
+
+    collection_url = '/buckets/beers/collections/barley/records'
+
+    @classmethod
+    def get_app_settings(cls, extras=None):
+        settings = super().get_app_settings(extras)
+        settings['record_tombstones_ttl_seconds'] = '3600'
+        return settings
+
+    def setUp(self):
+        super().setUp()
+        self.app.put_json('/buckets/beers', MINIMALIST_BUCKET,
+                          headers=self.headers)
+        self.app.put_json('/buckets/beers/collections/barley',
+                          MINIMALIST_COLLECTION,
+                          headers=self.headers)
+        set_tombstones_horizon(self.storage, '/buckets/beers/collections/barley', 1000)
+
+    def test_changes_since_before_the_compaction_are_gone(self):
+        resp = self.app.get(self.collection_url + '?_since=999',
+                            headers=self.headers, status=410)
+        self.assertEqual(resp.json['errno'], 123)
+        self.assertEqual(resp.json['details'], {'oldest_timestamp': 1000})
+
+    def test_changes_since_after_the_compaction_can_be_obtained(self):
+        self.app.get(self.collection_url + '?_since=1000', headers=self.headers)
+
+    def test_full_list_can_be_obtained(self):
+        self.app.get(self.collection_url, headers=self.headers)
+
+    def test_horizon_is_checked_even_if_no_ttl_is_configured_anymore(self):
+        settings = self.app.app.registry.settings
+        with mock.patch.dict(settings, {'record_tombstones_ttl_seconds': None}):
+            self.app.get(self.collection_url + '?_since=999',
+                         headers=self.headers, status=410)
+
+    def test_changes_filtered_by_timestamp_before_the_compaction_are_gone(self):
+        for param in ('gt_last_modified', 'min_last_modified'):
+            self.app.get(self.collection_url + '?{}=999'.format(param),
+                         headers=self.headers, status=410)
+            self.app.get(self.collection_url + '?{}=1000'.format(param),
+                         headers=self.headers)